@@ -3,6 +3,9 @@
 """Convert SAM templates to CloudFormation templates.
 
 Known limitations: cannot transform CodeUri pointing at local directory.
+
+Use the `serve` command to start a long-lived translation server, and --daemon-socket/--daemon-port to
+translate with it instead of loading the translator in every invocation.
 """
 
 import argparse
@@ -13,19 +16,15 @@ import subprocess
 import sys
 from functools import reduce
 from pathlib import Path
-
-import boto3
+from typing import Any
 
 # To allow this script to be executed from other directories
 sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
 
-from samtranslator.model.exceptions import InvalidDocumentException
-from samtranslator.public.translator import ManagedPolicyLoader
-from samtranslator.translator.transform import transform
+from bin import translation_daemon
 from samtranslator.yaml_helper import yaml_parse
 
 LOG = logging.getLogger(__name__)
-iam_client = boto3.client("iam")
 
 parser = argparse.ArgumentParser(description=__doc__)
 parser.add_argument("command", nargs="?")
@@ -63,6 +62,15 @@ parser.add_argument(
     help="Write transformed template to stdout instead of a file",
     action="store_true",
 )
+parser.add_argument(
+    "--daemon-socket",
+    help="Unix socket of a translation server to use (with `serve`: Unix socket to listen on)",
+)
+parser.add_argument(
+    "--daemon-port",
+    help="Local port of a translation server to use (with `serve`: port to listen on)",
+    type=int,
+)
 cli_options = parser.parse_args()
 
 if cli_options.verbose:
@@ -105,12 +113,62 @@ def package(input_file_path: Path) -> Path:
     return package_output_template_file
 
 
+def get_daemon_address() -> translation_daemon.Address | None:
+    if cli_options.daemon_socket:
+        return str(cli_options.daemon_socket)
+    if cli_options.daemon_port:
+        return ("127.0.0.1", cli_options.daemon_port)
+    return None
+
+
+def get_managed_policy_loader() -> Any:
+    # Imported lazily, so translating with a server doesn't pay for it
+    import boto3  # noqa: PLC0415
+
+    from samtranslator.public.translator import ManagedPolicyLoader  # noqa: PLC0415
+
+    return ManagedPolicyLoader(boto3.client("iam"))
+
+
+def translate(sam_template: dict[str, Any]) -> dict[str, Any]:
+    from samtranslator.model.exceptions import InvalidDocumentException  # noqa: PLC0415
+    from samtranslator.translator.transform import transform  # noqa: PLC0415
+
+    try:
+        return transform(sam_template, {}, get_managed_policy_loader())
+    except InvalidDocumentException as e:
+        raise translation_daemon.TranslationError(
+            e.message, [{"ErrorMessage": cause.message, "Metadata": cause.metadata} for cause in e.causes]
+        ) from e
+
+
+def serve() -> None:
+    address = get_daemon_address()
+    if address is None:
+        parser.error("`serve` requires --daemon-socket or --daemon-port")
+    server = translation_daemon.make_server(address, get_managed_policy_loader())
+    print("Serving translations on:", address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if isinstance(address, str):
+            Path(address).unlink(missing_ok=True)
+
+
 def transform_template(input_file_path: Path, output_file_path: Path, stdout: bool):  # type: ignore[no-untyped-def]
     with input_file_path.open() as f:
         sam_template = yaml_parse(f)  # type: ignore[no-untyped-call]
 
     try:
-        cloud_formation_template = transform(sam_template, {}, ManagedPolicyLoader(iam_client))
+        daemon_address = get_daemon_address()
+        cloud_formation_template = (
+            translation_daemon.translate(daemon_address, sam_template)
+            if daemon_address is not None
+            else translate(sam_template)
+        )
         cloud_formation_template_prettified = json.dumps(cloud_formation_template, indent=1)
 
         if stdout:
@@ -120,10 +178,10 @@ def transform_template(input_file_path: Path, output_file_path: Path, stdout: bo
         output_file_path.write_text(cloud_formation_template_prettified, encoding="utf-8")
 
         print("Wrote transformed CloudFormation template to: ", output_file_path)
-    except InvalidDocumentException as e:
-        error_message = reduce(lambda message, error: message + " " + error.message, e.causes, e.message)
+    except translation_daemon.TranslationError as e:
+        error_message = reduce(lambda message, error: message + " " + error["ErrorMessage"], e.errors, e.message)
         LOG.error(error_message)
-        errors = (cause.message for cause in e.causes)
+        errors = (error["ErrorMessage"] for error in e.errors)
         LOG.error(errors)
 
 
@@ -139,7 +197,9 @@ if __name__ == "__main__":
     input_file_path = Path(cli_options.template_file)
     output_file_path = Path(cli_options.output_template)
 
-    if cli_options.command == "package":
+    if cli_options.command == "serve":
+        serve()
+    elif cli_options.command == "package":
         package_output_template_file = package(input_file_path)
         transform_template(package_output_template_file, output_file_path, cli_options.stdout)
     elif cli_options.command == "deploy":
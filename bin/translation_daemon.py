@@ -0,0 +1,198 @@
+"""
+Long-lived local translation server for sam-translate.py, and the thin client that talks to it.
+
+The server keeps the translator imported and the managed policies loaded, and answers translate requests over a
+Unix socket or local HTTP:
+
+    POST /translate
+    {"Template": {...}, "ParameterValues": {...}, "PassthroughMetadata": false}
+
+It responds with {"Template": {...}} on success, and with status 400 and
+{"ErrorMessage": "...", "Errors": [{"ErrorMessage": "...", "Metadata": {...}}, ...]} when the template is invalid.
+
+The client side only uses the standard library, so it doesn't pay for importing the translator.
+"""
+
+import http.client
+import json
+import logging
+import socket
+import socketserver
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Union
+
+LOG = logging.getLogger(__name__)
+
+TRANSLATE_PATH = "/translate"
+
+Address = Union[str, tuple[str, int]]
+
+
+class TranslationError(Exception):
+    """Raised by the client when the server rejects a template."""
+
+    def __init__(self, message: str, errors: list[dict[str, Any]]) -> None:
+        super().__init__(message)
+        self.message = message
+        self.errors = errors
+
+
+class TranslationServerError(Exception):
+    """Raised by the client when the server fails for another reason than an invalid template."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(f"Translation server responded with status {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class _TranslationRequestHandler(BaseHTTPRequestHandler):
+    server: "_TranslationServerMixin"  # type: ignore[assignment]
+
+    def do_POST(self) -> None:
+        if self.path != TRANSLATE_PATH:
+            self._send_json(HTTPStatus.NOT_FOUND, {"ErrorMessage": f"Unknown path {self.path}."})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            if not isinstance(request, dict) or not isinstance(request.get("Template"), dict):
+                raise ValueError("Request must be a JSON object with a 'Template' object.")
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"ErrorMessage": f"Invalid request: {e}"})
+            return
+
+        status, body = self.server.translate(request)
+        self._send_json(status, body)
+
+    def _send_json(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def address_string(self) -> str:
+        # Unix socket clients have no address
+        return str(self.client_address[0]) if self.client_address else "local"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        LOG.debug("%s - %s", self.address_string(), format % args)
+
+
+class _TranslationServerMixin:
+    """Translates the requests received by the server with a warmed-up managed policy loader."""
+
+    def setup_translator(self, managed_policy_loader: Any) -> None:
+        # Imported here so that the client side of this module stays lightweight
+        from samtranslator.model.exceptions import InvalidDocumentException  # noqa: PLC0415
+        from samtranslator.translator.transform import transform  # noqa: PLC0415
+
+        self._transform = transform
+        self._invalid_document_exception = InvalidDocumentException
+        self._managed_policy_loader = managed_policy_loader
+
+    def translate(self, request: dict[str, Any]) -> tuple[HTTPStatus, dict[str, Any]]:
+        try:
+            template = self._transform(
+                request["Template"],
+                request.get("ParameterValues") or {},
+                self._managed_policy_loader,
+                passthrough_metadata=bool(request.get("PassthroughMetadata")),
+            )
+        except self._invalid_document_exception as e:
+            errors = [{"ErrorMessage": cause.message, "Metadata": cause.metadata} for cause in e.causes]
+            return HTTPStatus.BAD_REQUEST, {"ErrorMessage": e.message, "Errors": errors}
+        except Exception as e:
+            LOG.exception("Failed to translate template")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"ErrorMessage": f"{type(e).__name__}: {e}"}
+        return HTTPStatus.OK, {"Template": template}
+
+
+class TranslationHTTPServer(_TranslationServerMixin, ThreadingHTTPServer):
+    """Translation server listening on a local TCP port. Every request is handled in its own thread."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], managed_policy_loader: Any) -> None:
+        super().__init__(address, _TranslationRequestHandler)
+        self.setup_translator(managed_policy_loader)
+
+
+class TranslationUnixServer(_TranslationServerMixin, socketserver.ThreadingUnixStreamServer):
+    """Translation server listening on a Unix socket. Every request is handled in its own thread."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, managed_policy_loader: Any) -> None:
+        super().__init__(path, _TranslationRequestHandler)
+        self.setup_translator(managed_policy_loader)
+
+
+def make_server(address: Address, managed_policy_loader: Any) -> Union[TranslationHTTPServer, TranslationUnixServer]:
+    """
+    Creates a translation server.
+
+    :param address: path of the Unix socket to listen on, or (host, port) to listen on with HTTP
+    :param managed_policy_loader: loader of managed policies, shared by all requests
+    """
+    if isinstance(address, str):
+        return TranslationUnixServer(address, managed_policy_loader)
+    return TranslationHTTPServer(address, managed_policy_loader)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+def translate(
+    address: Address,
+    template: dict[str, Any],
+    parameter_values: dict[str, Any] | None = None,
+    passthrough_metadata: bool = False,
+    timeout: float = 60,
+) -> dict[str, Any]:
+    """
+    Translates a template with a running translation server.
+
+    :param address: path of the server's Unix socket, or its (host, port)
+    :param template: SAM template to translate
+    :param parameter_values: parameter values for the translation
+    :param passthrough_metadata: whether to pass resource Metadata through to the generated resources
+    :param timeout: timeout of the request, in seconds
+    :raises TranslationError: if the server rejected the template as invalid
+    :raises TranslationServerError: if the server failed otherwise, such as on an unexpected error or an invalid
+        request
+    :return: the translated CloudFormation template
+    """
+    connection = (
+        _UnixHTTPConnection(address, timeout)
+        if isinstance(address, str)
+        else http.client.HTTPConnection(address[0], address[1], timeout=timeout)
+    )
+    body = json.dumps(
+        {"Template": template, "ParameterValues": parameter_values or {}, "PassthroughMetadata": passthrough_metadata}
+    )
+    try:
+        connection.request("POST", TRANSLATE_PATH, body, {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        result = json.loads(response.read())
+    finally:
+        connection.close()
+
+    if response.status == HTTPStatus.BAD_REQUEST and "Errors" in result:
+        raise TranslationError(result.get("ErrorMessage", ""), result["Errors"])
+    if response.status != HTTPStatus.OK:
+        raise TranslationServerError(response.status, result.get("ErrorMessage", ""))
+    translated: dict[str, Any] = result["Template"]
+    return translated
@@ -1,5 +1,7 @@
 import json
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, cast
@@ -40,6 +42,8 @@ class FeatureToggle:
         self.stage = stage
         self.account_id = account_id
         self.region = region
+        # The stage, account and region don't change, so every feature is evaluated once
+        self._enabled_features = self._evaluate_features()
 
     def _get_dialup(self, region_config, feature_name):  # type: ignore[no-untyped-def]
         """
@@ -59,41 +63,51 @@ class FeatureToggle:
         LOG.warning(f"Dialup type '{dialup_type}' is None or is not supported.")
         return DisabledDialup(region_config)
 
-    def is_enabled(self, feature_name: str) -> bool:
+    def _evaluate_features(self) -> dict[str, bool]:
         """
-        To check if feature is available
+        Decides which features of the config are enabled for the stage, account and region of this toggle.
 
-        :param feature_name: name of feature
+        :return: whether each feature of the config is enabled
         """
-        if feature_name not in self.feature_config:
-            LOG.warning(f"Feature '{feature_name}' not available in Feature Toggle Config.")
-            return False
-
         stage = self.stage
         region = self.region
         account_id = self.account_id
         if not stage or not region or not account_id:
-            LOG.warning(
-                f"One or more of stage, region and account_id is not set. Feature '{feature_name}' not enabled."
-            )
-            return False
+            if self.feature_config:
+                LOG.warning("One or more of stage, region and account_id is not set. No feature is enabled.")
+            return dict.fromkeys(self.feature_config, False)
 
-        stage_config = self.feature_config.get(feature_name, {}).get(stage, {})
-        if not stage_config:
-            LOG.info(f"Stage '{stage}' not enabled for Feature '{feature_name}'.")
-            return False
+        enabled_features = {}
+        for feature_name, feature_config in self.feature_config.items():
+            stage_config = feature_config.get(stage, {}) if isinstance(feature_config, dict) else {}
+            if not stage_config:
+                enabled_features[feature_name] = False
+                continue
+
+            if account_id in stage_config:
+                account_config = stage_config[account_id]
+                region_config = (
+                    account_config[region] if region in account_config else account_config.get("default", {})
+                )
+            else:
+                region_config = stage_config[region] if region in stage_config else stage_config.get("default", {})
+
+            dialup = self._get_dialup(region_config, feature_name=feature_name)  # type: ignore[no-untyped-call]
+            enabled_features[feature_name] = bool(dialup.is_enabled())
 
-        if account_id in stage_config:
-            account_config = stage_config[account_id]
-            region_config = account_config[region] if region in account_config else account_config.get("default", {})
-        else:
-            region_config = stage_config[region] if region in stage_config else stage_config.get("default", {})
+        LOG.info("Enabled features: %s", [name for name, enabled in enabled_features.items() if enabled])
+        return enabled_features
 
-        dialup = self._get_dialup(region_config, feature_name=feature_name)  # type: ignore[no-untyped-call]
-        LOG.info(f"Using Dialip {dialup}")
-        is_enabled: bool = dialup.is_enabled()
+    def is_enabled(self, feature_name: str) -> bool:
+        """
+        To check if feature is available
 
-        LOG.info(f"Feature '{feature_name}' is enabled: '{is_enabled}'")
+        :param feature_name: name of feature
+        """
+        is_enabled = self._enabled_features.get(feature_name)
+        if is_enabled is None:
+            LOG.warning("Feature '%s' not available in Feature Toggle Config.", feature_name)
+            return False
         return is_enabled
 
 
@@ -164,3 +178,177 @@ class FeatureToggleAppConfigConfigProvider(FeatureToggleConfigProvider):
     @property
     def config(self) -> dict[str, Any]:
         return self.feature_toggle_config
+
+
+class FeatureToggleAppConfigDataConfigProvider(FeatureToggleConfigProvider):
+    """
+    Feature toggle config provider which polls config from AppConfig with the AppConfigData API, and shares it between
+    all the providers of the process that use the same configuration profile and settings.
+
+    The config is loaded once per process. Afterwards, it is polled again in the background once the poll interval has
+    elapsed, so translations don't wait for AppConfig. If the config can't be loaded from AppConfig, the config of the
+    fallback file is used when one is given, and an empty config otherwise.
+    """
+
+    DEFAULT_POLL_INTERVAL_SECONDS = 60
+
+    _sessions: dict[tuple[Any, ...], "_AppConfigDataSession"] = {}
+    _sessions_lock = threading.Lock()
+
+    def __init__(
+        self,
+        application_id: str,
+        environment_id: str,
+        configuration_profile_id: str,
+        poll_interval_seconds: int = DEFAULT_POLL_INTERVAL_SECONDS,
+        fallback_config_path: str | None = None,
+        app_config_data_client: Any = None,
+    ) -> None:
+        """
+        :param application_id: AppConfig application ID or name
+        :param environment_id: AppConfig environment ID or name
+        :param configuration_profile_id: AppConfig configuration profile ID or name
+        :param poll_interval_seconds: minimum interval between two polls of the config, at least 15 seconds
+        :param fallback_config_path: local config file used while no config could be loaded from AppConfig
+        :param app_config_data_client: AppConfigData client, created when the config is first loaded if not given
+        """
+        FeatureToggleConfigProvider.__init__(self)
+        key = (
+            application_id,
+            environment_id,
+            configuration_profile_id,
+            poll_interval_seconds,
+            fallback_config_path,
+            app_config_data_client,
+        )
+        with FeatureToggleAppConfigDataConfigProvider._sessions_lock:
+            session = FeatureToggleAppConfigDataConfigProvider._sessions.get(key)
+            if session is None:
+                session = _AppConfigDataSession(
+                    application_id,
+                    environment_id,
+                    configuration_profile_id,
+                    poll_interval_seconds,
+                    fallback_config_path,
+                    app_config_data_client,
+                )
+                FeatureToggleAppConfigDataConfigProvider._sessions[key] = session
+        self._session = session
+
+    @classmethod
+    def clear_sessions(cls) -> None:
+        """
+        Forgets the configs shared by the providers of the process, so that the next providers load the config again,
+        such as after the settings of the config changed, or between tests. Existing providers keep their config.
+        """
+        with cls._sessions_lock:
+            cls._sessions.clear()
+
+    @property
+    def config(self) -> dict[str, Any]:
+        return self._session.get_config()
+
+
+class _AppConfigDataSession:
+    """AppConfigData configuration session, with the latest config it received."""
+
+    def __init__(
+        self,
+        application_id: str,
+        environment_id: str,
+        configuration_profile_id: str,
+        poll_interval_seconds: int,
+        fallback_config_path: str | None,
+        client: Any,
+    ) -> None:
+        self.application_id = application_id
+        self.environment_id = environment_id
+        self.configuration_profile_id = configuration_profile_id
+        self.poll_interval_seconds = poll_interval_seconds
+        self.fallback_config_path = fallback_config_path
+        self.client = client
+        self.refresh_thread: threading.Thread | None = None
+        self._config: dict[str, Any] | None = None
+        self._token: str | None = None
+        self._next_poll_time = 0.0
+        # Guards the config, token and poll schedule. It is never held during calls to AppConfigData
+        self._lock = threading.Lock()
+        # Serializes the first load of the config, which every reader waits for
+        self._load_lock = threading.Lock()
+
+    def get_config(self) -> dict[str, Any]:
+        config = self._config
+        if config is None:
+            with self._load_lock:
+                if self._config is None:
+                    self._poll()
+                config = cast(dict[str, Any], self._config)
+        elif time.monotonic() >= self._next_poll_time:
+            self._refresh_in_background()
+        return config
+
+    def _refresh_in_background(self) -> None:
+        # Another reader is already starting a poll, or a poll is being applied
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() < self._next_poll_time or (self.refresh_thread and self.refresh_thread.is_alive()):
+                return
+            # No other poll is started while this one is in flight, the poll schedules the next one when it ends
+            self._next_poll_time = float("inf")
+            self.refresh_thread = threading.Thread(target=self._poll, daemon=True)
+            self.refresh_thread.start()
+        finally:
+            self._lock.release()
+
+    @cw_timer(prefix="External", name="AppConfigData")
+    def _poll(self) -> None:
+        """
+        Polls the latest config, and schedules the next poll. Only one poll runs at a time: the first load is
+        serialized by the load lock, and refreshes by the poll schedule.
+        """
+        token = self._token
+        config = None
+        try:
+            if self.client is None:
+                # Same timeouts as FeatureToggleAppConfigConfigProvider
+                client_config = Config(
+                    connect_timeout=BOTO3_CONNECT_TIMEOUT, read_timeout=5, retries={"total_max_attempts": 2}
+                )
+                self.client = boto3.client("appconfigdata", config=client_config)
+            if token is None:
+                session = self.client.start_configuration_session(
+                    ApplicationIdentifier=self.application_id,
+                    EnvironmentIdentifier=self.environment_id,
+                    ConfigurationProfileIdentifier=self.configuration_profile_id,
+                    RequiredMinimumPollIntervalInSeconds=self.poll_interval_seconds,
+                )
+                token = session["InitialConfigurationToken"]
+            response = self.client.get_latest_configuration(ConfigurationToken=token)
+            token = response["NextPollConfigurationToken"]
+            poll_interval = max(self.poll_interval_seconds, response.get("NextPollIntervalInSeconds", 0))
+            # The content is empty when the config didn't change since the previous poll
+            content = response["Configuration"].read()
+            if content:
+                config = cast(dict[str, Any], json.loads(content.decode("utf-8")))
+                LOG.info("Loaded feature toggle config from AppConfig.")
+        except Exception:
+            LOG.exception("Failed to load config from AppConfig.")
+            # Start a new session next time, the token may have expired
+            token = None
+            poll_interval = self.poll_interval_seconds
+
+        if config is None and self._config is None:
+            config = self._load_fallback_config()
+        with self._lock:
+            self._token = token
+            if config is not None:
+                self._config = config
+            self._next_poll_time = time.monotonic() + poll_interval
+
+    def _load_fallback_config(self) -> dict[str, Any]:
+        if not self.fallback_config_path:
+            LOG.warning("No feature toggle config loaded. Using empty config.")
+            return {}
+        LOG.warning("Using feature toggle config from %s.", self.fallback_config_path)
+        return FeatureToggleLocalConfigProvider(self.fallback_config_path).config
@@ -706,6 +706,7 @@ class Properties(BaseModel):
     RuntimeManagementConfig: RuntimeManagementConfig | None = prop("RuntimeManagementConfig")
     Tags: Tags | None = prop("Tags")
     PropagateTags: bool | None = prop("PropagateTags")
+    ConsolidatePermissions: bool | None = prop("ConsolidatePermissions")
     Timeout: Timeout | None = prop("Timeout")
     Tracing: Tracing | None = prop("Tracing")
     VersionDescription: PassThroughProp | None = prop("VersionDescription")
@@ -773,6 +774,7 @@ class Globals(BaseModel):
     )
     Tags: Tags | None = prop("Tags")
     PropagateTags: bool | None = prop("PropagateTags")
+    ConsolidatePermissions: bool | None = prop("ConsolidatePermissions")
     Tracing: Tracing | None = prop("Tracing")
     KmsKeyArn: KmsKeyArn | None = prop("KmsKeyArn")
     Layers: Layers | None = prop("Layers")
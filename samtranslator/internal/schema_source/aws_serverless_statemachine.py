@@ -175,6 +175,7 @@ class Properties(BaseModel):
     AutoPublishAlias: PassThroughProp | None
     DeploymentPreference: PassThroughProp | None
     UseAliasAsEventTarget: bool | None
+    MinifyDefinition: bool | None
 
 
 class Resource(ResourceAttributes):
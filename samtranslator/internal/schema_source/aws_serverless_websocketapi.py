@@ -79,6 +79,7 @@ class Properties(BaseModel):
     ApiKeySelectionExpression: PassThroughProp | None = properties("ApiKeySelectionExpression")
     AccessLogSettings: AccessLogSettings | None = properties("AccessLogSettings")
     Auth: AuthConfig | None = properties("Auth")
+    ConsolidatePermissions: bool | None = properties("ConsolidatePermissions")
     DefaultRouteSettings: RouteSettings | None = properties("DefaultRouteSettings")
     Description: str | None = properties("Description")
     DisableExecuteApiEndpoint: PassThroughProp | None = properties("DisableExecuteApiEndpoint")
@@ -98,6 +99,7 @@ class Properties(BaseModel):
 class Globals(BaseModel):
     ApiKeySelectionExpression: str | None = properties("ApiKeySelectionExpression")
     AccessLogSettings: AccessLogSettings | None = properties("AccessLogSettings")
+    ConsolidatePermissions: bool | None = properties("ConsolidatePermissions")
     DefaultRouteSettings: RouteSettings | None = properties("DefaultRouteSettings")
     DisableExecuteApiEndpoint: bool | None = properties("DisableExecuteApiEndpoint")
     DisableSchemaValidation: bool | None = properties("DisableSchemaValidation")
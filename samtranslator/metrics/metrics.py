@@ -209,6 +209,23 @@ class Metrics:
         """
         self._record_metric(name, value, Unit.Milliseconds, dimensions, timestamp)
 
+    def record_size(
+        self,
+        name: str,
+        value: int,
+        dimensions: list["MetricDimension"] | None = None,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """
+        Create metric with unit Bytes.
+
+        :param name: metric name
+        :param value: value of metric
+        :param dimensions: array of dimensions applied to the metric
+        :param timestamp: timestamp of metric (datetime.datetime object)
+        """
+        self._record_metric(name, value, Unit.Bytes, dimensions, timestamp)
+
     def publish(self) -> None:
         """Calls publish method from the configured metrics publisher to publish metrics"""
         # flatten the key->list dict into a flat list; we don't care about the key as it's
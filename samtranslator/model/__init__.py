@@ -6,7 +6,7 @@ from abc import ABC, ABCMeta, abstractmethod
 from collections.abc import Callable
 from contextlib import suppress
 from enum import Enum
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from samtranslator.compat import pydantic
 from samtranslator.model.exceptions import (
@@ -120,7 +120,82 @@ class GeneratedProperty(PropertyType):
         super().__init__(False, any_type(), False)
 
 
-class Resource(ABC):
+class _PropertyDescriptor:
+    """
+    Attribute of a resource property, stored in a slot of the resource. Setting a property marks the resource as not
+    validated, and unset properties read as None.
+    """
+
+    __slots__ = ("slot",)
+
+    def __init__(self, slot: str) -> None:
+        self.slot = slot
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        return getattr(instance, self.slot, None)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        object.__setattr__(instance, "_properties_validated", False)
+        object.__setattr__(instance, "_validated_models", None)
+        object.__setattr__(instance, self.slot, value)
+
+
+class _ResourceMeta(ABCMeta):
+    """
+    Generates the __slots__ of Resource classes from their property_types and _keywords, so that resources don't carry
+    a __dict__. Properties are stored in slots named after them with a "_property_" prefix, behind a
+    _PropertyDescriptor. Classes that set validate_setattr to False also get a __dict__ for their other attributes.
+    """
+
+    PROPERTY_SLOT_PREFIX = "_property_"
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any) -> "_ResourceMeta":
+        property_types = namespace.get("property_types", _inherited(bases, "property_types")) or {}
+        if "__slots__" not in namespace:
+            inherited_slots = {
+                slot for base in bases for cls in base.__mro__ for slot in cls.__dict__.get("__slots__", ())
+            }
+            slots = [
+                mcs.PROPERTY_SLOT_PREFIX + property_name
+                for property_name in property_types
+                if mcs.PROPERTY_SLOT_PREFIX + property_name not in inherited_slots and property_name not in namespace
+            ]
+            slots.extend(
+                keyword
+                for keyword in sorted(namespace.get("_keywords", ()))
+                if keyword not in inherited_slots and keyword not in namespace
+            )
+            if not namespace.get("validate_setattr", _inherited(bases, "validate_setattr")) and (
+                "__dict__" not in inherited_slots
+            ):
+                slots.append("__dict__")
+            namespace["__slots__"] = tuple(slots)
+
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        property_slots = []
+        for property_name in property_types:
+            attribute = getattr(cls, property_name, None)
+            if not isinstance(attribute, _PropertyDescriptor) and property_name not in namespace:
+                attribute = _PropertyDescriptor(mcs.PROPERTY_SLOT_PREFIX + property_name)
+                setattr(cls, property_name, attribute)
+            # Properties shadowed by class attributes are read as plain attributes
+            slot = attribute.slot if isinstance(attribute, _PropertyDescriptor) else property_name
+            property_slots.append((property_name, slot))
+        # Read by _generate_resource_dict() for every generated resource
+        cls._property_slots = tuple(property_slots)  # type: ignore[attr-defined]
+        return cls
+
+
+def _inherited(bases: tuple[type, ...], name: str) -> Any:
+    for base in bases:
+        if hasattr(base, name):
+            return getattr(base, name)
+    return None
+
+
+class Resource(ABC, metaclass=_ResourceMeta):
     """A Resource object represents an abstract entity that contains a Type and a Properties object. They map well to
     CloudFormation resources as well sub-types like AWS::Lambda::Function or `Events` section of
     AWS::Serverless::Function.
@@ -141,6 +216,15 @@ class Resource(ABC):
     resource_type: str = None  # type: ignore
     property_types: dict[str, PropertyType] = None  # type: ignore
     _keywords = {"logical_id", "relative_id", "depends_on", "resource_attributes"}
+    __slots__ = (
+        "_properties_validated",
+        "_validated_models",
+        "depends_on",
+        "logical_id",
+        "relative_id",
+        "resource_attributes",
+    )
+    _property_slots: tuple[tuple[str, str], ...]
 
     # For attributes in this list, they will be passed into the translated template for the same resource itself.
     _supported_resource_attributes = ["DeletionPolicy", "UpdatePolicy", "Condition", "UpdateReplacePolicy", "Metadata"]
@@ -163,6 +247,13 @@ class Resource(ABC):
     validate_setattr: bool = True
     Tags: PassThrough | None
 
+    # True when the current property values have passed validate_properties(). Setting any property marks the
+    # resource as not validated again, so to_dict() only validates resources that changed since the last validation.
+    _properties_validated: bool
+    # Models returned by validate_properties_and_return_model() for the current property values, by model class.
+    # Cleared whenever a property is set.
+    _validated_models: dict[type[pydantic.BaseModel], pydantic.BaseModel] | None
+
     def __init__(
         self,
         logical_id: Any | None,
@@ -178,13 +269,12 @@ class Resource(ABC):
         :param depends_on Value of DependsOn resource attribute
         :param attributes Dictionary of resource attributes and their values
         """
+        self._properties_validated = False
+        self._validated_models = None
         self.logical_id = self._validate_logical_id(logical_id)
         self.relative_id = relative_id
         self.depends_on = depends_on
 
-        for name, _ in self.property_types.items():
-            setattr(self, name, None)
-
         self.resource_attributes: dict[str, Any] = {}
         if attributes is not None:
             for attr, value in attributes.items():
@@ -243,6 +333,8 @@ class Resource(ABC):
             sam_plugins.act(LifeCycleEvents.before_transform_resource, logical_id, cls.resource_type, properties)
 
         for name, value in properties.items():
+            if name not in cls.property_types and cls.validate_setattr:
+                raise resource._undefined_property_exception(name)
             setattr(resource, name, value)
 
         if "DependsOn" in resource_dict:
@@ -316,7 +408,8 @@ class Resource(ABC):
         :rtype: dict
         :raises TypeError: if a required property is missing from this Resource
         """
-        self.validate_properties()
+        if not self._properties_validated:
+            self.validate_properties()
 
         resource_dict = self._generate_resource_dict()
 
@@ -337,8 +430,8 @@ class Resource(ABC):
         resource_dict.update(self.resource_attributes)
 
         properties_dict = {}
-        for name in self.property_types:
-            value = getattr(self, name)
+        for name, slot in self._property_slots:
+            value = getattr(self, slot, None)
             if value is not None:
                 properties_dict[name] = value
 
@@ -346,18 +439,12 @@ class Resource(ABC):
 
         return resource_dict
 
-    def __setattr__(self, name, value):  # type: ignore[no-untyped-def]
-        """Allows an attribute of this resource to be set only if it is a keyword or a property of the Resource with a
-        valid value.
-
-        :param str name: the name of the attribute to be set
-        :param value: the value of the attribute to be set
-        :raises InvalidResourceException: if an invalid property is provided
-        """
-        if (name in self._keywords or name in self.property_types) or not self.validate_setattr:
-            return super().__setattr__(name, value)
+    if TYPE_CHECKING:
+        # Properties are set through the descriptors generated by _ResourceMeta
+        def __setattr__(self, name: str, value: Any) -> None: ...
 
-        raise InvalidResourceException(
+    def _undefined_property_exception(self, name: str) -> InvalidResourceException:
+        return InvalidResourceException(
             self.logical_id,
             f"property {name} not defined for resource of type {self.resource_type}",
         )
@@ -370,9 +457,16 @@ class Resource(ABC):
         Args:
             cls: schema models
             collect_all_errors: If True, collect all validation errors. If False (default), only first error.
+
+        The model is cached until a property of the resource is set, so validating the same properties again (ex: in
+        validate_before_transform() and then in to_cloudformation()) doesn't parse them a second time.
         """
+        validated_models = self._validated_models
+        if validated_models is not None and cls in validated_models:
+            return validated_models[cls]  # type: ignore[return-value]
+
         try:
-            return cls.parse_obj(self._generate_resource_dict()["Properties"])
+            model = cls.parse_obj(self._generate_resource_dict()["Properties"])
         except pydantic.error_wrappers.ValidationError as e:
             if collect_all_errors:
                 # Comprehensive error collection with union type consolidation
@@ -383,6 +477,12 @@ class Resource(ABC):
                 error_properties = ".".join(str(x) for x in e.errors()[0]["loc"])
             raise InvalidResourceException(self.logical_id, f"Property '{error_properties}' is invalid.") from e
 
+        if validated_models is None:
+            validated_models = {}
+            self._validated_models = validated_models
+        validated_models[cls] = model
+        return model
+
     def _format_all_errors(self, errors: list[dict[str, Any]]) -> list[str]:
         """Format all validation errors, consolidating union type errors in single pass."""
         type_mapping = {
@@ -462,6 +562,8 @@ class Resource(ABC):
             elif not property_type.validate(value, should_raise=False):
                 raise InvalidResourcePropertyTypeException(self.logical_id, name, property_type.expected_type)
 
+        self._properties_validated = True
+
     def set_resource_attribute(self, attr: str, value: Any) -> None:
         """Sets attributes on resource. Resource attributes are top-level entries of a CloudFormation resource
         that exist outside of the Properties dictionary
@@ -549,6 +651,27 @@ class ResourceMacro(Resource, metaclass=ABCMeta):
     Resources to which this macro should expand.
     """
 
+    # Macros are created once per SAM resource and keep state between the steps of their translation
+    __slots__ = ("__dict__",)
+
+    def __setattr__(self, name, value):  # type: ignore[no-untyped-def]
+        """Allows an attribute of this resource to be set only if it is a keyword or a property of the Resource with a
+        valid value.
+
+        :param str name: the name of the attribute to be set
+        :param value: the value of the attribute to be set
+        :raises InvalidResourceException: if an invalid property is provided
+        """
+        if (
+            name in self.property_types
+            or name in self._keywords
+            or name in Resource.__slots__
+            or not self.validate_setattr
+        ):
+            return super().__setattr__(name, value)
+
+        raise self._undefined_property_exception(name)
+
     def resources_to_link(self, resources):  # type: ignore[no-untyped-def]
         """Returns a dictionary of resources which will need to be modified when this is turned into CloudFormation.
         The result of this will be passed to :func: `to_cloudformation`.
@@ -714,6 +837,13 @@ class SamResourceMacro(ResourceMacro, metaclass=ABCMeta):
                 "input.",
             )
 
+    def validate_only(self) -> None:
+        """Runs the validations that :func: `to_cloudformation` does before generating any resource, without
+        generating them. Property types are already validated when the resource is created with :func: `from_dict`.
+
+        :raises InvalidResourceException: if the resource is invalid
+        """
+
     def validate_before_transform(self, schema_class: type[RT] | None, collect_all_errors: bool = False) -> None:
         if not hasattr(self, "__validation_rules__"):
             return
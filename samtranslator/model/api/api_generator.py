@@ -250,6 +250,8 @@ class ApiGenerator:
         self.variables = variables
         self.depends_on = depends_on
         self.definition_body = definition_body
+        # Editor shared by all the additions to the definition body, see _get_definition_editor()
+        self._definition_editor: SwaggerEditor | None = None
         self.definition_uri = definition_uri
         self.merge_definitions = merge_definitions
         self.name = name
@@ -320,6 +322,8 @@ class ApiGenerator:
         if self.definition_uri:
             rest_api.BodyS3Location = self._construct_body_s3_dict()
         elif self.definition_body:
+            if self._definition_editor:
+                self.definition_body = self._definition_editor.swagger
             # # Post Process OpenApi Auth Settings
             self.definition_body = self._openapi_postprocess(self.definition_body)
             rest_api.Body = self.definition_body
@@ -363,6 +367,26 @@ class ApiGenerator:
         ):
             raise InvalidResourceException(self.logical_id, "The OpenApiVersion value must be of the format '3.0.0'.")
 
+    def _get_definition_editor(self) -> SwaggerEditor:
+        """
+        Returns the editor of the definition body. Every addition to the definition edits it in the same editor, and
+        the definition is read back once when the RestApi is constructed, instead of being copied in and out of a
+        new editor by every addition.
+        """
+        if self._definition_editor is None:
+            self._definition_editor = SwaggerEditor(self.definition_body)
+        return self._definition_editor
+
+    def _convert_definition_to_openapi3(self) -> None:
+        """
+        Reads the definition back from its editor and converts it to OpenAPI 3 if needed, for Auth and Models, which
+        are converted as soon as they are added. Existing APIs depend on it: each conversion nests the schema of the
+        CORS response headers one level deeper, and the schemas of Models replace the definitions converted before.
+        The next addition to the definition starts a new editor.
+        """
+        self.definition_body = self._openapi_postprocess(self._get_definition_editor().swagger)
+        self._definition_editor = None
+
     def _add_endpoint_extension(self) -> None:
         """Add disableExecuteApiEndpoint if it is set in SAM
         Note:
@@ -375,9 +399,8 @@ class ApiGenerator:
             raise InvalidResourceException(
                 self.logical_id, "DisableExecuteApiEndpoint works only within 'DefinitionBody' property."
             )
-        editor = SwaggerEditor(self.definition_body)
+        editor = self._get_definition_editor()
         editor.add_disable_execute_api_endpoint_extension(self.disable_execute_api_endpoint)
-        self.definition_body = editor.swagger
 
     def _construct_body_s3_dict(self) -> dict[str, Any]:
         """Constructs the RestApi's `BodyS3Location property`_, from the SAM Api's DefinitionUri property.
@@ -986,7 +1009,7 @@ class ApiGenerator:
                 "'AllowOrigin' is \"'*'\" or not set",
             )
 
-        editor = SwaggerEditor(self.definition_body)
+        editor = self._get_definition_editor()
         # Track normalized paths to avoid duplicate OPTIONS methods for paths that differ only by trailing slash
         # API Gateway treats /path and /path/ as the same resource, so we normalize before adding CORS
         normalized_paths_processed: set[str] = set()
@@ -1013,9 +1036,6 @@ class ApiGenerator:
             except InvalidTemplateException as ex:
                 raise InvalidResourceException(self.logical_id, ex.message) from ex
 
-        # Assign the Swagger back to template
-        self.definition_body = editor.swagger
-
     def _add_binary_media_types(self) -> None:
         """
         Add binary media types to Swagger
@@ -1028,12 +1048,9 @@ class ApiGenerator:
         if self.binary_media and not self.definition_body:
             return
 
-        editor = SwaggerEditor(self.definition_body)
+        editor = self._get_definition_editor()
         editor.add_binary_media_types(self.binary_media)  # type: ignore[no-untyped-call]
 
-        # Assign the Swagger back to template
-        self.definition_body = editor.swagger
-
     def _add_auth(self) -> None:
         """
         Add Auth configuration to the Swagger file, if necessary
@@ -1057,7 +1074,7 @@ class ApiGenerator:
                 "Unable to add Auth configuration because "
                 "'DefinitionBody' does not contain a valid Swagger definition.",
             )
-        swagger_editor = SwaggerEditor(self.definition_body)
+        swagger_editor = self._get_definition_editor()
         auth_properties = AuthProperties(**self.auth)
         authorizers = self._get_authorizers(auth_properties.Authorizers, auth_properties.DefaultAuthorizer)  # type: ignore[no-untyped-call]
 
@@ -1083,7 +1100,7 @@ class ApiGenerator:
             if auth_properties.ResourcePolicy.get("CustomStatements"):
                 swagger_editor.add_custom_statements(auth_properties.ResourcePolicy.get("CustomStatements"))  # type: ignore[no-untyped-call]
 
-        self.definition_body = self._openapi_postprocess(swagger_editor.swagger)
+        self._convert_definition_to_openapi3()
 
     def _construct_usage_plan(self, rest_api_stage: ApiGatewayStage | None = None) -> Any:  # noqa: PLR0912
         """Constructs and returns the ApiGateway UsagePlan, ApiGateway UsagePlanKey, ApiGateway ApiKey for Auth.
@@ -1290,7 +1307,7 @@ class ApiGenerator:
                 "'DefinitionBody' does not contain a valid Swagger definition.",
             )
 
-        swagger_editor = SwaggerEditor(self.definition_body)
+        swagger_editor = self._get_definition_editor()
 
         # The dicts below will eventually become part of swagger/openapi definition, thus requires using Py27Dict()
         gateway_responses = Py27Dict()
@@ -1312,9 +1329,6 @@ class ApiGenerator:
         if gateway_responses:
             swagger_editor.add_gateway_responses(gateway_responses)  # type: ignore[no-untyped-call]
 
-        # Assign the Swagger back to template
-        self.definition_body = swagger_editor.swagger
-
     def _add_models(self) -> None:
         """
         Add Model definitions to the Swagger file, if necessary
@@ -1339,12 +1353,10 @@ class ApiGenerator:
         if not all(isinstance(model, dict) for model in self.models.values()):
             raise InvalidResourceException(self.logical_id, "Invalid value for 'Models' property")
 
-        swagger_editor = SwaggerEditor(self.definition_body)
+        swagger_editor = self._get_definition_editor()
         swagger_editor.add_models(self.models)  # type: ignore[no-untyped-call]
 
-        # Assign the Swagger back to template
-
-        self.definition_body = self._openapi_postprocess(swagger_editor.swagger)
+        self._convert_definition_to_openapi3()
 
     def _openapi_postprocess(self, definition_body: dict[str, Any]) -> dict[str, Any]:  # noqa: PLR0912
         """
@@ -1396,42 +1408,40 @@ class ApiGenerator:
                 )
                 for path, path_item in paths.items():
                     SwaggerEditor.validate_path_item_is_dict(path_item, path)
-                    if path_item.get("options"):
-                        SwaggerEditor.validate_is_dict(
-                            path_item.get("options"),
-                            f"Value of options method for path {path} must be a "
-                            "dictionary according to Swagger spec.",
-                        )
-                        options = path_item.get("options").copy()
-                        for field, field_val in options.items():
-                            # remove unsupported produces and consumes in options for openapi3
-                            if field in ["produces", "consumes"]:
-                                del definition_body["paths"][path]["options"][field]
-                            # add schema for the headers in options section for openapi3
-                            if field in ["responses"]:
-                                try:
-                                    response_200_headers = dict_deep_get(field_val, "200.headers")
-                                except InvalidValueType as ex:
-                                    raise InvalidDocumentException(
-                                        [
-                                            InvalidTemplateException(
-                                                f"Invalid responses in options method for path {path}: {ex!s}.",
-                                            )
-                                        ]
-                                    ) from ex
-                                if not response_200_headers:
-                                    continue
-                                SwaggerEditor.validate_is_dict(
-                                    response_200_headers,
-                                    f"Value of response's headers in options method for path {path} must be a "
-                                    "dictionary according to Swagger spec.",
+                    options = path_item.get("options")
+                    if not options:
+                        continue
+                    SwaggerEditor.validate_is_dict(
+                        options,
+                        f"Value of options method for path {path} must be a dictionary according to Swagger spec.",
+                    )
+                    # remove unsupported produces and consumes in options for openapi3
+                    options.pop("produces", None)
+                    options.pop("consumes", None)
+                    # add schema for the headers in options section for openapi3
+                    if "responses" not in options:
+                        continue
+                    try:
+                        response_200_headers = dict_deep_get(options["responses"], "200.headers")
+                    except InvalidValueType as ex:
+                        raise InvalidDocumentException(
+                            [
+                                InvalidTemplateException(
+                                    f"Invalid responses in options method for path {path}: {ex!s}.",
                                 )
-                                for header, header_val in response_200_headers.items():
-                                    new_header_val_with_schema = Py27Dict()
-                                    new_header_val_with_schema["schema"] = header_val
-                                    definition_body["paths"][path]["options"][field]["200"]["headers"][
-                                        header
-                                    ] = new_header_val_with_schema
+                            ]
+                        ) from ex
+                    if not response_200_headers:
+                        continue
+                    SwaggerEditor.validate_is_dict(
+                        response_200_headers,
+                        f"Value of response's headers in options method for path {path} must be a "
+                        "dictionary according to Swagger spec.",
+                    )
+                    for header, header_val in response_200_headers.items():
+                        new_header_val_with_schema = Py27Dict()
+                        new_header_val_with_schema["schema"] = header_val
+                        response_200_headers[header] = new_header_val_with_schema
 
         return definition_body
 
@@ -14,6 +14,7 @@ from samtranslator.model.exceptions import InvalidResourceException
 from samtranslator.model.intrinsics import fnSub, is_intrinsic, ref
 from samtranslator.model.lambda_ import LambdaPermission
 from samtranslator.model.route53 import Route53RecordSetGroup
+from samtranslator.translator.logical_id_generator import LogicalIdGenerator
 from samtranslator.utils.types import Intrinsicable
 
 # Different stage name from `$default` used by http, to avoid confusion with $default route and to avoid bugs
@@ -43,6 +44,7 @@ class WebSocketApiGenerator(ApiV2Generator):
         api_key_selection_expression: Intrinsicable[str] | None = None,
         access_log_settings: dict[str, Intrinsicable[str]] | None = None,
         auth_config: dict[str, Any] | None = None,
+        consolidate_permissions: bool | None = None,
         default_route_settings: dict[str, Any] | None = None,
         description: Intrinsicable[str] | None = None,
         disable_execute_api_endpoint: Intrinsicable[bool] | None = None,
@@ -65,6 +67,7 @@ class WebSocketApiGenerator(ApiV2Generator):
         :param api_key_selection_expression: Selection expression for API keys
         :param access_log_settings: Whether to send access logs and where for Stage
         :param auth_config: Authorizer configuration
+        :param consolidate_permissions: Whether to generate one permission per function instead of one per route
         :param default_route_settings: DefaultRouteSettings on the stage
         :param description: Description of the API Gateway resource
         :param disable_execute_api_endpoint: DisableExecuteApiEndpoint property, to ensure that clients can access your API only by using a custom domain name
@@ -99,6 +102,7 @@ class WebSocketApiGenerator(ApiV2Generator):
         self.route_selection_expression = route_selection_expression
         self.api_key_selection_expression = api_key_selection_expression
         self.auth_config = auth_config
+        self.consolidate_permissions = consolidate_permissions
         self.default_tag_name = WebSocketApiTagName
         self.description = description
         self.disable_schema_validation = disable_schema_validation
@@ -287,6 +291,14 @@ class WebSocketApiGenerator(ApiV2Generator):
         apigw_integration.TimeoutInMillis = route_spec.get("IntegrationTimeout")
         return apigw_integration
 
+    def _construct_function_permission(self, route_spec: dict[str, Any]) -> LambdaPermission:
+        """Constructs the permission allowing every route of the API to invoke the function of the route. The logical
+        ID only depends on the function, so the routes of the same function get the same permission."""
+        if "FunctionArn" not in route_spec:
+            raise InvalidResourceException(self.logical_id, "Route must have associated function.")
+        perms_id = LogicalIdGenerator(self.logical_id + "Permission", route_spec["FunctionArn"]).gen()
+        return self._construct_permission("*", perms_id, route_spec)
+
     def _construct_permission(self, route_key: str, perms_id: str, route_spec: dict[str, Any]) -> LambdaPermission:
         if "FunctionArn" not in route_spec:
             raise InvalidResourceException(self.logical_id, "Route must have associated function.")
@@ -326,7 +338,11 @@ class WebSocketApiGenerator(ApiV2Generator):
         apigw_route = self._construct_route(route_key, apigw_route_id, apigw_integration_id, route_spec)
         apigw_auth = self._set_auth_type_and_return_custom_authorizer(route_key, apigw_route)
         apigw_integration = self._construct_integration(apigw_integration_id, route_spec)
-        permissions = self._construct_permission(route_key, perms_id, route_spec)
+        permissions = (
+            self._construct_function_permission(route_spec)
+            if self.consolidate_permissions
+            else self._construct_permission(route_key, perms_id, route_spec)
+        )
         return apigw_route, apigw_integration, permissions, apigw_auth
 
     # Mostly taken from http
@@ -376,12 +392,16 @@ class WebSocketApiGenerator(ApiV2Generator):
 
         auth = None
         route_logical_ids: list[str] = []
+        permission_logical_ids: set[str] = set()
         for key, value in self.routes.items():
             apigw_route, apigw_integration, permission, apigw_auth = self._construct_route_infr(key, value)
             # We keep all related route-integration-permission combos together
             generated_resources_list.append(apigw_route)
             generated_resources_list.append(apigw_integration)
-            generated_resources_list.append(permission)
+            # Consolidated permissions are shared by the routes of the same function
+            if permission.logical_id not in permission_logical_ids:
+                generated_resources_list.append(permission)
+                permission_logical_ids.add(permission.logical_id)
             route_logical_ids.append(apigw_route.logical_id)
 
             if apigw_auth:
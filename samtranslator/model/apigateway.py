@@ -1,3 +1,4 @@
+import hashlib
 import json
 import time
 from re import match
@@ -9,7 +10,7 @@ from samtranslator.model.intrinsics import fnSub, ref
 from samtranslator.model.types import PassThrough
 from samtranslator.translator import logical_id_generator
 from samtranslator.translator.arn_generator import ArnGenerator
-from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr
+from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr, iter_str_chunks
 from samtranslator.validator.value_validator import sam_expect
 
 
@@ -125,8 +126,9 @@ class ApiGatewayDeployment(Resource):
         # redeploy only when the API data changes. First 10 characters of hash is good enough
         # to prevent redeployment when API has not changed
 
-        # NOTE: `str(swagger)` is for backwards compatibility. Changing it to a JSON or something will break compat
-        hash_input = [str(swagger)]
+        # NOTE: `str(swagger)` is for backwards compatibility. Changing it to a JSON or something will break compat.
+        #       The hash is computed over the chunks of `str(swagger)` so the whole string is never built.
+        hash_input: list[str] = []
         if openapi_version:
             hash_input.append(str(openapi_version))
         if domain:
@@ -139,9 +141,15 @@ class ApiGatewayDeployment(Resource):
         if always_deploy:
             # We just care that the hash changes every time
             # Using int so tests are a little more robust; don't think the Python spec defines default precision
-            hash_input = [str(int(time.time()))]
-        data = self._X_HASH_DELIMITER.join(hash_input)
-        generator = logical_id_generator.LogicalIdGenerator(self.logical_id, data)
+            data = str(int(time.time()))
+            generator = logical_id_generator.LogicalIdGenerator(self.logical_id, data)
+        else:
+            data_hash = hashlib.sha1()  # noqa: S324
+            for chunk in iter_str_chunks(swagger):
+                data_hash.update(chunk.encode("utf-8"))
+            for item in hash_input:
+                data_hash.update((self._X_HASH_DELIMITER + item).encode("utf-8"))
+            generator = logical_id_generator.LogicalIdGenerator(self.logical_id, data_hash=data_hash.hexdigest())
         self.logical_id = generator.gen()
         digest = generator.get_hash(length=40)
         self.Description = f"RestApi deployment id: {digest}"
@@ -69,8 +69,15 @@ class PushEventSource(ResourceMacro, metaclass=ABCMeta):
     principal: str = None  # type: ignore
     relative_id: str  # overriding the Optional[str]: for event, relative id is not None
 
-    def _construct_permission(  # type: ignore[no-untyped-def]
-        self, function, source_arn=None, source_account=None, suffix="", event_source_token=None, prefix=None
+    def _construct_permission(  # type: ignore[no-untyped-def] # noqa: PLR0913
+        self,
+        function,
+        source_arn=None,
+        source_account=None,
+        suffix="",
+        event_source_token=None,
+        prefix=None,
+        logical_id=None,
     ):
         """Constructs the Lambda Permission resource allowing the source service to invoke the function this event
         source triggers.
@@ -80,7 +87,9 @@ class PushEventSource(ResourceMacro, metaclass=ABCMeta):
         """
         if prefix is None:
             prefix = self.logical_id
-        if suffix.isalnum():
+        if logical_id is not None:
+            permission_logical_id = logical_id
+        elif suffix.isalnum():
             permission_logical_id = prefix + "Permission" + suffix
         else:
             generator = logical_id_generator.LogicalIdGenerator(prefix + "Permission", suffix)
@@ -103,6 +112,15 @@ class PushEventSource(ResourceMacro, metaclass=ABCMeta):
 
         return lambda_permission
 
+    def _construct_consolidated_permission(self, function: Any, source_arn: dict[str, Any]) -> LambdaPermission:
+        """Constructs the Lambda Permission allowing the source to invoke the function, shared by all the events of
+        the function with the same source ARN. Its logical ID only depends on the function and the source ARN, so
+        SamFunction keeps one of the identical permissions the events return.
+        """
+        generator = logical_id_generator.LogicalIdGenerator(function.logical_id + "Permission", source_arn)
+        permission: LambdaPermission = self._construct_permission(function, source_arn=source_arn, logical_id=generator.gen())  # type: ignore[no-untyped-call]
+        return permission
+
 
 class Schedule(PushEventSource):
     """Scheduled executions for SAM Functions."""
@@ -794,7 +812,7 @@ class Api(PushEventSource):
                     "Must define one of: Authorizer, ApiKeyRequired or ResourcePolicy when using the OverrideApiAuth property.",
                 )
             stage = cast(str, self.Stage)
-            editor = SwaggerEditor(swagger_body)
+            editor = SwaggerEditor(swagger_body, edited_path=self.Path)
             self.add_auth_to_swagger(
                 self.Auth,
                 explicit_api,
@@ -806,7 +824,7 @@ class Api(PushEventSource):
                 editor,
                 intrinsics_resolver,
             )
-            explicit_api["DefinitionBody"] = editor.swagger
+            explicit_api["DefinitionBody"] = editor.release_document()
         return resources
 
     def _get_permissions(self, resources_to_link):  # type: ignore[no-untyped-def]
@@ -821,9 +839,23 @@ class Api(PushEventSource):
             suffix = resources_to_link["explicit_api_stage"]["suffix"]
         self.Stage = suffix
 
-        permissions.append(self._get_permission(resources_to_link, permitted_stage, suffix))  # type: ignore[no-untyped-call]
+        if resources_to_link.get("consolidate_permissions"):
+            permissions.append(self._get_consolidated_permission(resources_to_link, permitted_stage))
+        else:
+            permissions.append(self._get_permission(resources_to_link, permitted_stage, suffix))  # type: ignore[no-untyped-call]
         return permissions
 
+    def _get_consolidated_permission(self, resources_to_link: dict[str, Any], stage: str) -> LambdaPermission:
+        """Constructs the permission allowing the API to invoke the function on any path and method."""
+        partition = ArnGenerator.get_partition_name()
+        source_arn = fnSub(
+            ArnGenerator.generate_arn(
+                partition=partition, service="execute-api", resource="${__ApiId__}/${__Stage__}/*"
+            ),
+            {"__ApiId__": self.RestApiId, "__Stage__": stage},
+        )
+        return self._construct_consolidated_permission(resources_to_link["function"], source_arn)
+
     def _get_permission(self, resources_to_link, stage, suffix):  # type: ignore[no-untyped-def]
         # It turns out that APIGW doesn't like trailing slashes in paths (#665)
         # and removes as a part of their behaviour, but this isn't documented.
@@ -867,7 +899,7 @@ class Api(PushEventSource):
         partition = ArnGenerator.get_partition_name()
         uri = _build_apigw_integration_uri(function, partition, self.ResponseTransferMode)  # type: ignore[no-untyped-call]
 
-        editor = SwaggerEditor(swagger_body)
+        editor = SwaggerEditor(swagger_body, edited_path=self.Path)
 
         if editor.has_integration(self.Path, self.Method):
             # Cannot add the Lambda Integration, if it is already present
@@ -1026,7 +1058,7 @@ class Api(PushEventSource):
         if merge_definitions:
             api["DefinitionBody"] = self._get_merged_definitions(api_id, api["DefinitionBody"], editor)
         else:
-            api["DefinitionBody"] = editor.swagger
+            api["DefinitionBody"] = editor.release_document()
 
     def _get_merged_definitions(
         self,
@@ -1391,11 +1423,25 @@ class HttpApi(PushEventSource):
         # Give permission to all stages by default
         permitted_stage = "*"
 
+        if resources_to_link.get("consolidate_permissions"):
+            permissions.append(self._get_consolidated_permission(resources_to_link, permitted_stage))
+            return permissions
+
         permission = self._get_permission(resources_to_link, permitted_stage)  # type: ignore[no-untyped-call]
         if permission:
             permissions.append(permission)
         return permissions
 
+    def _get_consolidated_permission(self, resources_to_link: dict[str, Any], stage: str) -> LambdaPermission:
+        """Constructs the permission allowing the API to invoke the function on any route."""
+        source_arn = fnSub(
+            ArnGenerator.generate_arn(
+                partition="${AWS::Partition}", service="execute-api", resource="${__ApiId__}/${__Stage__}/*"
+            ),
+            {"__ApiId__": self.ApiId, "__Stage__": stage},
+        )
+        return self._construct_consolidated_permission(resources_to_link["function"], source_arn)
+
     def _get_permission(self, resources_to_link, stage):  # type: ignore[no-untyped-def]
         # It turns out that APIGW doesn't like trailing slashes in paths (#665)
         # and removes as a part of their behaviour, but this isn't documented.
@@ -1460,7 +1506,7 @@ class HttpApi(PushEventSource):
 
         uri = _build_apigw_integration_uri(function, "${AWS::Partition}")  # type: ignore[no-untyped-call]
 
-        editor = OpenApiEditor(open_api_body)
+        editor = OpenApiEditor(open_api_body, edited_path=self._path)
 
         if manage_swagger and editor.has_integration(self._path, self._method):
             # Cannot add the Lambda Integration, if it is already present
@@ -1490,7 +1536,7 @@ class HttpApi(PushEventSource):
             editor.add_payload_format_version_to_method(  # type: ignore[no-untyped-call]
                 api=api, path=self._path, method_name=self._method, payload_format_version=self.PayloadFormatVersion
             )
-        api["DefinitionBody"] = editor.openapi
+        api["DefinitionBody"] = editor.release_document()
 
     def _add_auth_to_openapi_integration(
         self, api: dict[str, Any], api_id: str, editor: OpenApiEditor, auth: dict[str, Any]
@@ -1,5 +1,6 @@
 from collections import namedtuple
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 from samtranslator.model.exceptions import InvalidTemplateException
@@ -40,9 +41,21 @@ class ResourcePolicies:
 
         # This variable is required to get policies
         self._policy_template_processor = policy_template_processor
+        self._resource_properties = resource_properties
 
-        # Build the list of policies upon construction.
-        self.policies = self._get_policies(resource_properties)
+        # Value of the policies property as given, which identifies the policies without parsing them
+        self.property_value = (
+            resource_properties[self.POLICIES_PROPERTY_NAME]
+            if self._contains_policies(resource_properties)  # type: ignore[no-untyped-call]
+            else None
+        )
+
+    @cached_property
+    def policies(self) -> list[Any]:
+        """
+        list of policies, parsed on first use. See `_get_policies`
+        """
+        return self._get_policies(self._resource_properties)
 
     def get(self):  # type: ignore[no-untyped-def]
         """
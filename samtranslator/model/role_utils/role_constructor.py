@@ -1,15 +1,41 @@
-from collections.abc import Callable
+import json
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from samtranslator.internal.managed_policies import get_bundled_managed_policy_map
 from samtranslator.internal.types import GetManagedPolicyMap
+from samtranslator.metrics.method_decorator import MetricsMethodWrapperSingleton, cw_timer
 from samtranslator.model.exceptions import InvalidResourceException
 from samtranslator.model.iam import IAMRole
 from samtranslator.model.intrinsics import is_intrinsic_if, is_intrinsic_no_value
-from samtranslator.model.resource_policies import PolicyTypes
+from samtranslator.model.resource_policies import PolicyTypes, ResourcePolicies
 from samtranslator.translator.arn_generator import ArnGenerator
 
 
+class _RoleConstructionCache:
+    def __init__(self) -> None:
+        # Managed policy ARNs and indexed policy statements, keyed by `_get_expanded_policies_cache_key`
+        self.expanded_policies: dict[tuple[str, str, int, int], tuple[list[Any], list[tuple[int, Any]]]] = {}
+        self.constructions = 0
+        self.hits = 0
+        # Roles may be constructed on the worker threads of the translation, which share the cache
+        self._lock = threading.Lock()
+
+    def count_construction(self, hit: bool) -> None:
+        with self._lock:
+            self.constructions += 1
+            if hit:
+                self.hits += 1
+
+
+_role_construction_cache: ContextVar[_RoleConstructionCache | None] = ContextVar(
+    "_role_construction_cache", default=None
+)
+
+
 def _get_managed_policy_arn(
     name: str,
     managed_policy_map: dict[str, str] | None,
@@ -89,6 +115,28 @@ def _convert_intrinsic_if_values(
     return intrinsic_if
 
 
+@contextmanager
+def role_construction_cache() -> Iterator[None]:
+    """
+    Expands the policies of roles once for each set of identical Policies and managed policy ARNs while the context is
+    active, and reuses the expansion for the other roles. When the context ends, the number of roles constructed and
+    of reused expansions are recorded as the RoleConstructions and RoleConstructionCacheHits metrics.
+
+    Can also be used as a decorator.
+    """
+    cache = _RoleConstructionCache()
+    token = _role_construction_cache.set(cache)
+    try:
+        yield
+    finally:
+        _role_construction_cache.reset(token)
+        if cache.constructions:
+            metrics = MetricsMethodWrapperSingleton.get_instance()
+            metrics.record_count("RoleConstructions", cache.constructions)
+            metrics.record_count("RoleConstructionCacheHits", cache.hits)
+
+
+@cw_timer(name="ConstructRole")
 def construct_role_for_resource(  # type: ignore[no-untyped-def] # noqa: PLR0913
     resource_logical_id,
     attributes,
@@ -128,29 +176,68 @@ def construct_role_for_resource(  # type: ignore[no-untyped-def] # noqa: PLR0913
     if not policy_documents:
         policy_documents = []
 
-    for index, policy_entry in enumerate(resource_policies.get()):
-        if policy_entry.type is PolicyTypes.POLICY_STATEMENT:
-            if is_intrinsic_if(policy_entry.data):
-                intrinsic_if = _convert_intrinsic_if_values(
-                    policy_entry.data,
+    cache = _role_construction_cache.get()
+    cache_key = None
+    expanded_policies = None
+    if cache is not None:
+        cache_key = _get_expanded_policies_cache_key(
+            resource_policies.property_value, managed_policy_arns, managed_policy_map, get_managed_policy_map
+        )
+        expanded_policies = cache.expanded_policies.get(cache_key) if cache_key is not None else None
+        cache.count_construction(hit=expanded_policies is not None)
+    if expanded_policies is not None:
+        # Roles share the managed policy ARNs and statements, which aren't modified
+        managed_policy_arns, policy_statements = expanded_policies
+    else:
+        managed_policy_arns, policy_statements = _expand_policies(
+            resource_logical_id, resource_policies, managed_policy_arns, managed_policy_map, get_managed_policy_map
+        )
+        if cache is not None and cache_key is not None:
+            cache.expanded_policies[cache_key] = (managed_policy_arns, policy_statements)
+
+    for index, statement in policy_statements:
+        policy_name = execution_role.logical_id + "Policy" + str(index)
+        if is_intrinsic_if(statement):
+            policy_documents.append(
+                _convert_intrinsic_if_values(
+                    {"Fn::If": list(statement["Fn::If"])},
                     lambda value: not is_intrinsic_no_value(value),
-                    lambda value: (
-                        {
-                            "PolicyName": execution_role.logical_id + "Policy" + str(index),  # noqa: B023
-                            "PolicyDocument": value,
-                        }
-                    ),
+                    lambda value: {"PolicyName": policy_name, "PolicyDocument": value},  # noqa: B023
                 )
+            )
+        else:
+            policy_documents.append({"PolicyName": policy_name, "PolicyDocument": statement})
 
-                policy_documents.append(intrinsic_if)
+    execution_role.ManagedPolicyArns = list(managed_policy_arns)
+    execution_role.Policies = policy_documents or None
+    execution_role.Path = role_path
+    execution_role.PermissionsBoundary = permissions_boundary
+    execution_role.Tags = tags
+
+    return execution_role
 
-            else:
-                policy_documents.append(
-                    {
-                        "PolicyName": execution_role.logical_id + "Policy" + str(index),
-                        "PolicyDocument": policy_entry.data,
-                    }
-                )
+
+def _expand_policies(
+    resource_logical_id: str,
+    resource_policies: ResourcePolicies,
+    managed_policy_arns: list[Any],
+    managed_policy_map: dict[str, str] | None,
+    get_managed_policy_map: GetManagedPolicyMap | None,
+) -> tuple[list[Any], list[tuple[int, Any]]]:
+    """
+    Sorts the policies of a resource into managed policy ARNs and policy statements.
+
+    :param resource_logical_id: The logical_id of the SAM resource that the role will be associated with
+    :param resource_policies: ResourcePolicies object encapuslating the policies property of SAM resource
+    :param managed_policy_arns: managed policy ARNs associated with the role in addition to the policies
+    :param managed_policy_map: Map of managed policy names to the ARNs
+    :returns: the managed policy ARNs of the role, and the policy statements with their index in the policies
+    """
+    managed_policy_arns = list(managed_policy_arns)
+    policy_statements = []
+    for index, policy_entry in enumerate(resource_policies.get()):  # type: ignore[no-untyped-call]
+        if policy_entry.type is PolicyTypes.POLICY_STATEMENT:
+            policy_statements.append((index, policy_entry.data))
 
         elif policy_entry.type is PolicyTypes.MANAGED_POLICY:
             # There are three options:
@@ -187,10 +274,21 @@ def construct_role_for_resource(  # type: ignore[no-untyped-def] # noqa: PLR0913
                 f"Policy at index {index} in the '{resource_policies.POLICIES_PROPERTY_NAME}' property is not valid",
             )
 
-    execution_role.ManagedPolicyArns = list(managed_policy_arns)
-    execution_role.Policies = policy_documents or None
-    execution_role.Path = role_path
-    execution_role.PermissionsBoundary = permissions_boundary
-    execution_role.Tags = tags
+    return managed_policy_arns, policy_statements
 
-    return execution_role
+
+def _get_expanded_policies_cache_key(
+    policies: Any,
+    managed_policy_arns: list[Any],
+    managed_policy_map: dict[str, str] | None,
+    get_managed_policy_map: GetManagedPolicyMap | None,
+) -> tuple[str, str, int, int] | None:
+    """
+    Returns the key of the expansion of the given policies, or None if they can't be serialized.
+    Managed policy maps are compared by identity, as they are the same for all the resources of a translation.
+    """
+    try:
+        policies_json = json.dumps([policies, managed_policy_arns], sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return policies_json, ArnGenerator.get_partition_name(), id(managed_policy_map), id(get_managed_policy_map)
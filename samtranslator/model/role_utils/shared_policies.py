@@ -0,0 +1,94 @@
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from samtranslator.model.iam import IAMManagedPolicy
+from samtranslator.model.intrinsics import ref
+from samtranslator.translator.logical_id_generator import LogicalIdGenerator
+
+# Default quota of managed policies attached to a role
+MAX_MANAGED_POLICIES_PER_ROLE = 10
+
+# Managed policy documents are limited to 6,144 characters, counted once intrinsic functions are resolved, which
+# can make them longer
+MAX_SHARED_POLICY_DOCUMENT_SIZE = 4096
+
+
+def _get_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def share_identical_inline_policies(resources: dict[str, Any], role_logical_ids: Iterable[str]) -> int:
+    """
+    Replaces the inline policies that are identical across the given roles with AWS::IAM::ManagedPolicy resources
+    attached to each of these roles, so the policy documents appear once in the template.
+
+    Policies are only shared between roles with the same Condition, and only as long as the roles stay within the
+    quota of managed policies. Policies wrapped in Fn::If are left inline.
+
+    :param resources: Resources section of the translated template, modified in place
+    :param role_logical_ids: logical IDs of the AWS::IAM::Role resources generated by SAM
+    :return: the number of bytes the template shrank by
+    """
+    roles = {
+        logical_id: resources[logical_id]
+        for logical_id in role_logical_ids
+        if isinstance(resources.get(logical_id), dict)
+        and resources[logical_id].get("Type") == "AWS::IAM::Role"
+        and isinstance(resources[logical_id].get("Properties"), dict)
+        and isinstance(resources[logical_id]["Properties"].get("Policies"), list)
+        and isinstance(resources[logical_id]["Properties"].get("ManagedPolicyArns", []), list)
+    }
+
+    # (Condition, serialized policy document) -> logical IDs of the roles and their inline policies with that document
+    candidates: dict[tuple[Any, str], list[tuple[str, dict[str, Any]]]] = {}
+    for logical_id, role in roles.items():
+        for policy in role["Properties"]["Policies"]:
+            if not isinstance(policy, dict) or "PolicyDocument" not in policy or "Fn::If" in policy:
+                continue
+            key = (role.get("Condition"), json.dumps(policy["PolicyDocument"], separators=(",", ":"), sort_keys=True))
+            if len(key[1]) <= MAX_SHARED_POLICY_DOCUMENT_SIZE:
+                candidates.setdefault(key, []).append((logical_id, policy))
+
+    size_before = _get_size(roles)
+    shared_policies: dict[str, Any] = {}
+    shared_policy_counts = dict.fromkeys(roles, 0)
+    # Largest savings first, for the roles that run out of managed policy slots
+    ordered_candidates = sorted(candidates.items(), key=lambda item: -len(item[0][1]) * (len(item[1]) - 1))
+    for (condition, _), policies in ordered_candidates:
+        role_policies = [
+            (logical_id, policy)
+            for logical_id, policy in policies
+            if len(roles[logical_id]["Properties"].get("ManagedPolicyArns", [])) < MAX_MANAGED_POLICIES_PER_ROLE
+        ]
+        if len({logical_id for logical_id, _ in role_policies}) < 2:  # noqa: PLR2004
+            continue
+
+        policy_document = role_policies[0][1]["PolicyDocument"]
+        shared_policy = IAMManagedPolicy(
+            LogicalIdGenerator("SharedPolicy", {"Condition": condition, "PolicyDocument": policy_document}).gen(),
+            attributes={"Condition": condition} if condition else None,
+        )
+        shared_policy.PolicyDocument = policy_document
+        shared_policy_dict = shared_policy.to_dict()
+        shared_policy_size = _get_size(shared_policy_dict)
+        inline_size = sum(_get_size(policy) - _get_size(ref(shared_policy.logical_id)) for _, policy in role_policies)
+        if shared_policy.logical_id in resources or inline_size <= shared_policy_size:
+            # Small policies take less space inline than attached
+            continue
+        resources.update(shared_policy_dict)
+        shared_policies.update(shared_policy_dict)
+
+        for logical_id, policy in role_policies:
+            properties = roles[logical_id]["Properties"]
+            properties["Policies"] = [item for item in properties["Policies"] if item is not policy]
+            managed_policy_arns = properties.setdefault("ManagedPolicyArns", [])
+            if ref(shared_policy.logical_id) not in managed_policy_arns:
+                managed_policy_arns.append(ref(shared_policy.logical_id))
+            shared_policy_counts[logical_id] += 1
+
+    for logical_id, count in shared_policy_counts.items():
+        if count and not roles[logical_id]["Properties"]["Policies"]:
+            del roles[logical_id]["Properties"]["Policies"]
+
+    return size_before - _get_size({**roles, **shared_policies})
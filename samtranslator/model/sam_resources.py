@@ -174,6 +174,7 @@ class SamFunction(SamResourceMacro):
         "PermissionsBoundary": PropertyType(False, IS_STR),
         "Environment": PropertyType(False, dict_of(IS_STR, IS_DICT)),
         "Events": PropertyType(False, dict_of(IS_STR, IS_DICT)),
+        "ConsolidatePermissions": PropertyType(False, IS_BOOL),
         "Tags": PropertyType(False, IS_DICT),
         "PropagateTags": PropertyType(False, IS_BOOL),
         "Tracing": PropertyType(False, one_of(IS_DICT, IS_STR)),
@@ -226,6 +227,7 @@ class SamFunction(SamResourceMacro):
     PermissionsBoundary: Intrinsicable[str] | None
     Environment: dict[str, Any] | None
     Events: dict[str, Any] | None
+    ConsolidatePermissions: bool | None
     Tags: dict[str, Any] | None
     PropagateTags: bool | None
     Tracing: Intrinsicable[str] | None
@@ -314,15 +316,7 @@ class SamFunction(SamResourceMacro):
         conditions = kwargs.get("conditions", {})
         feature_toggle = kwargs.get("feature_toggle")
 
-        # TODO: Skip pass schema_class=aws_serverless_function.Properties to skip schema validation for now.
-        # - adding this now would required update error message in error error_function_*_test.py
-        # - add this when we can verify that changing error message would not break customers
-        self.validate_before_transform(schema_class=None, collect_all_errors=False)
-
-        if self.DeadLetterQueue:
-            self._validate_dlq(self.DeadLetterQueue)
-
-        self._validate_tenancy_config_compatibility()
+        self.validate_only()
 
         lambda_function = self._construct_lambda_function(intrinsics_resolver)
         resources.append(lambda_function)
@@ -695,6 +689,17 @@ class SamFunction(SamResourceMacro):
 
         return resolved_alias_name
 
+    def validate_only(self) -> None:
+        # TODO: Skip pass schema_class=aws_serverless_function.Properties to skip schema validation for now.
+        # - adding this now would required update error message in error error_function_*_test.py
+        # - add this when we can verify that changing error message would not break customers
+        self.validate_before_transform(schema_class=None, collect_all_errors=False)
+
+        if self.DeadLetterQueue:
+            self._validate_dlq(self.DeadLetterQueue)
+
+        self._validate_tenancy_config_compatibility()
+
     def _validate_tenancy_config_compatibility(self) -> None:
         if not self.TenancyConfig:
             return
@@ -1032,6 +1037,7 @@ class SamFunction(SamResourceMacro):
         :rtype: list
         """
         resources = []
+        permission_logical_ids: set[str] = set()
         if self.Events:
             for logical_id, event_dict in sorted(self.Events.items(), key=SamFunction.order_events):
                 try:
@@ -1047,11 +1053,18 @@ class SamFunction(SamResourceMacro):
                     "role": execution_role,
                     "intrinsics_resolver": intrinsics_resolver,
                     "original_template": original_template,
+                    "consolidate_permissions": bool(self.ConsolidatePermissions),
                 }
 
                 for name, resource in event_resources[logical_id].items():
                     kwargs[name] = resource
-                resources += eventsource.to_cloudformation(**kwargs)
+                for resource in eventsource.to_cloudformation(**kwargs):
+                    if self.ConsolidatePermissions and isinstance(resource, LambdaPermission):
+                        # Events that get the same consolidated permission share it
+                        if resource.logical_id in permission_logical_ids:
+                            continue
+                        permission_logical_ids.add(resource.logical_id)
+                    resources.append(resource)
 
         return resources
 
@@ -1571,14 +1584,18 @@ class SamCapacityProvider(SamResourceMacro):
         ),
     ]
 
-    def to_cloudformation(self, **kwargs: Any) -> list[Resource]:
-        """
-        Transform the SAM CapacityProvider resource to CloudFormation
-        """
+    def validate_only(self) -> None:
         self.validate_before_transform(
             schema_class=aws_serverless_capacity_provider.Properties,
             collect_all_errors=True,
         )
+        self.validate_properties_and_return_model(aws_serverless_capacity_provider.Properties, collect_all_errors=True)
+
+    def to_cloudformation(self, **kwargs: Any) -> list[Resource]:
+        """
+        Transform the SAM CapacityProvider resource to CloudFormation
+        """
+        self.validate_only()
 
         # Use enhanced validation method with comprehensive error collection
         model = self.validate_properties_and_return_model(
@@ -1898,6 +1915,7 @@ class SamWebSocketApi(SamResourceMacro):
         "ApiKeySelectionExpression": PropertyType(False, IS_STR),
         "AccessLogSettings": PropertyType(False, IS_DICT),
         "Auth": PropertyType(False, IS_DICT),
+        "ConsolidatePermissions": PropertyType(False, IS_BOOL),
         "DefaultRouteSettings": PropertyType(False, IS_DICT),
         "Description": PropertyType(False, IS_STR),
         "DisableExecuteApiEndpoint": PropertyType(False, IS_BOOL),
@@ -1918,6 +1936,7 @@ class SamWebSocketApi(SamResourceMacro):
     ApiKeySelectionExpression: Intrinsicable[str] | None
     AccessLogSettings: dict[str, Any] | None
     Auth: dict[str, Any] | None
+    ConsolidatePermissions: bool | None
     DefaultRouteSettings: dict[str, Any] | None
     Description: Intrinsicable[str] | None
     DisableExecuteApiEndpoint: Intrinsicable[bool] | None
@@ -1963,6 +1982,7 @@ class SamWebSocketApi(SamResourceMacro):
             api_key_selection_expression=self.ApiKeySelectionExpression,
             access_log_settings=self.AccessLogSettings,
             auth_config=self.Auth,
+            consolidate_permissions=self.ConsolidatePermissions,
             default_route_settings=self.DefaultRouteSettings,
             description=self.Description,
             disable_execute_api_endpoint=self.DisableExecuteApiEndpoint,
@@ -2306,6 +2326,7 @@ class SamStateMachine(SamResourceMacro):
         "AutoPublishAlias": PassThroughProperty(False),
         "DeploymentPreference": MutatedPassThroughProperty(False),
         "UseAliasAsEventTarget": Property(False, IS_BOOL),
+        "MinifyDefinition": Property(False, IS_BOOL),
     }
 
     Definition: dict[str, Any] | None
@@ -2325,6 +2346,7 @@ class SamStateMachine(SamResourceMacro):
     AutoPublishAlias: PassThrough | None
     DeploymentPreference: PassThrough | None
     UseAliasAsEventTarget: bool | None
+    MinifyDefinition: bool | None
 
     event_resolver = ResourceTypeResolver(
         samtranslator.model.stepfunctions.events,
@@ -2364,6 +2386,7 @@ class SamStateMachine(SamResourceMacro):
             auto_publish_alias=self.AutoPublishAlias,
             deployment_preference=self.DeploymentPreference,
             use_alias_as_event_target=self.UseAliasAsEventTarget,
+            minify_definition=self.MinifyDefinition,
         )
 
         generated_resources = state_machine_generator.to_cloudformation()
@@ -2790,6 +2813,9 @@ class SamGraphQLApi(SamResourceMacro):
         self._datasource_name_map: dict[str, Intrinsicable[str]] = {}
         self._function_id_map: dict[str, Intrinsicable[str]] = {}
 
+    def validate_only(self) -> None:
+        self.validate_properties_and_return_model(aws_serverless_graphqlapi.Properties)
+
     @cw_timer
     def to_cloudformation(self, **kwargs: Any) -> list[Resource]:
         model = self.validate_properties_and_return_model(aws_serverless_graphqlapi.Properties)
@@ -55,6 +55,7 @@ class StateMachineGenerator:
         auto_publish_alias=None,
         deployment_preference=None,
         use_alias_as_event_target=None,
+        minify_definition=None,
     ):
         """
         Constructs an State Machine Generator class that generates a State Machine resource
@@ -83,6 +84,7 @@ class StateMachineGenerator:
         :param auto_publish_alias: Name of the state machine alias to automatically create and update
         :deployment_preference: Settings to enable gradual state machine deployments
         :param use_alias_as_event_target: Whether to use the state machine alias as the event target
+        :param minify_definition: Whether to emit the definition as a single minified JSON string
         """
         self.logical_id = logical_id
         self.depends_on = depends_on
@@ -113,6 +115,7 @@ class StateMachineGenerator:
         self.auto_publish_alias = auto_publish_alias
         self.deployment_preference = deployment_preference
         self.use_alias_as_event_target = use_alias_as_event_target
+        self.minify_definition = minify_definition
 
     @cw_timer(prefix="Generator", name="StateMachine")
     def to_cloudformation(self):  # type: ignore[no-untyped-def]
@@ -133,8 +136,8 @@ class StateMachineGenerator:
                 self.logical_id, "Specify either 'Definition' or 'DefinitionUri' property and not both."
             )
         if self.definition:
-            processed_definition = deepcopy(self.definition)
-            substitutions = self._replace_dynamic_values_with_substitutions(processed_definition)  # type: ignore[no-untyped-call]
+            substitutions: dict[str, Any] = {}
+            processed_definition = self._replace_dynamic_values_with_substitutions(self.definition, substitutions)
             if len(substitutions) > 0:
                 if self.state_machine.DefinitionSubstitutions:
                     self.state_machine.DefinitionSubstitutions.update(substitutions)
@@ -206,13 +209,18 @@ class StateMachineGenerator:
     def _build_definition_string(self, definition_dict):  # type: ignore[no-untyped-def]
         """
         Builds a CloudFormation definition string from a definition dictionary. The definition string constructed is
-        a Fn::Join intrinsic function to make it readable.
+        a Fn::Join intrinsic function to make it readable, or a minified JSON string when MinifyDefinition is set,
+        which keeps large definitions within CloudFormation's template size limit.
 
         :param definition_dict: State machine definition as a dictionary
 
         :returns: the state machine definition.
-        :rtype: dict
+        :rtype: dict or string
         """
+        if self.minify_definition:
+            # Dynamic values have been replaced with substitutions, so the definition is a plain string
+            return json.dumps(definition_dict, sort_keys=True, separators=(",", ":"))
+
         # Indenting and then splitting the JSON-encoded string for readability of the state machine definition in the CloudFormation translated resource.
         # Separators are passed explicitly to maintain trailing whitespace consistency across Py2 and Py3
         definition_lines = json.dumps(definition_dict, sort_keys=True, indent=4, separators=(",", ": ")).split("\n")
@@ -359,50 +367,37 @@ class StateMachineGenerator:
 
         return resources
 
-    def _replace_dynamic_values_with_substitutions(self, _input):  # type: ignore[no-untyped-def]
+    def _replace_dynamic_values_with_substitutions(self, _input: Any, substitution_map: dict[str, Any]) -> Any:
         """
-        Replaces the CloudFormation instrinsic functions and dynamic references within the input with substitutions.
+        Returns a copy of the input in which the CloudFormation instrinsic functions and dynamic references are replaced
+        with substitutions. The input is walked once, in sorted key order so that substitutions are numbered the same
+        way on every transform. Dictionaries and lists are copied, the input is not modified.
 
         :param _input: Input dictionary in which the dynamic values need to be replaced with substitutions
+        :param substitution_map: Dictionary to add the substitution to dynamic value mappings to
 
-        :returns: list of substitution to dynamic value mappings
-        :rtype: dict
-        """
-        substitution_map = {}
-        for path in self._get_paths_to_intrinsics(_input):  # type: ignore[no-untyped-call]
-            location = _input
-            for step in path[:-1]:
-                location = location[step]
-            sub_name, sub_key = self._generate_substitution()
-            substitution_map[sub_name] = location[path[-1]]
-            location[path[-1]] = sub_key
-        return substitution_map
-
-    def _get_paths_to_intrinsics(self, _input, path=None):  # type: ignore[no-untyped-def]
-        """
-        Returns all paths to dynamic values within a dictionary
-
-        :param _input: Input dictionary to find paths to dynamic values in
-        :param path: Optional list to keep track of the path to the input dictionary
-        :returns list: list of keys that defines the path to a dynamic value within the input dictionary
+        :returns: copy of the input with the dynamic values replaced
         """
-        if path is None:
-            path = []
-        dynamic_value_paths = []  # type: ignore[var-annotated]
         if isinstance(_input, dict):
-            iterator = _input.items()
+            iterator = sorted(_input.items(), key=lambda item: item[0])
+            processed: Any = {}
         elif isinstance(_input, list):
             iterator = enumerate(_input)  # type: ignore[assignment]
+            processed = [None] * len(_input)
         else:
-            return dynamic_value_paths
+            return _input
 
-        for key, value in sorted(iterator, key=lambda item: item[0]):
+        for key, value in iterator:
             if is_intrinsic(value) or is_dynamic_reference(value):
-                dynamic_value_paths.append([*path, key])
+                sub_name, sub_key = self._generate_substitution()
+                substitution_map[sub_name] = deepcopy(value)
+                processed[key] = sub_key
             elif isinstance(value, (dict, list)):
-                dynamic_value_paths.extend(self._get_paths_to_intrinsics(value, [*path, key]))  # type: ignore[no-untyped-call]
+                processed[key] = self._replace_dynamic_values_with_substitutions(value, substitution_map)
+            else:
+                processed[key] = value
 
-        return dynamic_value_paths
+        return processed
 
     def _generate_substitution(self) -> tuple[str, str]:
         """
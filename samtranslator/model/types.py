@@ -39,9 +39,17 @@ def is_type(valid_type: type[Any]) -> Validator:
             return False
         return True
 
+    # Lets composed validators (list_of, dict_of, one_of) check the type inline instead of calling this validator
+    validate.valid_type = valid_type  # type: ignore[attr-defined]
     return validate
 
 
+def _valid_type_of(validator: Union[type[Any], Validator]) -> type[Any] | None:
+    """Returns the type checked by a validator created by is_type(), None for any other validator."""
+    valid_type = getattr(validator, "valid_type", None)
+    return valid_type if isinstance(valid_type, type) else None
+
+
 IS_DICT = is_type(dict)
 IS_STR = is_type(str)
 IS_BOOL = is_type(bool)
@@ -58,11 +66,17 @@ def list_of(validate_item: Union[type[Any], Validator]) -> Validator:
     :rtype: callable
     """
 
+    item_type = _valid_type_of(validate_item)
+
     def validate(value: Any, should_raise: bool = True) -> bool:
-        validate_type = is_type(list)
-        if not validate_type(value, should_raise=should_raise):
+        if not IS_LIST(value, should_raise=should_raise):
             return False
 
+        # Fast path for lists of a plain type like list_of(IS_STR): only fall back to calling the item validator,
+        # which raises the detailed error, when an item doesn't have the expected type
+        if item_type is not None and all(isinstance(item, item_type) for item in value):
+            return True
+
         for item in value:
             try:
                 validate_item(item)
@@ -86,11 +100,21 @@ def dict_of(validate_key: Validator, validate_item: Validator) -> Validator:
     :rtype: callable
     """
 
+    key_type = _valid_type_of(validate_key)
+    item_type = _valid_type_of(validate_item)
+
     def validate(value: Any, should_raise: bool = True) -> bool:
-        validate_type = IS_DICT
-        if not validate_type(value, should_raise=should_raise):
+        if not IS_DICT(value, should_raise=should_raise):
             return False
 
+        # Fast path for dicts of plain types like dict_of(IS_STR, IS_STR), see list_of
+        if (
+            key_type is not None
+            and item_type is not None
+            and all(isinstance(key, key_type) and isinstance(item, item_type) for key, item in value.items())
+        ):
+            return True
+
         for key, item in value.items():
             try:
                 validate_key(key)
@@ -121,8 +145,15 @@ def one_of(*validators: Validator) -> Validator:
     :rtype: callable
     """
 
+    valid_types = [_valid_type_of(validator) for validator in validators]
+    # one_of(IS_STR, IS_DICT) and the like only need a single isinstance() check
+    all_valid_types = tuple(valid_types) if all(valid_type is not None for valid_type in valid_types) else None
+
     def validate(value: Any, should_raise: bool = True) -> bool:
-        if any(validate(value, should_raise=False) for validate in validators):
+        if all_valid_types is not None:
+            if isinstance(value, all_valid_types):  # type: ignore[arg-type]
+                return True
+        elif any(validate(value, should_raise=False) for validate in validators):
             return True
 
         if should_raise:
@@ -1,17 +1,61 @@
 """Base class for OpenApiEditor and SwaggerEditor."""
 
+import copy
 import re
-from collections.abc import Iterator
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, Union
 
 from samtranslator.model.apigateway import ApiGatewayAuthorizer
 from samtranslator.model.apigatewayv2 import ApiGatewayV2Authorizer
 from samtranslator.model.exceptions import InvalidDocumentException, InvalidTemplateException
 from samtranslator.model.intrinsics import is_intrinsic_no_value, make_conditional
-from samtranslator.utils.py27hash_fix import Py27Dict
+from samtranslator.utils.py27hash_fix import Py27Dict, copy_sharing_unchanged
 
 
-class BaseEditor:
+class _EditorSession:
+    def __init__(self) -> None:
+        # Documents released by editors, by id
+        self.documents: dict[int, dict[str, Any]] = {}
+        # Parts of the released documents that a copy would not change, by id
+        self.unchanged: dict[int, Any] = {}
+        # Whether SwaggerEditor merges the resource policy statements that only differ by their resources
+        self.merge_resource_policy_statements = False
+
+
+_editor_session: ContextVar[_EditorSession | None] = ContextVar("_editor_session", default=None)
+
+
+@contextmanager
+def editor_session() -> Iterator[None]:
+    """
+    While the context is active, an editor created on a document returned by `BaseEditor.release_document()` to edit
+    a single path only copies that path and the top level of the document, and shares the other paths with it. This
+    keeps adding the events of an API to its definition from copying the whole definition for each event.
+
+    Can also be used as a decorator.
+    """
+    token = _editor_session.set(_EditorSession())
+    try:
+        yield
+    finally:
+        _editor_session.reset(token)
+
+
+def enable_resource_policy_statement_merging() -> None:
+    """
+    Makes the editors of the active editor_session() merge the resource policy statements they add with the
+    statements that only differ from them by their resources, instead of adding a statement per path.
+    """
+    session = _editor_session.get()
+    if session is None:
+        raise RuntimeError("enable_resource_policy_statement_merging() requires an active editor_session()")
+    session.merge_resource_policy_statements = True
+
+
+class BaseEditor(ABC):
     # constants:
     _X_APIGW_INTEGRATION = "x-amazon-apigateway-integration"
     _CONDITIONAL_IF = "Fn::If"
@@ -24,6 +68,109 @@ class BaseEditor:
     # attributes:
     _doc: dict[str, Any]
     paths: dict[str, Any]
+    # Released document this editor's document was copied from, see _copy_document()
+    _session_document: dict[str, Any] | None = None
+
+    def _copy_document(
+        self, doc: dict[str, Any], edited_path: str | None, deepcopy: Callable[[dict[str, Any]], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Returns the copy of the document to edit. When only the given path is edited and the document was released in
+        the current editor_session(), only the top level of the document, its paths and the edited path are copied.
+        Everything else is shared with the document, and iterates like a deep copy of it.
+
+        :param dict doc: document given to the editor
+        :param string edited_path: the only path edited, if any
+        :param deepcopy: function to deep copy the document
+        :return dict: copy of the document
+        """
+        session = _editor_session.get()
+        paths = doc.get("paths")
+        if (
+            edited_path is None
+            or session is None
+            or session.documents.get(id(doc)) is not doc
+            or not isinstance(paths, dict)
+        ):
+            return deepcopy(doc)
+
+        self._session_document = doc
+        paths_copy = BaseEditor._copy_dict_items(
+            paths,
+            {
+                path: (
+                    copy.deepcopy(path_item)
+                    if path == edited_path
+                    else copy_sharing_unchanged(path_item, session.unchanged)
+                )
+                for path, path_item in dict.items(paths)
+            },
+        )
+        return BaseEditor._copy_dict_items(
+            doc,
+            {
+                key: paths_copy if value is paths else self._copy_document_value(key, value, session.unchanged)
+                for key, value in dict.items(doc)
+            },
+        )
+
+    def _copy_document_value(self, key: str, value: Any, unchanged: dict[int, Any]) -> Any:
+        """
+        Returns the copy of a top level value, other than the paths, of a document released in the current
+        editor_session(). It must iterate like a deep copy of the value.
+
+        :param string key: key of the value in the document
+        :param value: value to copy
+        :param dict unchanged: parts of the released documents that a copy would not change, see
+            copy_sharing_unchanged()
+        """
+        return copy.deepcopy(value)
+
+    @staticmethod
+    def _copy_dict_items(data: dict[str, Any], values: dict[str, Any]) -> dict[str, Any]:
+        """
+        Returns a copy of the dict with the given values, iterating like a deep copy of it.
+        """
+        if not isinstance(data, Py27Dict):
+            return values
+        result = Py27Dict.__new__(type(data))
+        result.keylist = copy.deepcopy(data.keylist)
+        for key, value in values.items():
+            dict.__setitem__(result, key, value)
+        return result
+
+    @staticmethod
+    def _merges_resource_policy_statements() -> bool:
+        """
+        Returns whether resource policy statements are merged, see enable_resource_policy_statement_merging().
+        """
+        session = _editor_session.get()
+        return session is not None and session.merge_resource_policy_statements
+
+    @abstractmethod
+    def _update_document(self) -> None:
+        """
+        Reflects the changes made through the editor attributes in the document.
+        """
+
+    def release_document(self) -> dict[str, Any]:
+        """
+        Returns the edited document, sharing the parts that a copy would not change with it. The editor must not be
+        used afterwards. Within an editor_session(), editors created on the returned document to edit a single path
+        copy only that path.
+
+        :return dict: Dictionary containing the document
+        """
+        self._update_document()
+        session = _editor_session.get()
+        if session is None:
+            return copy_sharing_unchanged(self._doc)  # type: ignore[no-any-return]
+
+        doc: dict[str, Any] = copy_sharing_unchanged(self._doc, session.unchanged)
+        if self._session_document is not None:
+            session.documents.pop(id(self._session_document), None)
+        session.documents[id(doc)] = doc
+        return doc
 
     @staticmethod
     def get_conditional_contents(item: Any) -> list[Any]:
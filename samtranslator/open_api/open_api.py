@@ -43,12 +43,14 @@ class OpenApiEditor(BaseEditor):
     # Attributes:
     _doc: dict[str, Any]
 
-    def __init__(self, doc: dict[str, Any] | None) -> None:
+    def __init__(self, doc: dict[str, Any] | None, edited_path: str | None = None) -> None:
         """
         Initialize the class with a swagger dictionary. This class creates a copy of the Swagger and performs all
         modifications on this copy.
 
         :param dict doc: OpenApi document as a dictionary
+        :param string edited_path: Path name, if the editor only edits this path. The other paths may then be shared
+            with the document given, see editor_session()
         :raises InvalidDocumentException: If the input OpenApi document does not meet the basic OpenApi requirements.
         """
         if not doc or not OpenApiEditor.is_valid(doc):
@@ -60,7 +62,7 @@ class OpenApiEditor(BaseEditor):
                 ]
             )
 
-        self._doc = _deepcopy(doc)
+        self._doc = self._copy_document(doc, edited_path, _deepcopy)
         self.paths = self._doc["paths"]
         try:
             self.security_schemes = dict_deep_get(self._doc, "components.securitySchemes") or Py27Dict()
@@ -518,7 +520,10 @@ class OpenApiEditor(BaseEditor):
 
         :return dict: Dictionary containing the OpenApi specification
         """
+        self._update_document()
+        return _deepcopy(self._doc)
 
+    def _update_document(self) -> None:
         # Make sure any changes to the paths are reflected back in output
         self._doc["paths"] = self.paths
 
@@ -536,8 +541,6 @@ class OpenApiEditor(BaseEditor):
         if self.info:
             self._doc["info"] = self.info
 
-        return _deepcopy(self._doc)
-
     @staticmethod
     def is_valid(data: Any) -> bool:
         """
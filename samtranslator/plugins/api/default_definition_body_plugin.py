@@ -25,18 +25,17 @@ class DefaultDefinitionBodyPlugin(BasePlugin):
         """
         template = SamTemplate(template_dict)
 
-        for api_type in [SamResourceType.Api.value, SamResourceType.HttpApi.value]:
-            for logicalId, api in template.iterate({api_type}):
-                if api.properties.get("DefinitionBody") or api.properties.get("DefinitionUri"):
-                    continue
+        for logicalId, api in template.iterate({SamResourceType.Api.value, SamResourceType.HttpApi.value}):
+            if api.properties.get("DefinitionBody") or api.properties.get("DefinitionUri"):
+                continue
 
-                if api_type is SamResourceType.HttpApi.value:
-                    # If "Properties" is not set in the template, set them here
-                    if not api.properties:
-                        template.set(logicalId, api)
-                    api.properties["DefinitionBody"] = OpenApiEditor.gen_skeleton()
+            if api.type == SamResourceType.HttpApi.value:
+                # If "Properties" is not set in the template, set them here
+                if not api.properties:
+                    template.set(logicalId, api)
+                api.properties["DefinitionBody"] = OpenApiEditor.gen_skeleton()
 
-                if api_type is SamResourceType.Api.value:
-                    api.properties["DefinitionBody"] = SwaggerEditor.gen_skeleton()
+            if api.type == SamResourceType.Api.value:
+                api.properties["DefinitionBody"] = SwaggerEditor.gen_skeleton()
 
-                api.properties["__MANAGE_SWAGGER"] = True
+            api.properties["__MANAGE_SWAGGER"] = True
@@ -262,7 +262,7 @@ class ImplicitApiPlugin(BasePlugin, Generic[T], metaclass=ABCMeta):
 
         path = event_properties["Path"]
         method = event_properties["Method"]
-        editor = self.EDITOR_CLASS(swagger)
+        editor = self.EDITOR_CLASS(swagger, edited_path=path)
         editor.add_path(path, method)
 
         resource.properties["DefinitionBody"] = self._get_api_definition_from_editor(editor)  # type: ignore[no-untyped-call]
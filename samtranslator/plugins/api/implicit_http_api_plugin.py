@@ -96,7 +96,7 @@ class ImplicitHttpApiPlugin(ImplicitApiPlugin[type[OpenApiEditor]]):
         """
         Helper function to return the OAS definition from the editor
         """
-        return editor.openapi
+        return editor.release_document()
 
     def _add_route_settings_to_api(
         self, event_id: str, event_properties: dict[str, Any], template: SamTemplate, condition: str | None
@@ -87,7 +87,7 @@ class ImplicitRestApiPlugin(ImplicitApiPlugin[type[SwaggerEditor]]):
         """
         Helper function to return the OAS definition from the editor
         """
-        return editor.swagger
+        return editor.release_document()
 
 
 class ImplicitApiResource(SamResource):
@@ -3,6 +3,7 @@ import json
 import logging
 import re
 from collections.abc import Callable
+from concurrent.futures import Executor, Future
 from time import sleep
 from typing import Any
 
@@ -60,6 +61,7 @@ class ServerlessAppPlugin(BasePlugin):
         validate_only: bool = False,
         parameters: dict[str, Any] | None = None,
         sar_client_creator: Callable[[], BaseClient] | None = None,
+        executor: Executor | None = None,
     ) -> None:
         """
         Initialize the plugin.
@@ -70,18 +72,22 @@ class ServerlessAppPlugin(BasePlugin):
         :param bool validate_only: Flag to only validate application access (uses get_application API instead)
         :param bool sar_client_creator: A function to return a SAR client.
                                         Only used when sar_client is None and SAR calls are made.
+        :param Executor executor: when given, the SAR calls are made on this executor, so that they overlap with the
+                                  rest of the transform. Each application waits for its call when it is transformed.
         """
         super().__init__()
         if parameters is None:
             parameters = {}
         self._applications: dict[tuple[str, str], Any] = {}
         self._in_progress_templates: list[tuple[str, str]] = []
+        self._pending_applications: dict[tuple[str, str], Future[None]] = {}
         self.__sar_client = sar_client
         self._sar_client_creator = sar_client_creator
         self._wait_for_template_active_status = wait_for_template_active_status
         self._validate_only = validate_only
         self._parameters = parameters
         self._total_wait_time = 0
+        self._executor = executor
 
         # make sure the flag combination makes sense
         if self._validate_only is True and self._wait_for_template_active_status is True:
@@ -142,7 +148,7 @@ class ServerlessAppPlugin(BasePlugin):
                 self._applications[key] = False
                 continue
 
-            if key not in self._applications:
+            if key not in self._applications and key not in self._pending_applications:
                 try:
                     # Examine the type of ApplicationId and SemanticVersion
                     # before calling SAR API.
@@ -160,11 +166,39 @@ class ServerlessAppPlugin(BasePlugin):
                             "Serverless Application Repostiory does not support dynamic reference in 'ApplicationId' property.",
                         )
 
+                    if self._executor:
+                        # Create the client on this thread, clients are then safe to share between threads
+                        _ = self._sar_client
+                        self._pending_applications[key] = self._executor.submit(
+                            self._request_application, service_call, app_id, semver, key, logical_id
+                        )
+                        continue
                     self._make_service_call_with_retry(service_call, app_id, semver, key, logical_id)  # type: ignore[no-untyped-call]
                 except InvalidResourceException as e:
                     # Catch all InvalidResourceExceptions, raise those in the before_resource_transform target.
                     self._applications[key] = e
 
+    def _request_application(
+        self, service_call: Callable[..., None], app_id: str, semver: str, key: tuple[str, str], logical_id: str
+    ) -> None:
+        """
+        Makes the SAR call of an application on the executor, keeping its InvalidResourceException like
+        on_before_transform_template does.
+        """
+        try:
+            self._make_service_call_with_retry(service_call, app_id, semver, key, logical_id)  # type: ignore[no-untyped-call]
+        except InvalidResourceException as e:
+            self._applications[key] = e
+
+    def _wait_for_application(self, key: tuple[str, str]) -> None:
+        """
+        Waits for the SAR call of the application with the given key, if it is made on the executor. Errors other than
+        InvalidResourceException are raised.
+        """
+        future = self._pending_applications.get(key)
+        if future is not None:
+            future.result()
+
     def _make_service_call_with_retry(self, service_call, app_id, semver, key, logical_id):  # type: ignore[no-untyped-def]
         call_succeeded = False
         while self._total_wait_time < self.TEMPLATE_WAIT_TIMEOUT_SECONDS:
@@ -322,6 +356,7 @@ class ServerlessAppPlugin(BasePlugin):
             )
 
         key = self._make_app_key(app_id, semver)
+        self._wait_for_application(key)
 
         # Throw any resource exceptions saved from the before_transform_template event
         if isinstance(self._applications[key], InvalidResourceException):
@@ -353,6 +388,8 @@ class ServerlessAppPlugin(BasePlugin):
 
         :param dict template: Dictionary of the SAM template
         """
+        for key in self._pending_applications:
+            self._wait_for_application(key)
         if not self._wait_for_template_active_status or self._validate_only:
             return
 
@@ -1,4 +1,3 @@
-import copy
 from typing import Any, Union
 
 from samtranslator.model.exceptions import ExceptionWithMessage, InvalidResourceAttributeTypeException
@@ -62,6 +61,7 @@ class Globals:
             "FunctionScalingConfig",
             "PublishToLatestPublished",
             "VersionDeletionPolicy",
+            "ConsolidatePermissions",
         ],
         # Everything except
         #   DefinitionBody: because its hard to reason about merge of Swagger dictionaries
@@ -118,6 +118,7 @@ class Globals:
         SamResourceType.WebSocketApi.value: [
             "AccessLogSettings",
             "ApiKeySelectionExpression",
+            "ConsolidatePermissions",
             "DefaultRouteSettings",
             "DisableExecuteApiEndpoint",
             "DisableSchemaValidation",
@@ -153,6 +154,8 @@ class Globals:
         self.supported_resource_section_names.sort()
 
         self.template_globals: dict[str, GlobalProperties] = {}
+        # Filtered variants of template_globals, keyed by resource type and the set of ignored properties
+        self._filtered_template_globals: dict[tuple[str, frozenset[str]], GlobalProperties] = {}
 
         if self._KEYWORD in template:
             self.template_globals = self._parse(template[self._KEYWORD])  # type: ignore[no-untyped-call]
@@ -176,17 +179,26 @@ class Globals:
             return GlobalProperties({})
 
         if isinstance(ignore_globals, list):
-            global_props: GlobalProperties = copy.deepcopy(self.template_globals[resource_type])
+            global_props = self.template_globals[resource_type]
+            seen: set[str] = set()
             for key in ignore_globals:
-                if key not in global_props.global_properties:
+                if key not in global_props.global_properties or key in seen:
                     raise InvalidResourceAttributeTypeException(
                         logical_id,
                         "IgnoreGlobals",
                         None,
                         f"Resource {logical_id} has invalid resource attribute 'IgnoreGlobals' on item '{key}'.",
                     )
-                del global_props.global_properties[key]
-            return global_props
+                seen.add(key)
+
+            # Resources sharing the same IgnoreGlobals set share the same filtered globals, instead of
+            # paying for a deep copy of the type's globals for every resource.
+            cache_key = (resource_type, frozenset(seen))
+            filtered = self._filtered_template_globals.get(cache_key)
+            if filtered is None:
+                filtered = global_props.without(seen)
+                self._filtered_template_globals[cache_key] = filtered
+            return filtered
 
         # We raise exception for any non "*" or non-list input
         raise InvalidResourceAttributeTypeException(
@@ -196,6 +208,15 @@ class Globals:
             f"Resource {logical_id} has invalid resource attribute 'IgnoreGlobals'.",
         )
 
+    def has_globals(self, resource_type: str) -> bool:
+        """
+        Checks if the Globals section has properties to merge into resources of the given type
+
+        :param string resource_type: Type of the resource (Ex: AWS::Serverless::Function)
+        :return: True, if there are global properties for this resource type
+        """
+        return resource_type in self.template_globals
+
     def merge(
         self,
         resource_type: str,
@@ -438,13 +459,39 @@ class GlobalProperties:
     def __init__(self, global_properties) -> None:  # type: ignore[no-untyped-def]
         self.global_properties = global_properties
 
+        # Merge plan: token of every top level global property, computed once instead of once per merged resource
+        self._plan: dict[str, str] | None = None
+        if self._token_of(global_properties) == self.TOKEN.DICT:
+            self._plan = {key: self._token_of(value) for key, value in global_properties.items()}
+
     def merge(self, local_properties):  # type: ignore[no-untyped-def]
         """
         Merge Global & local level properties according to the above rules
 
         :return local_properties: Dictionary of local properties
         """
-        return self._do_merge(self.global_properties, local_properties)  # type: ignore[no-untyped-call]
+        if self._plan is None or self._token_of(local_properties) != self.TOKEN.DICT:
+            return self._do_merge(self.global_properties, local_properties)  # type: ignore[no-untyped-call]
+
+        merged = self.global_properties.copy()
+        for key, local_value in local_properties.items():
+            global_token = self._plan.get(key)
+            if global_token is None or global_token == self.TOKEN.PRIMITIVE:
+                # Key is only in local, or global value is a primitive that local always overrides
+                merged[key] = local_value
+            else:
+                merged[key] = self._do_merge(merged[key], local_value)  # type: ignore[no-untyped-call]
+        return merged
+
+    def without(self, keys: set[str]) -> "GlobalProperties":
+        """
+        Returns a new GlobalProperties object that doesn't contain the given properties. Values are shared
+        with this object, not copied.
+
+        :param keys: Names of the properties to leave out
+        :return: Filtered global properties
+        """
+        return GlobalProperties({key: value for key, value in self.global_properties.items() if key not in keys})
 
     def _do_merge(self, global_value, local_value):  # type: ignore[no-untyped-def]
         """
@@ -31,6 +31,9 @@ class GlobalsPlugin(BasePlugin):
         # For each resource in template, try and merge with Globals if necessary
         template = SamTemplate(template_dict)
         for logicalId, resource in template.iterate():
+            if not global_section.has_globals(str(resource.type)):
+                # Nothing to merge, keep the resource dictionary as it is
+                continue
             try:
                 resource.properties = global_section.merge(
                     str(resource.type), resource.properties, logicalId, resource.ignore_globals
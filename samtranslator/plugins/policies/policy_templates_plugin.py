@@ -1,3 +1,7 @@
+import copy
+import json
+from typing import Any
+
 from samtranslator.metrics.method_decorator import cw_timer
 from samtranslator.model.exceptions import InvalidResourceException
 from samtranslator.model.intrinsics import is_intrinsic_if, is_intrinsic_no_value
@@ -28,6 +32,9 @@ class PolicyTemplatesForResourcePlugin(BasePlugin):
         super().__init__()
 
         self._policy_template_processor = policy_template_processor
+        # Statements converted from each policy template and parameter values. Resources often share the same
+        # policies, so identical templates are only converted once
+        self._converted_policies: dict[str, Any] = {}
 
     @cw_timer(prefix="Plugin-PolicyTemplates")
     def on_before_transform_resource(self, logical_id, resource_type, resource_properties):  # type: ignore[no-untyped-def]
@@ -91,9 +98,16 @@ class PolicyTemplatesForResourcePlugin(BasePlugin):
         # {"templateName": { parameter_values_dict }}
         template_name = next(iter(template_data.keys()))
         template_parameters = next(iter(template_data.values()))
+        try:
+            cache_key: str | None = json.dumps(template_data, sort_keys=True)
+        except (TypeError, ValueError):
+            cache_key = None
+        if cache_key in self._converted_policies:
+            # Converted statements end up in the template, which is modified further
+            return copy.deepcopy(self._converted_policies[cache_key])
         try:
             # 'convert' will return a list of policy statements
-            return self._policy_template_processor.convert(template_name, template_parameters)
+            converted = self._policy_template_processor.convert(template_name, template_parameters)
 
         except InsufficientParameterValues as ex:
             # Exception's message will give lot of specific details
@@ -103,6 +117,10 @@ class PolicyTemplatesForResourcePlugin(BasePlugin):
                 logical_id, f"Must specify valid parameter values for policy template '{template_name}'"
             ) from ex
 
+        if cache_key is not None:
+            self._converted_policies[cache_key] = copy.deepcopy(converted)
+        return converted
+
     def _is_supported(self, resource_type):  # type: ignore[no-untyped-def]
         """
         Is this resource supported by this plugin?
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Callable, Iterator
 from typing import Any, Union
 
 from samtranslator.model.exceptions import InvalidDocumentException, InvalidResourceException, InvalidTemplateException
@@ -54,6 +55,8 @@ class SamPlugins:
         :param BasePlugin or list initial_plugins: Single plugin or a list of plugins to initialize with
         """
         self._plugins: list[BasePlugin] = []
+        # Hook methods of the registered plugins, by event name, in registration order. Built on first use
+        self._hooks: dict[str, list[tuple[BasePlugin, Callable[..., Any]]]] = {}
 
         if initial_plugins is None:
             initial_plugins = []
@@ -81,6 +84,7 @@ class SamPlugins:
             raise ValueError(f"Plugin with name {plugin.name} is already registered")
 
         self._plugins.append(plugin)
+        self._hooks.clear()
 
     def is_registered(self, plugin_name: str) -> bool:
         """
@@ -120,14 +124,9 @@ class SamPlugins:
         if not isinstance(event, LifeCycleEvents):
             raise ValueError("'event' must be an instance of LifeCycleEvents class")
 
-        method_name = "on_" + event.name
-
-        for plugin in self._plugins:
-            if not hasattr(plugin, method_name):
-                raise NameError(f"'{method_name}' method is not found in the plugin with name '{plugin.name}'")
-
+        for plugin, hook in self._get_hooks(event):
             try:
-                getattr(plugin, method_name)(*args, **kwargs)
+                hook(*args, **kwargs)
             except (InvalidResourceException, InvalidDocumentException, InvalidTemplateException) as ex:
                 # Don't need to log these because they don't result in crashes
                 raise ex
@@ -135,6 +134,40 @@ class SamPlugins:
                 LOG.exception("Plugin '%s' raised an exception: %s", plugin.name, ex)
                 raise ex
 
+    def _get_hooks(self, event: LifeCycleEvents) -> list[tuple[BasePlugin, Callable[..., Any]]]:
+        """
+        Returns the hook methods to invoke for the given event, in the order the plugins were registered.
+        Plugins that keep the NoOp implementation from BasePlugin are left out.
+
+        :param samtranslator.plugins.LifeCycleEvents event: Event to get the hooks for
+        :raises NameError: If a plugin does not have the hook method defined
+        :return: list of (plugin, hook method) tuples
+        """
+        hooks = self._hooks.get(event.name)
+        if hooks is not None:
+            return hooks
+
+        method_name = "on_" + event.name
+        noop_hook = getattr(BasePlugin, method_name, None)
+        hooks = []
+        for plugin in self._plugins:
+            if not hasattr(plugin, method_name):
+                raise NameError(f"'{method_name}' method is not found in the plugin with name '{plugin.name}'")
+
+            hook = getattr(plugin, method_name)
+            if noop_hook is not None and getattr(hook, "__func__", None) is noop_hook:
+                continue
+            hooks.append((plugin, hook))
+
+        self._hooks[event.name] = hooks
+        return hooks
+
+    def __iter__(self) -> Iterator[BasePlugin]:
+        """
+        Iterates over the registered plugins, in the order they were registered
+        """
+        return iter(self._plugins)
+
     def __len__(self) -> int:
         """
         Returns the number of plugins registered with this class
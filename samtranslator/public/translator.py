@@ -2,7 +2,17 @@
 # This is essentially our Public API
 #
 
-__all__ = ["ManagedPolicyLoader", "Translator"]
+__all__ = [
+    "FileTranslationCache",
+    "InMemoryTranslationCache",
+    "ManagedPolicyLoader",
+    "NestedStackSplitter",
+    "SplitTemplate",
+    "TranslationCache",
+    "Translator",
+]
 
 from samtranslator.translator.managed_policy_translator import ManagedPolicyLoader
+from samtranslator.translator.nested_stacks import NestedStackSplitter, SplitTemplate
+from samtranslator.translator.translation_cache import FileTranslationCache, InMemoryTranslationCache, TranslationCache
 from samtranslator.translator.translator import Translator
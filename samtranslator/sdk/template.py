@@ -29,15 +29,15 @@ class SamTemplate:
         :param set resource_types: Optional types to filter the resources by
         :yields (string, SamResource): tuple containing LogicalId and the resource
         """
-        if resource_types is None:
-            resource_types = set()
         for logicalId, resource_dict in self.resources.items():
-            resource = SamResource(resource_dict)
-            needs_filter = resource.valid()
+            # Skip resources of other types before wrapping them
             if resource_types:
-                needs_filter = needs_filter and resource.type in resource_types
+                resource_type = resource_dict.get("Type")
+                if not isinstance(resource_type, str) or resource_type not in resource_types:
+                    continue
 
-            if needs_filter:
+            resource = SamResource(resource_dict)
+            if resource.valid():
                 yield logicalId, resource
 
     def set(self, logical_id: str, resource: Union[SamResource, dict[str, Any]]) -> None:
@@ -1,4 +1,5 @@
 import copy
+import json
 import re
 from collections.abc import Callable
 from typing import Any, TypeVar
@@ -10,7 +11,7 @@ from samtranslator.model.intrinsics import fnSub, make_conditional, ref
 from samtranslator.model.types import PassThrough
 from samtranslator.open_api.base_editor import BaseEditor
 from samtranslator.translator.arn_generator import ArnGenerator
-from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr
+from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr, copy_sharing_unchanged
 from samtranslator.utils.utils import InvalidValueType, dict_deep_set
 
 T = TypeVar("T")
@@ -53,12 +54,14 @@ class SwaggerEditor(BaseEditor):
     # Attributes:
     _doc: dict[str, Any]
 
-    def __init__(self, doc: dict[str, Any] | None) -> None:
+    def __init__(self, doc: dict[str, Any] | None, edited_path: str | None = None) -> None:
         """
         Initialize the class with a swagger dictionary. This class creates a copy of the Swagger and performs all
         modifications on this copy.
 
         :param dict doc: Swagger document as a dictionary
+        :param string edited_path: Path name, if the editor only edits this path. The other paths may then be shared
+            with the document given, see editor_session()
         :raises InvalidDocumentException: If the input Swagger document does not meet the basic Swagger requirements.
         """
 
@@ -71,7 +74,7 @@ class SwaggerEditor(BaseEditor):
                 ]
             )
 
-        self._doc = _deepcopy(doc)
+        self._doc = self._copy_document(doc, edited_path, _deepcopy)
         self.paths = self._doc["paths"]
         self.security_definitions = self._doc.get(self._SECURITY_DEFINITIONS) or Py27Dict()
         self.gateway_responses = self._doc.get(self._X_APIGW_GATEWAY_RESPONSES) or Py27Dict()
@@ -83,10 +86,28 @@ class SwaggerEditor(BaseEditor):
         # each path item object must be a dict (even it is empty).
         # We can do an early path validation on path item objects,
         # so we don't need to validate wherever we use them.
+        # Documents released by an editor have been validated already.
+        if self._session_document is not None:
+            return
         for path in self.iter_on_path():
             for path_item in self.get_conditional_contents(self.paths.get(path)):
                 SwaggerEditor.validate_path_item_is_dict(path_item, path)
 
+    def _copy_document_value(self, key: str, value: Any, unchanged: dict[int, Any]) -> Any:
+        statements = value.get("Statement") if key == self._X_APIGW_POLICY and isinstance(value, dict) else None
+        if not isinstance(statements, list):
+            return super()._copy_document_value(key, value, unchanged)
+
+        # Statements are added to the resource policy, but never changed, so they are shared with the document
+        statements_copy = list(copy_sharing_unchanged(statements, unchanged))
+        return BaseEditor._copy_dict_items(
+            value,
+            {
+                policy_key: statements_copy if policy_value is statements else copy.deepcopy(policy_value)
+                for policy_key, policy_value in dict.items(value)
+            },
+        )
+
     def add_disable_execute_api_endpoint_extension(self, disable_execute_api_endpoint: PassThrough) -> None:
         """Add endpoint configuration to _X_APIGW_ENDPOINT_CONFIG in open api definition as extension
         Following this guide:
@@ -998,6 +1019,10 @@ class SwaggerEditor(BaseEditor):
         policy_statement["Resource"] = resource_list
         policy_statement["Principal"] = Py27Dict({"AWS": policy_list})
 
+        if self._merges_resource_policy_statements():
+            self._merge_resource_policy_statements([policy_statement])
+            return
+
         if self.resource_policy.get("Statement") is None:
             self.resource_policy["Statement"] = policy_statement
         else:
@@ -1062,6 +1087,10 @@ class SwaggerEditor(BaseEditor):
         deny_statement["Principal"] = "*"
         deny_statement["Condition"] = {conditional: {"aws:SourceIp": ip_list}}
 
+        if self._merges_resource_policy_statements():
+            self._merge_resource_policy_statements([allow_statement, deny_statement])
+            return
+
         if self.resource_policy.get("Statement") is None:
             self.resource_policy["Statement"] = [allow_statement, deny_statement]
         else:
@@ -1130,6 +1159,10 @@ class SwaggerEditor(BaseEditor):
         deny_statement["Principal"] = "*"
         deny_statement["Condition"] = {conditional: condition}
 
+        if self._merges_resource_policy_statements():
+            self._merge_resource_policy_statements([allow_statement, deny_statement])
+            return
+
         if self.resource_policy.get("Statement") is None:
             self.resource_policy["Statement"] = [allow_statement, deny_statement]
         else:
@@ -1142,6 +1175,56 @@ class SwaggerEditor(BaseEditor):
                 statement.extend([deny_statement])
             self.resource_policy["Statement"] = statement
 
+    def _merge_resource_policy_statements(self, statements: list[dict[str, Any]]) -> None:
+        """
+        Adds the statements to the resource policy. The resources of a statement are added to the statement of the
+        policy that only differs from it by its resources instead, if there is one, so the policy holds one statement
+        for all the paths it applies to.
+
+        :param list statements: statements to add, with a list of resources
+        """
+        policy_statements = self.resource_policy.get("Statement")
+        if policy_statements is None:
+            policy_statements = []
+        elif isinstance(policy_statements, list):
+            policy_statements = list(policy_statements)
+        else:
+            policy_statements = [policy_statements]
+
+        # Positions of the statements in the policy, by everything but their resources
+        positions: dict[str, int] = {}
+        for index, policy_statement in enumerate(policy_statements):
+            if isinstance(policy_statement, dict) and isinstance(policy_statement.get("Resource"), list):
+                positions.setdefault(SwaggerEditor._get_statement_key(policy_statement), index)
+
+        for statement in statements:
+            key = SwaggerEditor._get_statement_key(statement)
+            position = positions.get(key)
+            if position is None:
+                positions[key] = len(policy_statements)
+                policy_statements.append(statement)
+                continue
+
+            # Statements may be shared with other documents, so merged statements are copies
+            merged_statement = policy_statements[position]
+            resources = [resource for resource in statement["Resource"] if resource not in merged_statement["Resource"]]
+            if resources:
+                policy_statements[position] = Py27Dict()
+                for statement_key, value in merged_statement.items():
+                    policy_statements[position][statement_key] = (
+                        [*value, *resources] if statement_key == "Resource" else value
+                    )
+
+        self.resource_policy["Statement"] = policy_statements
+
+    @staticmethod
+    def _get_statement_key(statement: dict[str, Any]) -> str:
+        return json.dumps(
+            {key: value for key, value in statement.items() if key != "Resource"},
+            separators=(",", ":"),
+            sort_keys=True,
+        )
+
     def _add_custom_statement(self, custom_statements):  # type: ignore[no-untyped-def]
         if custom_statements is None:
             return
@@ -1208,7 +1291,10 @@ class SwaggerEditor(BaseEditor):
 
         :return dict: Dictionary containing the Swagger document
         """
+        self._update_document()
+        return _deepcopy(self._doc)
 
+    def _update_document(self) -> None:
         # Make sure any changes to the paths are reflected back in output
         # iterate keys to make sure if "paths" is of Py27UniStr type, it won't be overriden as str
         for key in self._doc:
@@ -1222,8 +1308,6 @@ class SwaggerEditor(BaseEditor):
         if self.definitions:
             self._doc["definitions"] = self.definitions
 
-        return _deepcopy(self._doc)
-
     @staticmethod
     def is_valid(data: Any) -> bool:
         """
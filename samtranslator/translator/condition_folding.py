@@ -0,0 +1,280 @@
+from typing import Any
+
+from samtranslator.model.intrinsics import is_intrinsic_no_value
+
+# Stands for a value removed from the template, when the branch of Fn::If that is taken is AWS::NoValue
+_REMOVED = object()
+
+
+class _ConditionEvaluator:
+    """
+    Evaluates conditions from the parameter values, to True or False, or to None when their value can only be known
+    at deployment.
+    """
+
+    def __init__(self, conditions: dict[str, Any], parameter_values: dict[str, Any]) -> None:
+        self._conditions = conditions
+        self._parameter_values = parameter_values
+        self._values: dict[str, bool | None] = {}
+
+    def evaluate_condition(self, name: str) -> bool | None:
+        if name not in self._values:
+            # Conditions that refer to themselves stay unknown
+            self._values[name] = None
+            self._values[name] = self._evaluate(self._conditions[name])
+        return self._values[name]
+
+    def _evaluate(self, function: Any) -> bool | None:  # noqa: PLR0911
+        if not isinstance(function, dict) or len(function) != 1:
+            return None
+        [(name, arguments)] = function.items()
+
+        if name == "Condition":
+            if isinstance(arguments, str) and arguments in self._conditions:
+                return self.evaluate_condition(arguments)
+            return None
+        if not isinstance(arguments, list):
+            return None
+        if name == "Fn::Equals" and len(arguments) == 2:  # noqa: PLR2004
+            compared = [self._resolve(argument) for argument in arguments]
+            return None if None in compared else compared[0] == compared[1]
+        if name == "Fn::Not" and len(arguments) == 1:
+            value = self._evaluate(arguments[0])
+            return None if value is None else not value
+        if name in ("Fn::And", "Fn::Or"):
+            values = [self._evaluate(argument) for argument in arguments]
+            # Fn::And is False as soon as one condition is False, Fn::Or is True as soon as one condition is True
+            decisive: bool = name == "Fn::Or"
+            if decisive in values:
+                return decisive
+            return None if None in values else not decisive
+        return None
+
+    def _resolve(self, value: Any) -> str | None:
+        """
+        Returns the string the value is compared as, if it is known.
+        """
+        if isinstance(value, dict) and list(value) == ["Ref"]:
+            if not isinstance(value["Ref"], str) or value["Ref"] not in self._parameter_values:
+                return None
+            value = self._parameter_values[value["Ref"]]
+        if isinstance(value, bool):
+            # Like in CloudFormation, which compares the values as strings
+            return "true" if value else "false"
+        if isinstance(value, str):
+            return value
+        if isinstance(value, int):
+            return str(value)
+        return None
+
+
+def fold_known_conditions(template: dict[str, Any], parameter_values: dict[str, Any]) -> int:
+    """
+    Evaluates the conditions of the SAM template whose value is known from the given parameter values, and removes
+    what they exclude from the template, before it is translated:
+
+    - resources, embedded connectors and outputs whose condition is False are removed, along with the DependsOn on
+      these resources, and the condition of the ones whose condition is True is removed
+    - Fn::If functions whose condition is known are replaced with the branch taken
+    - conditions that are no longer used are removed
+
+    Only the parameters of the template and pseudo parameters given a value are known. Parameters left to their
+    default value, SSM parameter types, dynamic references, and conditions using other intrinsic functions, are
+    evaluated at deployment as usual. Templates
+    whose resources would all be removed are left as they are.
+
+    :param dict template: SAM template, modified in place
+    :param dict parameter_values: values of parameters given by the caller
+    :return: the number of conditions whose value is known
+    """
+    conditions = template.get("Conditions")
+    if not isinstance(conditions, dict) or not conditions:
+        return 0
+
+    parameters = template.get("Parameters")
+    known_parameter_values = {
+        name: value
+        for name, value in parameter_values.items()
+        if isinstance(name, str)
+        and (name.startswith("AWS::") or (isinstance(parameters, dict) and _is_known_parameter(parameters.get(name))))
+        and not _is_dynamic_reference(value)
+    }
+    evaluator = _ConditionEvaluator(conditions, known_parameter_values)
+    known_conditions: dict[str, bool] = {}
+    for name in conditions:
+        value = evaluator.evaluate_condition(name)
+        if value is not None:
+            known_conditions[name] = value
+
+    resources = template.get("Resources")
+    if (
+        not known_conditions
+        or not isinstance(resources, dict)
+        or all(_is_excluded(resource, known_conditions) for resource in resources.values())
+    ):
+        # A template without resources is invalid
+        return 0
+
+    removed_resources = _fold_entries(resources, known_conditions)
+    for resource in resources.values():
+        # Embedded connectors have conditions like the resources they are translated to
+        connectors = resource.get("Connectors") if isinstance(resource, dict) else None
+        if isinstance(connectors, dict) and _fold_entries(connectors, known_conditions) and not connectors:
+            del resource["Connectors"]
+    if _fold_entries(template.get("Outputs"), known_conditions) and not template["Outputs"]:
+        del template["Outputs"]
+    if isinstance(template.get("Globals"), dict):
+        _fold_if(template["Globals"], known_conditions)
+    if removed_resources:
+        _remove_depends_on(resources, removed_resources)
+
+    used_conditions = _get_used_conditions(template, known_conditions)
+    for name in known_conditions:
+        if name not in used_conditions:
+            del conditions[name]
+    if len(conditions) == 0:
+        del template["Conditions"]
+
+    return len(known_conditions)
+
+
+def _is_known_parameter(parameter: Any) -> bool:
+    """
+    Checks whether the value of the parameter is the value given for it. The values given for SSM parameter types
+    are the names of SSM parameters, whose value is only resolved at deployment.
+    """
+    if not isinstance(parameter, dict):
+        return False
+    parameter_type = parameter.get("Type")
+    return not (isinstance(parameter_type, str) and parameter_type.startswith("AWS::SSM::Parameter::"))
+
+
+def _is_dynamic_reference(value: Any) -> bool:
+    # Dynamic references such as {{resolve:ssm:name}} are resolved at deployment
+    return isinstance(value, str) and "{{resolve:" in value
+
+
+def _is_excluded(entry: Any, known_conditions: dict[str, bool]) -> bool:
+    condition = entry.get("Condition") if isinstance(entry, dict) else None
+    return isinstance(condition, str) and known_conditions.get(condition) is False
+
+
+def _fold_entries(entries: Any, known_conditions: dict[str, bool]) -> set[str]:
+    """
+    Removes the resources or outputs whose condition is False, and folds the others.
+
+    :return: the logical IDs of the removed entries
+    """
+    removed: set[str] = set()
+    if not isinstance(entries, dict):
+        return removed
+    for logical_id in list(entries):
+        entry = entries[logical_id]
+        if not isinstance(entry, dict):
+            continue
+        if _is_excluded(entry, known_conditions):
+            del entries[logical_id]
+            removed.add(logical_id)
+            continue
+        if isinstance(entry.get("Condition"), str) and entry["Condition"] in known_conditions:
+            del entry["Condition"]
+        _fold_if(entry, known_conditions)
+    return removed
+
+
+def _fold_if(value: Any, known_conditions: dict[str, bool]) -> Any:
+    """
+    Replaces the Fn::If functions whose condition is known with the branch taken, in place.
+
+    :return: the folded value, or _REMOVED if the value is an Fn::If function that takes an AWS::NoValue branch
+    """
+    if isinstance(value, dict):
+        if_arguments = value.get("Fn::If") if len(value) == 1 else None
+        if (
+            isinstance(if_arguments, list)
+            and len(if_arguments) == 3  # noqa: PLR2004
+            and isinstance(if_arguments[0], str)
+            and if_arguments[0] in known_conditions
+        ):
+            branch = if_arguments[1] if known_conditions[if_arguments[0]] else if_arguments[2]
+            return _REMOVED if is_intrinsic_no_value(branch) else _fold_if(branch, known_conditions)
+
+        for key in list(value):
+            folded = _fold_if(value[key], known_conditions)
+            if folded is _REMOVED:
+                del value[key]
+            elif folded is not value[key]:
+                value[key] = folded
+    elif isinstance(value, list):
+        folded_items = [_fold_if(item, known_conditions) for item in value]
+        value[:] = [item for item in folded_items if item is not _REMOVED]
+    return value
+
+
+def _remove_depends_on(resources: dict[str, Any], removed_resources: set[str]) -> None:
+    for resource in resources.values():
+        if not isinstance(resource, dict):
+            continue
+        depends_on = resource.get("DependsOn")
+        if isinstance(depends_on, str) and depends_on in removed_resources:
+            del resource["DependsOn"]
+        elif isinstance(depends_on, list):
+            kept = [logical_id for logical_id in depends_on if logical_id not in removed_resources]
+            if not kept:
+                del resource["DependsOn"]
+            elif len(kept) < len(depends_on):
+                resource["DependsOn"] = kept
+
+
+def _get_used_conditions(template: dict[str, Any], known_conditions: dict[str, bool]) -> set[str]:
+    """
+    Returns the names of the conditions used by resources, embedded connectors, outputs, Fn::If functions, and the
+    conditions used by these conditions or by the conditions whose value isn't known, which are kept.
+    """
+    used: set[str] = set()
+
+    def collect_entries(entries: Any) -> None:
+        if not isinstance(entries, dict):
+            return
+        for entry in entries.values():
+            if isinstance(entry, dict) and isinstance(entry.get("Condition"), str):
+                used.add(entry["Condition"])
+
+    def collect_if(value: Any) -> None:
+        if isinstance(value, dict):
+            if_arguments = value.get("Fn::If")
+            if isinstance(if_arguments, list) and if_arguments and isinstance(if_arguments[0], str):
+                used.add(if_arguments[0])
+            for item in value.values():
+                collect_if(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect_if(item)
+
+    for section in ("Resources", "Outputs"):
+        entries = template.get(section)
+        collect_entries(entries)
+        collect_if(entries)
+    for resource in template["Resources"].values():
+        if isinstance(resource, dict):
+            collect_entries(resource.get("Connectors"))
+    collect_if(template.get("Globals"))
+
+    conditions = template["Conditions"]
+
+    def collect_condition(value: Any) -> None:
+        if isinstance(value, dict):
+            name = value.get("Condition")
+            if isinstance(name, str) and name in conditions and name not in used:
+                used.add(name)
+                collect_condition(conditions[name])
+            for item in value.values():
+                collect_condition(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect_condition(item)
+
+    for name in list(conditions):
+        if name in used or name not in known_conditions:
+            collect_condition(conditions[name])
+    return used
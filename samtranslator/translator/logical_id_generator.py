@@ -1,7 +1,34 @@
 import hashlib
 import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
+# Encoder producing the same output as `json.dumps(data, separators=(",", ":"), sort_keys=True)`, created once
+# instead of on every call to json.dumps
+_CANONICAL_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
+
+# Canonical JSON strings of the objects stringified in the current translation, keyed by object identity. The object is
+# stored along with its string to keep it alive, so that its id cannot be reused by another object while cached.
+_canonical_json_cache: ContextVar[dict[int, tuple[Any, str]] | None] = ContextVar("canonical_json_cache", default=None)
+
+
+@contextmanager
+def canonical_json_cache() -> Iterator[None]:
+    """
+    Caches the canonical JSON of dictionaries and lists stringified by LogicalIdGenerator while the context is
+    active, keyed by object identity. Objects must not be modified once they have been used to generate a logical ID
+    within this context, which holds for a single translation where hashed data is only read.
+
+    Can also be used as a decorator.
+    """
+    token = _canonical_json_cache.set({})
+    try:
+        yield
+    finally:
+        _canonical_json_cache.reset(token)
+
 
 class LogicalIdGenerator:
     # NOTE: Changing the length of the hash will change backwards compatibility. This will break the stability contract
@@ -81,5 +108,38 @@ class LogicalIdGenerator:
         if isinstance(data, str):
             return data
 
-        # Get the most compact dictionary (separators) and sort the keys recursively to get a stable output
-        return json.dumps(data, separators=(",", ":"), sort_keys=True)
+        cache = _canonical_json_cache.get()
+        if cache is None:
+            # Get the most compact dictionary (separators) and sort the keys recursively to get a stable output
+            return _CANONICAL_JSON_ENCODER.encode(data)
+
+        if isinstance(data, dict) and all(isinstance(key, str) for key in data):
+            # Data objects are usually built for a single logical ID, but their values are often shared with other
+            # resources (ex: properties merged from Globals). Only the values are looked up in the cache.
+            items = sorted(data.items(), key=lambda item: item[0])
+            return (
+                "{"
+                + ",".join(
+                    _CANONICAL_JSON_ENCODER.encode(key) + ":" + self._cached_stringify(value, cache)
+                    for key, value in items
+                )
+                + "}"
+            )
+
+        return self._cached_stringify(data, cache)
+
+    @staticmethod
+    def _cached_stringify(data: Any, cache: dict[int, tuple[Any, str]]) -> str:
+        """
+        Canonical JSON string of the data, looked up by identity in the given cache for dictionaries and lists.
+        """
+        if not isinstance(data, (dict, list)):
+            return _CANONICAL_JSON_ENCODER.encode(data)
+
+        cached = cache.get(id(data))
+        if cached is not None:
+            return cached[1]
+
+        data_str: str = _CANONICAL_JSON_ENCODER.encode(data)
+        cache[id(data)] = (data, data_str)
+        return data_str
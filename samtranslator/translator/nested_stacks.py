@@ -0,0 +1,723 @@
+"""
+Opt-in splitting of translated templates into nested stacks, for templates that exceed the CloudFormation limits on
+the number of resources or the size of a template.
+"""
+
+import json
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+MAX_RESOURCES = 500
+MAX_TEMPLATE_SIZE = 1024 * 1024
+MAX_PARAMETERS = 200
+MAX_OUTPUTS = 200
+
+NESTED_STACK_PREFIX = "NestedStack"
+
+# The parameters and outputs of a nested template are only known once all the resources are assigned, so resources
+# only fill this share of the size budget
+_RESOURCES_SIZE_SHARE = 0.9
+
+# Same references as the ones resolved by SubAction
+_SUB_REFERENCE_PATTERN = re.compile(r"\$\{([A-Za-z0-9\.]+|AWS::[A-Z][A-Za-z]*)\}")
+
+# Pseudo parameters whose value differs in a nested stack, passed down from the parent stack instead
+_FORWARDED_PSEUDO_PARAMETERS = {"AWS::StackName": "ParentStackName", "AWS::StackId": "ParentStackId"}
+
+
+@dataclass
+class SplitTemplate:
+    """
+    A template split into nested stacks.
+
+    :ivar template: the parent template, which deploys the nested stacks
+    :ivar nested_templates: the nested templates, by logical ID of the AWS::CloudFormation::Stack resource of the
+        parent template that deploys them
+    """
+
+    template: dict[str, Any]
+    nested_templates: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+def _default_template_url(stack_logical_id: str) -> str:
+    # Local paths are uploaded by `aws cloudformation package` and `sam package`
+    return f"{stack_logical_id}.json"
+
+
+class NestedStackSplitter:
+    """
+    Moves the resources of translated templates that don't fit the resource count or template size budgets into
+    nested stacks, each of which fits the budgets, as well as the budgets on the number of parameters and outputs
+    that references between nested stacks add to them.
+
+    Resources are assigned to nested stacks in dependency order, so nested stacks only reference the ones before
+    them. Resources generated from the same SAM resource are kept together in the same nested stack when they fit.
+    References to resources of other nested stacks are passed through outputs of the referenced stack and parameters
+    of the referencing one, and so are the template parameters, conditions and pseudo parameters that are specific
+    to a stack.
+
+    Resources referenced with Fn::GetAtt on an attribute name computed by an intrinsic function are kept in the
+    nested stack of the resources that reference them, even beyond the budgets, since the referenced attribute isn't
+    known until deployment.
+
+    Splitting doesn't support attributes that return lists referenced across nested stacks, since outputs and
+    parameters of nested stacks are strings.
+    """
+
+    def __init__(
+        self,
+        max_resources: int = MAX_RESOURCES,
+        max_template_size: int = MAX_TEMPLATE_SIZE,
+        template_url: Callable[[str], Any] | None = None,
+        max_parameters: int = MAX_PARAMETERS,
+        max_outputs: int = MAX_OUTPUTS,
+    ) -> None:
+        """
+        :param max_resources: maximum number of resources of a template
+        :param max_template_size: maximum size of a template, in bytes of compact JSON. The size of nested templates
+            is estimated while assigning resources to them
+        :param template_url: returns the TemplateURL of the nested stack with the given logical ID. Defaults to the
+            local path "<logical ID>.json", relative to the parent template
+        :param max_parameters: maximum number of parameters of a nested template
+        :param max_outputs: maximum number of outputs of a nested template
+        """
+        if min(max_resources, max_template_size, max_parameters, max_outputs) < 1:
+            raise ValueError(
+                "The resource count, template size, parameter count and output count budgets must be positive."
+            )
+        self.max_resources = max_resources
+        self.max_template_size = max_template_size
+        self.template_url = template_url or _default_template_url
+        self.max_parameters = max_parameters
+        self.max_outputs = max_outputs
+
+    def split(self, template: dict[str, Any], resource_groups: Iterable[Iterable[str]] | None = None) -> SplitTemplate:
+        """
+        Splits the template into nested stacks if it exceeds the budgets.
+
+        :param template: translated CloudFormation template. It isn't modified
+        :param resource_groups: logical IDs of resources to keep in the same nested stack when they fit, such as
+            Translator.generated_resource_ids.values()
+        :return: the template if it fits the budgets, or the parent template and the nested templates
+        :raises ValueError: if resources that must be in the same nested stack need more parameters or outputs than
+            the budgets
+        """
+        resources: dict[str, Any] = template.get("Resources") or {}
+        if len(resources) <= self.max_resources and _get_size(template) <= self.max_template_size:
+            return SplitTemplate(template)
+
+        dependencies = {
+            logical_id: _get_resource_dependencies(resource, resources) for logical_id, resource in resources.items()
+        }
+        for logical_id, resource in resources.items():
+            # The cycle keeps the referenced resources in the same block as the resource
+            for dependency in _get_computed_attribute_dependencies(resource, resources):
+                dependencies[dependency].add(logical_id)
+        usage = _ResourceUsage(template, resources)
+        blocks = self._get_blocks(resources, dependencies, usage, resource_groups or [])
+        return _NestedStacksBuilder(template, self._pack(blocks, usage), self.template_url).build()
+
+    def _fits(self, stack: "_StackUsage") -> bool:
+        return (
+            len(stack.logical_ids) <= self.max_resources
+            and stack.size <= self.max_template_size * _RESOURCES_SIZE_SHARE
+            and self._fits_references(stack)
+        )
+
+    def _fits_references(self, stack: "_StackUsage") -> bool:
+        return stack.parameter_count <= self.max_parameters and len(stack.exports) <= self.max_outputs
+
+    def _get_blocks(
+        self,
+        resources: dict[str, Any],
+        dependencies: dict[str, set[str]],
+        usage: "_ResourceUsage",
+        resource_groups: Iterable[Iterable[str]],
+    ) -> list[list[str]]:
+        """
+        Returns the blocks of resources to assign to nested stacks, in dependency order. Blocks are groups of
+        resources, merged together when they depend on each other, or single resources when they don't fit.
+        """
+        unit_indexes: dict[str, int] = {}
+        units: list[list[str]] = []
+        for group in [*resource_groups, *([logical_id] for logical_id in resources)]:
+            unit = [logical_id for logical_id in group if logical_id in resources and logical_id not in unit_indexes]
+            if unit:
+                unit_indexes.update(dict.fromkeys(unit, len(units)))
+                units.append(unit)
+
+        unit_dependencies = [
+            {unit_indexes[dependency] for logical_id in unit for dependency in dependencies[logical_id]} - {index}
+            for index, unit in enumerate(units)
+        ]
+        blocks = []
+        for component in _get_strongly_connected_components(unit_dependencies):
+            block = [logical_id for index in component for logical_id in units[index]]
+            if self._fits(usage.add(_StackUsage(), block)):
+                blocks.append(block)
+                continue
+            # Valid templates don't have dependency cycles between resources, so they can go one by one
+            block_indexes = {logical_id: index for index, logical_id in enumerate(block)}
+            resource_dependencies = [
+                {block_indexes[dependency] for dependency in dependencies[logical_id] if dependency in block_indexes}
+                for logical_id in block
+            ]
+            for resource_component in _get_strongly_connected_components(resource_dependencies):
+                blocks.append([block[index] for index in resource_component])
+        return blocks
+
+    def _pack(self, blocks: list[list[str]], usage: "_ResourceUsage") -> list[list[str]]:
+        """
+        Assigns the blocks to nested stacks in order, starting a new nested stack when a block doesn't fit in the
+        current one, so that resources only depend on resources of the same or previous nested stacks.
+        """
+        stacks = [_StackUsage()]
+        for block in blocks:
+            stack = usage.add(stacks[-1], block)
+            if stacks[-1].logical_ids and not self._fits(stack):
+                stack = usage.add(_StackUsage(), block)
+                stacks.append(stack)
+            else:
+                stacks[-1] = stack
+            if not self._fits_references(stack):
+                raise ValueError(
+                    f"Resources {', '.join(block)} must be in the same nested stack, which would need "
+                    f"{stack.parameter_count} parameters and {len(stack.exports)} outputs, more than the budgets of "
+                    f"{self.max_parameters} parameters and {self.max_outputs} outputs."
+                )
+        return [stack.logical_ids for stack in stacks]
+
+
+@dataclass
+class _StackUsage:
+    """
+    Resources assigned to a nested stack, with their size and the parameters and outputs they need.
+
+    :ivar imports: references to resources of other stacks, template parameters and pseudo parameters, as
+        (name, attribute) pairs
+    :ivar conditions: conditions the resources use
+    :ivar exports: references from resources of other stacks, or from the outputs of the parent template, to the
+        resources, as (logical ID, attribute) pairs. References from resources not assigned yet are counted, so this
+        only shrinks when resources are added
+    """
+
+    logical_ids: list[str] = field(default_factory=list)
+    size: int = 0
+    imports: set[tuple[str, str | None]] = field(default_factory=set)
+    conditions: set[str] = field(default_factory=set)
+    exports: set[tuple[str, str | None]] = field(default_factory=set)
+
+    @property
+    def parameter_count(self) -> int:
+        return len(self.imports) + len(self.conditions)
+
+
+class _ResourceUsage:
+    """Sizes and references of the resources of a template, to count what nested stacks need for them."""
+
+    def __init__(self, template: dict[str, Any], resources: dict[str, Any]) -> None:
+        parameters = template.get("Parameters") or {}
+        self.sizes = {logical_id: _get_size(resource) for logical_id, resource in resources.items()}
+        self.references: dict[str, set[tuple[str, str | None]]] = {}
+        self.conditions: dict[str, set[str]] = {}
+        # (logical ID, attribute) -> logical IDs of the resources referencing it, None for the template outputs
+        self.referrers: dict[tuple[str, str | None], set[str | None]] = {}
+        for logical_id, resource in resources.items():
+            references: set[tuple[str, str | None]] = set()
+            conditions: set[str] = set()
+            if isinstance(resource, dict):
+                _collect_attribute_references(
+                    {key: value for key, value in resource.items() if key != "DependsOn"}, references, conditions
+                )
+                if isinstance(resource.get("Condition"), str):
+                    conditions.add(resource["Condition"])
+            self.references[logical_id] = {
+                (name, attribute)
+                for name, attribute in references
+                if name in resources
+                or (attribute is None and (name in parameters or name in _FORWARDED_PSEUDO_PARAMETERS))
+            }
+            self.conditions[logical_id] = conditions
+            for reference in self.references[logical_id]:
+                if reference[0] in resources:
+                    self.referrers.setdefault(reference, set()).add(logical_id)
+        output_references: set[tuple[str, str | None]] = set()
+        _collect_attribute_references(template.get("Outputs"), output_references, set())
+        for reference in output_references:
+            if reference[0] in resources:
+                self.referrers.setdefault(reference, set()).add(None)
+        self._exported_references: dict[str, list[tuple[str, str | None]]] = {}
+        for reference in self.referrers:
+            self._exported_references.setdefault(reference[0], []).append(reference)
+
+    def add(self, stack: _StackUsage, block: list[str]) -> _StackUsage:
+        """Returns the usage of the stack with the block of resources added to it."""
+        logical_ids = [*stack.logical_ids, *block]
+        members = set(logical_ids)
+        exports = {
+            reference
+            for reference in stack.exports.union(
+                *(self._exported_references.get(logical_id, []) for logical_id in block)
+            )
+            if any(referrer not in members for referrer in self.referrers[reference])
+        }
+        return _StackUsage(
+            logical_ids,
+            stack.size + sum(self.sizes[logical_id] for logical_id in block),
+            stack.imports.union(
+                *(
+                    {reference for reference in self.references[logical_id] if reference[0] not in members}
+                    for logical_id in block
+                )
+            ),
+            stack.conditions.union(*(self.conditions[logical_id] for logical_id in block)),
+            exports,
+        )
+
+
+class _NestedTemplate:
+    """A nested template being built, with the values its parameters get from the parent stack."""
+
+    def __init__(self, logical_id: str) -> None:
+        self.logical_id = logical_id
+        self.resources: dict[str, Any] = {}
+        self.parameters: dict[str, Any] = {}
+        self.parameter_values: dict[str, Any] = {}
+        self.conditions: dict[str, Any] = {}
+        self.outputs: dict[str, Any] = {}
+        self.depends_on: set[str] = set()
+        self.uses_mappings = False
+
+    def add_parameter(self, name: str, definition: dict[str, Any], value: Any) -> None:
+        self.parameters[name] = definition
+        self.parameter_values[name] = value
+
+    def to_template(self) -> dict[str, Any]:
+        template: dict[str, Any] = {"AWSTemplateFormatVersion": "2010-09-09"}
+        for section, value in [("Parameters", self.parameters), ("Conditions", self.conditions)]:
+            if value:
+                template[section] = value
+        template["Resources"] = self.resources
+        if self.outputs:
+            template["Outputs"] = self.outputs
+        return template
+
+    def to_stack_resource(self, template_url: Any) -> dict[str, Any]:
+        properties: dict[str, Any] = {"TemplateURL": template_url}
+        if self.parameter_values:
+            properties["Parameters"] = self.parameter_values
+        resource: dict[str, Any] = {"Type": "AWS::CloudFormation::Stack", "Properties": properties}
+        if self.depends_on:
+            resource["DependsOn"] = sorted(self.depends_on)
+        return resource
+
+
+class _NestedStacksBuilder:
+    """Builds the parent and nested templates, once resources are assigned to nested stacks."""
+
+    def __init__(self, template: dict[str, Any], bins: list[list[str]], template_url: Callable[[str], Any]) -> None:
+        self.template = template
+        self.resources: dict[str, Any] = template.get("Resources") or {}
+        self.parameters: dict[str, Any] = template.get("Parameters") or {}
+        self.template_url = template_url
+        self._taken_names = set(self.resources) | set(self.parameters) | set(template.get("Conditions") or {})
+
+        self.nested_templates: list[_NestedTemplate] = []
+        index = 0
+        while len(self.nested_templates) < len(bins):
+            index += 1
+            if f"{NESTED_STACK_PREFIX}{index}" not in self._taken_names:
+                self.nested_templates.append(_NestedTemplate(self._get_unique_name(f"{NESTED_STACK_PREFIX}{index}")))
+        self._nested_template_of = {
+            logical_id: nested_template
+            for nested_template, logical_ids in zip(self.nested_templates, bins, strict=True)
+            for logical_id in logical_ids
+        }
+        # (logical ID, attribute) -> name of the output of the nested stack of the resource, and of the parameters
+        # of the nested stacks that import it
+        self._export_names: dict[tuple[str, str | None], str] = {}
+        self._condition_parameter_names: dict[str, str] = {}
+
+    def build(self) -> SplitTemplate:
+        for logical_id, resource in self.resources.items():
+            nested_template = self._nested_template_of[logical_id]
+            nested_template.resources[logical_id] = self._rewrite_resource(resource, nested_template)
+
+        # Outputs are rewritten first, since exporting computed attributes may add parameters to nested stacks
+        outputs = self._rewrite(self.template["Outputs"], None) if "Outputs" in self.template else None
+        parent = {key: value for key, value in self.template.items() if key not in ("Resources", "Outputs")}
+        parent["Resources"] = {
+            nested_template.logical_id: nested_template.to_stack_resource(self.template_url(nested_template.logical_id))
+            for nested_template in self.nested_templates
+        }
+        if "Outputs" in self.template:
+            parent["Outputs"] = outputs
+
+        nested_templates = {}
+        for nested_template in self.nested_templates:
+            template = nested_template.to_template()
+            if nested_template.uses_mappings and "Mappings" in self.template:
+                template["Mappings"] = self.template["Mappings"]
+            nested_templates[nested_template.logical_id] = template
+        return SplitTemplate(parent, nested_templates)
+
+    def _get_unique_name(self, name: str) -> str:
+        unique_name = name
+        suffix = 1
+        while unique_name in self._taken_names:
+            suffix += 1
+            unique_name = f"{name}{suffix}"
+        self._taken_names.add(unique_name)
+        return unique_name
+
+    def _rewrite_resource(self, resource: Any, nested_template: _NestedTemplate) -> Any:
+        if not isinstance(resource, dict):
+            return resource
+        rewritten = {}
+        for key, value in resource.items():
+            if key == "DependsOn":
+                depends_on = [value] if isinstance(value, str) else value
+                local_depends_on = []
+                for dependency in depends_on:
+                    dependency_template = self._nested_template_of.get(dependency)
+                    if dependency_template is None or dependency_template is nested_template:
+                        local_depends_on.append(dependency)
+                    else:
+                        nested_template.depends_on.add(dependency_template.logical_id)
+                if local_depends_on:
+                    rewritten[key] = local_depends_on if isinstance(value, list) else local_depends_on[0]
+            elif key == "Condition":
+                self._import_condition(value, nested_template)
+                rewritten[key] = value
+            else:
+                rewritten[key] = self._rewrite(value, nested_template)
+        return rewritten
+
+    def _rewrite(self, value: Any, nested_template: _NestedTemplate | None) -> Any:
+        """
+        Rewrites the references of a value of the given nested template, or of the parent template if None, to
+        resources of other stacks.
+        """
+        if isinstance(value, list):
+            return [self._rewrite(item, nested_template) for item in value]
+        if not isinstance(value, dict):
+            return value
+
+        if len(value) == 1:
+            if "Ref" in value and isinstance(value["Ref"], str):
+                return self._rewrite_reference(value["Ref"], None, nested_template, value)
+            if "Fn::GetAtt" in value:
+                logical_id, attribute = _parse_get_att(value["Fn::GetAtt"])
+                if logical_id is not None:
+                    return self._rewrite_reference(logical_id, attribute, nested_template, value)
+            if "Fn::Sub" in value:
+                return {"Fn::Sub": self._rewrite_sub(value["Fn::Sub"], nested_template)}
+            if nested_template is not None:
+                if_args = value.get("Fn::If")
+                if isinstance(if_args, list) and if_args and isinstance(if_args[0], str):
+                    self._import_condition(if_args[0], nested_template)
+                if "Fn::FindInMap" in value:
+                    nested_template.uses_mappings = True
+
+        return {key: self._rewrite(item, nested_template) for key, item in value.items()}
+
+    def _rewrite_reference(
+        self, logical_id: str, attribute: Any, nested_template: _NestedTemplate | None, original: Any
+    ) -> Any:
+        """
+        :param attribute: attribute name, or intrinsic function computing it, of Fn::GetAtt. None for Ref
+        """
+        referenced_template = self._nested_template_of.get(logical_id)
+        if nested_template is None:
+            if referenced_template is None:
+                return original
+            return {"Fn::GetAtt": [referenced_template.logical_id, f"Outputs.{self._export(logical_id, attribute)}"]}
+
+        if referenced_template is not None and referenced_template is not nested_template:
+            name = self._import_resource(logical_id, attribute, nested_template)
+            # Parameters named after the resource keep the references to it valid
+            return original if attribute is None else {"Ref": name}
+        if attribute is not None and not isinstance(attribute, str):
+            return {"Fn::GetAtt": [logical_id, self._rewrite(attribute, nested_template)]}
+        if attribute is None:
+            if logical_id in self.parameters:
+                self._import_parameter(logical_id, nested_template)
+            elif logical_id in _FORWARDED_PSEUDO_PARAMETERS:
+                return {"Ref": self._import_pseudo_parameter(logical_id, nested_template)}
+        return original
+
+    def _rewrite_sub(self, sub: Any, nested_template: _NestedTemplate | None) -> Any:
+        if isinstance(sub, list) and sub and isinstance(sub[0], str):
+            variables = sub[1] if len(sub) > 1 and isinstance(sub[1], dict) else {}
+            return [
+                self._rewrite_sub_string(sub[0], set(variables), nested_template),
+                *self._rewrite(sub[1:], nested_template),
+            ]
+        if isinstance(sub, str):
+            return self._rewrite_sub_string(sub, set(), nested_template)
+        return self._rewrite(sub, nested_template)
+
+    def _rewrite_sub_string(self, text: str, variables: set[str], nested_template: _NestedTemplate | None) -> str:
+        def replace(match: re.Match[str]) -> str:
+            reference = match.group(1)
+            if reference in variables:
+                return match.group(0)
+            logical_id, _, attribute = reference.partition(".")
+            rewritten = self._rewrite_reference(logical_id, attribute or None, nested_template, None)
+            if rewritten is None:
+                return match.group(0)
+            if "Ref" in rewritten:
+                return "${" + str(rewritten["Ref"]) + "}"
+            stack_logical_id, output = rewritten["Fn::GetAtt"]
+            return "${" + f"{stack_logical_id}.{output}" + "}"
+
+        return _SUB_REFERENCE_PATTERN.sub(replace, text)
+
+    def _export(self, logical_id: str, attribute: Any) -> str:
+        """
+        Adds the output of the resource attribute to the nested stack of the resource.
+
+        :return: name of the output
+        """
+        key = (logical_id, attribute if attribute is None or isinstance(attribute, str) else json.dumps(attribute))
+        if key in self._export_names:
+            return self._export_names[key]
+
+        if attribute is None:
+            name = logical_id
+            value: Any = {"Ref": logical_id}
+        elif isinstance(attribute, str):
+            name = self._get_unique_name(logical_id + re.sub(r"[^A-Za-z0-9]", "", attribute))
+            value = {"Fn::GetAtt": [logical_id, attribute]}
+        else:
+            name = self._get_unique_name(logical_id + "Attribute")
+            value = {"Fn::GetAtt": [logical_id, self._rewrite(attribute, self._nested_template_of[logical_id])]}
+        output = {"Value": value}
+        condition = self.resources[logical_id].get("Condition")
+        if condition:
+            output["Condition"] = condition
+        self._nested_template_of[logical_id].outputs[name] = output
+        self._export_names[key] = name
+        return name
+
+    def _import_resource(self, logical_id: str, attribute: Any, nested_template: _NestedTemplate) -> str:
+        name = self._export(logical_id, attribute)
+        if name in nested_template.parameters:
+            return name
+
+        value: Any = {"Fn::GetAtt": [self._nested_template_of[logical_id].logical_id, f"Outputs.{name}"]}
+        definition: dict[str, Any] = {"Type": "String"}
+        condition = self.resources[logical_id].get("Condition")
+        if condition:
+            # The output doesn't exist when the resource isn't created
+            value = {"Fn::If": [condition, value, {"Ref": "AWS::NoValue"}]}
+            definition["Default"] = ""
+        nested_template.add_parameter(name, definition, value)
+        return name
+
+    def _import_parameter(self, name: str, nested_template: _NestedTemplate) -> None:
+        if name in nested_template.parameters:
+            return
+        parameter = self.parameters[name] if isinstance(self.parameters[name], dict) else {}
+        parameter_type = str(parameter.get("Type", "String"))
+        definition: dict[str, Any] = {"Type": "String"}
+        value: Any = {"Ref": name}
+        if "List<" in parameter_type or "CommaDelimitedList" in parameter_type:
+            definition["Type"] = "CommaDelimitedList"
+            value = {"Fn::Join": [",", value]}
+        if "NoEcho" in parameter:
+            definition["NoEcho"] = parameter["NoEcho"]
+        nested_template.add_parameter(name, definition, value)
+
+    def _import_pseudo_parameter(self, pseudo_parameter: str, nested_template: _NestedTemplate) -> str:
+        name = _FORWARDED_PSEUDO_PARAMETERS[pseudo_parameter]
+        if name in self._taken_names and name not in nested_template.parameters:
+            # Only forwarded pseudo parameters are named like this in nested templates
+            raise ValueError(f"'{name}' is reserved for forwarding {pseudo_parameter} to nested stacks.")
+        nested_template.add_parameter(name, {"Type": "String"}, {"Ref": pseudo_parameter})
+        return name
+
+    def _import_condition(self, condition: Any, nested_template: _NestedTemplate) -> None:
+        if not isinstance(condition, str) or condition in nested_template.conditions:
+            return
+        if condition not in self._condition_parameter_names:
+            self._condition_parameter_names[condition] = self._get_unique_name(condition + "Condition")
+        name = self._condition_parameter_names[condition]
+        nested_template.add_parameter(
+            name, {"Type": "String", "AllowedValues": ["true", "false"]}, {"Fn::If": [condition, "true", "false"]}
+        )
+        nested_template.conditions[condition] = {"Fn::Equals": [{"Ref": name}, "true"]}
+
+
+def _get_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def _parse_get_att(get_att: Any) -> tuple[str | None, Any]:
+    """
+    :return: the logical ID of the resource and the attribute name, or the intrinsic function computing it
+    """
+    if isinstance(get_att, str):
+        logical_id, _, attribute = get_att.partition(".")
+        return (logical_id, attribute) if attribute else (None, None)
+    if isinstance(get_att, list) and len(get_att) == 2 and isinstance(get_att[0], str):  # noqa: PLR2004
+        return get_att[0], get_att[1]
+    return None, None
+
+
+def _get_resource_dependencies(resource: Any, resources: dict[str, Any]) -> set[str]:
+    """Returns the logical IDs of the resources the resource references or depends on."""
+    references: set[str] = set()
+    if not isinstance(resource, dict):
+        return references
+    depends_on = resource.get("DependsOn")
+    references.update([depends_on] if isinstance(depends_on, str) else depends_on or [])
+    _collect_references({key: value for key, value in resource.items() if key != "DependsOn"}, references)
+    return {reference for reference in references if reference in resources}
+
+
+def _get_computed_attribute_dependencies(resource: Any, resources: dict[str, Any]) -> set[str]:
+    """Returns the logical IDs of the resources the resource references with Fn::GetAtt on a computed attribute."""
+    references: set[str] = set()
+    computed_attribute_references: set[str] = set()
+    _collect_references(resource, references, computed_attribute_references)
+    return {reference for reference in computed_attribute_references if reference in resources}
+
+
+def _collect_references(
+    value: Any, references: set[str], computed_attribute_references: set[str] | None = None
+) -> None:
+    if isinstance(value, list):
+        for item in value:
+            _collect_references(item, references, computed_attribute_references)
+        return
+    if not isinstance(value, dict):
+        return
+
+    if len(value) == 1:
+        if isinstance(value.get("Ref"), str):
+            references.add(value["Ref"])
+            return
+        if "Fn::GetAtt" in value:
+            logical_id, attribute = _parse_get_att(value["Fn::GetAtt"])
+            if logical_id is not None:
+                references.add(logical_id)
+                if isinstance(attribute, str):
+                    return
+                if computed_attribute_references is not None:
+                    computed_attribute_references.add(logical_id)
+                _collect_references(attribute, references, computed_attribute_references)
+                return
+        sub = value.get("Fn::Sub")
+        text = sub[0] if isinstance(sub, list) and sub else sub
+        if isinstance(text, str):
+            references.update(match.partition(".")[0] for match in _SUB_REFERENCE_PATTERN.findall(text))
+
+    for item in value.values():
+        _collect_references(item, references, computed_attribute_references)
+
+
+def _collect_attribute_references(value: Any, references: set[tuple[str, str | None]], conditions: set[str]) -> None:
+    """
+    Collects the references of a value like _NestedStacksBuilder rewrites them, as (name, attribute) pairs, with
+    the attribute None for Ref and the JSON of attributes computed by intrinsic functions. Also collects the
+    conditions of Fn::If.
+    """
+    if isinstance(value, list):
+        for item in value:
+            _collect_attribute_references(item, references, conditions)
+        return
+    if not isinstance(value, dict):
+        return
+
+    if len(value) == 1:
+        if isinstance(value.get("Ref"), str):
+            references.add((value["Ref"], None))
+            return
+        if "Fn::GetAtt" in value:
+            logical_id, attribute = _parse_get_att(value["Fn::GetAtt"])
+            if logical_id is not None:
+                if isinstance(attribute, str):
+                    references.add((logical_id, attribute))
+                    return
+                references.add((logical_id, json.dumps(attribute)))
+                _collect_attribute_references(attribute, references, conditions)
+                return
+        if "Fn::Sub" in value and _collect_sub_references(value["Fn::Sub"], references, conditions):
+            return
+        if_args = value.get("Fn::If")
+        if isinstance(if_args, list) and if_args and isinstance(if_args[0], str):
+            conditions.add(if_args[0])
+
+    for item in value.values():
+        _collect_attribute_references(item, references, conditions)
+
+
+def _collect_sub_references(sub: Any, references: set[tuple[str, str | None]], conditions: set[str]) -> bool:
+    """
+    :return: whether the value is a valid Fn::Sub whose references are collected
+    """
+    text = sub[0] if isinstance(sub, list) and sub else sub
+    if not isinstance(text, str):
+        return False
+    variables = sub[1] if isinstance(sub, list) and len(sub) > 1 and isinstance(sub[1], dict) else {}
+    for match in _SUB_REFERENCE_PATTERN.findall(text):
+        if match not in variables:
+            logical_id, _, attribute = match.partition(".")
+            references.add((logical_id, attribute or None))
+    _collect_attribute_references(sub[1:] if isinstance(sub, list) else [], references, conditions)
+    return True
+
+
+def _get_strongly_connected_components(dependencies: list[set[int]]) -> list[list[int]]:
+    """
+    Tarjan's algorithm, iteratively. Components are returned in dependency order: a component comes after the
+    components it depends on.
+
+    :param dependencies: indexes of the nodes each node depends on
+    """
+    # -1 for nodes not visited yet
+    indexes = [-1] * len(dependencies)
+    low_links = [0] * len(dependencies)
+    on_stack = [False] * len(dependencies)
+    stack: list[int] = []
+    components: list[list[int]] = []
+    next_index = 0
+
+    for root in range(len(dependencies)):
+        if indexes[root] != -1:
+            continue
+        work = [(root, iter(sorted(dependencies[root])))]
+        indexes[root] = low_links[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = True
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if indexes[child] == -1:
+                    indexes[child] = low_links[child] = next_index
+                    next_index += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, iter(sorted(dependencies[child]))))
+                    break
+                if on_stack[child]:
+                    low_links[node] = min(low_links[node], indexes[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low_links[parent] = min(low_links[parent], low_links[node])
+                if low_links[node] == indexes[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+    return components
@@ -1,44 +1,264 @@
-from functools import cache
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import cache, partial
 from typing import Any
 
+from botocore.client import BaseClient
+
 from samtranslator.feature_toggle.feature_toggle import FeatureToggle
+from samtranslator.internal.managed_policies import get_bundled_managed_policy_map
+from samtranslator.internal.types import GetManagedPolicyMap
+from samtranslator.model.intrinsics import is_intrinsic_if
 from samtranslator.parser.parser import Parser
+from samtranslator.plugins import BasePlugin
+from samtranslator.plugins.application.serverless_app_plugin import ServerlessAppPlugin
+from samtranslator.sdk.parameter import SamParameterValues
+from samtranslator.translator.arn_generator import ArnGenerator
 from samtranslator.translator.managed_policy_translator import ManagedPolicyLoader
+from samtranslator.translator.translation_cache import TranslationCache, get_translation_cache_key
 from samtranslator.translator.translator import Translator
 from samtranslator.utils.py27hash_fix import to_py27_compatible_template, undo_mark_unicode_str_in_template
 
+# Resource types whose Policies may refer to managed policies by name
+_MANAGED_POLICY_RESOURCE_TYPES = ("AWS::Serverless::Function", "AWS::Serverless::StateMachine")
+
 
-def transform(
+def transform(  # noqa: PLR0913
     input_fragment: dict[str, Any],
     parameter_values: dict[str, Any],
     managed_policy_loader: ManagedPolicyLoader,
     feature_toggle: FeatureToggle | None = None,
     passthrough_metadata: bool | None = False,
+    translation_cache: TranslationCache | None = None,
+    deduplicate_policies: bool | None = False,
+    merge_resource_policy_statements: bool | None = False,
+    fold_conditions: bool | None = False,
 ) -> dict[str, Any]:
     """Translates the SAM manifest provided in the and returns the translation to CloudFormation.
 
     :param dict input_fragment: the SAM template to transform
     :param dict parameter_values: Parameter values provided by the user
+    :param TranslationCache translation_cache: optional cache of previous translations. Templates that were already
+        translated with the same inputs are returned from the cache instead of being translated again
+    :param bool deduplicate_policies: whether inline policies that are identical across the generated IAM roles are
+        replaced with a shared AWS::IAM::ManagedPolicy, to reduce the size of the template
+    :param bool merge_resource_policy_statements: whether the statements generated for the ResourcePolicy of the
+        paths of an API are merged into one statement for all the paths they apply to, to reduce the size of its
+        resource policy
+    :param bool fold_conditions: whether the conditions whose value is known from the given parameter values are
+        evaluated before the translation, removing the resources, outputs and Fn::If branches they exclude
     :returns: the transformed CloudFormation template
     :rtype: dict
     """
-
-    sam_parser = Parser()
-    to_py27_compatible_template(input_fragment, parameter_values)
-    translator = Translator(
-        None,
-        sam_parser,
+    cache_key = _get_cache_key(
+        translation_cache,
+        input_fragment,
+        parameter_values,
+        feature_toggle,
+        passthrough_metadata,
+        deduplicate_policies,
+        merge_resource_policy_statements,
+        fold_conditions,
     )
+    if translation_cache is not None and cache_key is not None:
+        cached = translation_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
     @cache
     def get_managed_policy_map() -> dict[str, str]:
         return managed_policy_loader.load()
 
+    to_py27_compatible_template(input_fragment, parameter_values)
+    transformed = _translate(
+        input_fragment,
+        parameter_values,
+        get_managed_policy_map,
+        None,
+        feature_toggle,
+        passthrough_metadata,
+        deduplicate_policies,
+        merge_resource_policy_statements,
+        fold_conditions,
+    )
+    if translation_cache is not None and cache_key is not None:
+        translation_cache.put(cache_key, transformed)
+    return transformed
+
+
+async def transform_async(  # noqa: PLR0913
+    input_fragment: dict[str, Any],
+    parameter_values: dict[str, Any],
+    managed_policy_loader: ManagedPolicyLoader,
+    feature_toggle: FeatureToggle | None = None,
+    passthrough_metadata: bool | None = False,
+    translation_cache: TranslationCache | None = None,
+    deduplicate_policies: bool | None = False,
+    merge_resource_policy_statements: bool | None = False,
+    fold_conditions: bool | None = False,
+    sar_client: BaseClient | None = None,
+) -> dict[str, Any]:
+    """Translates the SAM manifest like transform(), without blocking the running event loop.
+
+    The translation runs on a worker thread. The calls to AWS it needs are made on other worker threads as soon as
+    the template shows they are needed, so that they overlap with the translation instead of adding up to it:
+
+    - the managed policies are loaded from IAM when a function or state machine refers to a managed policy name
+      that isn't bundled with the transform
+    - the templates of the applications are requested from the Serverless Application Repository when the
+      template is parsed, and each application only waits for its request when it is translated
+
+    :param dict input_fragment: the SAM template to transform
+    :param dict parameter_values: Parameter values provided by the user
+    :param BaseClient sar_client: client of the Serverless Application Repository. It is created on first use if
+        not given
+    :returns: the transformed CloudFormation template, identical to the one transform() returns
+    :rtype: dict
+    """
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(thread_name_prefix="SamTransform")
+    try:
+        cache_key = await loop.run_in_executor(
+            executor,
+            partial(
+                _get_cache_key,
+                translation_cache,
+                input_fragment,
+                parameter_values,
+                feature_toggle,
+                passthrough_metadata,
+                deduplicate_policies,
+                merge_resource_policy_statements,
+                fold_conditions,
+            ),
+        )
+        if translation_cache is not None and cache_key is not None:
+            cached = translation_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        managed_policy_map = (
+            executor.submit(managed_policy_loader.load)
+            if _refers_to_unbundled_managed_policies(input_fragment)
+            else None
+        )
+
+        @cache
+        def get_managed_policy_map() -> dict[str, str]:
+            if managed_policy_map is not None:
+                return managed_policy_map.result()
+            return managed_policy_loader.load()
+
+        def translate() -> dict[str, Any]:
+            to_py27_compatible_template(input_fragment, parameter_values)
+            # The plugin the translator would otherwise create, making its calls on the executor
+            sam_parameter_values = SamParameterValues(parameter_values)
+            sam_parameter_values.add_default_parameter_values(input_fragment)
+            sam_parameter_values.add_pseudo_parameter_values()
+            serverless_app_plugin = ServerlessAppPlugin(
+                sar_client=sar_client, parameters=sam_parameter_values.parameter_values, executor=executor
+            )
+            return _translate(
+                input_fragment,
+                parameter_values,
+                get_managed_policy_map,
+                [serverless_app_plugin],
+                feature_toggle,
+                passthrough_metadata,
+                deduplicate_policies,
+                merge_resource_policy_statements,
+                fold_conditions,
+            )
+
+        transformed = await loop.run_in_executor(executor, copy_context().run, translate)
+    finally:
+        # Calls whose result is no longer needed, such as after an error, finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if translation_cache is not None and cache_key is not None:
+        translation_cache.put(cache_key, transformed)
+    return transformed
+
+
+def _get_cache_key(  # noqa: PLR0913
+    translation_cache: TranslationCache | None,
+    input_fragment: dict[str, Any],
+    parameter_values: dict[str, Any],
+    feature_toggle: FeatureToggle | None,
+    passthrough_metadata: bool | None,
+    deduplicate_policies: bool | None,
+    merge_resource_policy_statements: bool | None,
+    fold_conditions: bool | None,
+) -> str | None:
+    """
+    Returns the key to cache the translation under, or None if there is no cache or the translation can't be cached.
+    """
+    if translation_cache is None:
+        return None
+    cache_key = get_translation_cache_key(
+        input_fragment,
+        parameter_values,
+        feature_toggle,
+        passthrough_metadata,
+        deduplicate_policies,
+        merge_resource_policy_statements,
+        fold_conditions,
+    )
+    if cache_key is None:
+        translation_cache.record_bypass()
+    return cache_key
+
+
+def _translate(  # noqa: PLR0913
+    input_fragment: dict[str, Any],
+    parameter_values: dict[str, Any],
+    get_managed_policy_map: GetManagedPolicyMap,
+    plugins: list[BasePlugin] | None,
+    feature_toggle: FeatureToggle | None,
+    passthrough_metadata: bool | None,
+    deduplicate_policies: bool | None,
+    merge_resource_policy_statements: bool | None,
+    fold_conditions: bool | None,
+) -> dict[str, Any]:
+    sam_parser = Parser()
+    translator = Translator(
+        None,
+        sam_parser,
+        plugins,
+    )
     transformed = translator.translate(
         input_fragment,
         parameter_values=parameter_values,
         feature_toggle=feature_toggle,
         passthrough_metadata=passthrough_metadata,
         get_managed_policy_map=get_managed_policy_map,
+        deduplicate_policies=deduplicate_policies,
+        merge_resource_policy_statements=merge_resource_policy_statements,
+        fold_conditions=fold_conditions,
     )
     return undo_mark_unicode_str_in_template(transformed)
+
+
+def _refers_to_unbundled_managed_policies(template: dict[str, Any]) -> bool:
+    """
+    Checks whether a function or state machine of the template refers to a managed policy by a name that isn't in the
+    managed policy map bundled with the transform, and that is then looked up in the managed policies loaded from IAM.
+    """
+    resources = template.get("Resources")
+    if not isinstance(resources, dict):
+        return False
+    bundled_managed_policy_map = get_bundled_managed_policy_map(ArnGenerator.get_partition_name()) or {}
+    for resource in resources.values():
+        if not isinstance(resource, dict) or resource.get("Type") not in _MANAGED_POLICY_RESOURCE_TYPES:
+            continue
+        properties = resource.get("Properties")
+        policies = properties.get("Policies") if isinstance(properties, dict) else None
+        for policy in policies if isinstance(policies, list) else [policies]:
+            names = policy["Fn::If"][1:] if is_intrinsic_if(policy) and isinstance(policy["Fn::If"], list) else [policy]
+            if any(
+                isinstance(name, str) and not name.startswith("arn:") and name not in bundled_managed_policy_map
+                for name in names
+            ):
+                return True
+    return False
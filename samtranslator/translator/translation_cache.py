@@ -0,0 +1,264 @@
+"""
+Opt-in cache of whole translations, keyed by the content of everything the translation depends on.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import boto3
+
+from samtranslator import __version__
+from samtranslator.feature_toggle.feature_toggle import FeatureToggle
+from samtranslator.metrics.metrics import Metrics
+from samtranslator.translator.arn_generator import ArnGenerator, NoRegionFound
+
+LOG = logging.getLogger(__name__)
+
+_CACHE_KEY_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True, default=repr)
+
+
+def get_translation_cache_key(  # noqa: PLR0913
+    input_fragment: dict[str, Any],
+    parameter_values: dict[str, Any],
+    feature_toggle: FeatureToggle | None = None,
+    passthrough_metadata: bool | None = False,
+    deduplicate_policies: bool | None = False,
+    merge_resource_policy_statements: bool | None = False,
+    fold_conditions: bool | None = False,
+) -> str | None:
+    """
+    Computes the key to cache the translation of the given template under. The key is a digest of the template,
+    the parameter values, the region and partition, the feature toggle configuration, the passthrough, policy
+    deduplication, policy statement merging and condition folding flags and the library version.
+
+    Managed policy names are resolved against AWS managed policies only, whose ARNs are fixed per partition, so
+    they are covered by the partition. Templates whose translation depends on other external state can't be cached.
+
+    :param dict input_fragment: the SAM template to transform, before it is modified by the translation
+    :param dict parameter_values: Parameter values provided by the user
+    :param FeatureToggle feature_toggle: feature toggle used for the translation, if any
+    :param bool passthrough_metadata: whether resource Metadata is passed through to generated resources
+    :param bool deduplicate_policies: whether identical inline policies are moved to shared managed policies
+    :param bool merge_resource_policy_statements: whether API resource policy statements are merged across paths
+    :param bool fold_conditions: whether conditions known from the parameter values are evaluated before translation
+    :return: hex digest to use as cache key, or None if the translation can't be cached
+    """
+    if _uses_serverless_application_repository(input_fragment):
+        return None
+
+    region = boto3.session.Session().region_name
+    try:
+        partition: str | None = ArnGenerator.get_partition_name()
+    except NoRegionFound:
+        partition = None
+
+    key_input = {
+        "Template": input_fragment,
+        "ParameterValues": parameter_values,
+        "Region": region,
+        "Partition": partition,
+        "FeatureToggle": _get_feature_toggle_key(feature_toggle),
+        "PassthroughMetadata": bool(passthrough_metadata),
+        "DeduplicatePolicies": bool(deduplicate_policies),
+        "MergeResourcePolicyStatements": bool(merge_resource_policy_statements),
+        "FoldConditions": bool(fold_conditions),
+        "Version": __version__,
+    }
+    try:
+        key_string = _CACHE_KEY_ENCODER.encode(key_input)
+    except (TypeError, ValueError):
+        # Keys that can't be sorted or values that can't be encoded
+        return None
+    return hashlib.sha256(key_string.encode("utf-8")).hexdigest()
+
+
+def _uses_serverless_application_repository(input_fragment: dict[str, Any]) -> bool:
+    """
+    Applications located in the Serverless Application Repository are resolved with service calls, the result of
+    which may change between translations.
+    """
+    resources = input_fragment.get("Resources")
+    if not isinstance(resources, dict):
+        return False
+    return any(
+        isinstance(resource, dict)
+        and resource.get("Type") == "AWS::Serverless::Application"
+        and isinstance((resource.get("Properties") or {}).get("Location"), dict)
+        for resource in resources.values()
+    )
+
+
+def _get_feature_toggle_key(feature_toggle: FeatureToggle | None) -> dict[str, Any] | None:
+    if feature_toggle is None:
+        return None
+    return {
+        "Config": getattr(feature_toggle, "feature_config", None),
+        "Stage": getattr(feature_toggle, "stage", None),
+        "AccountId": getattr(feature_toggle, "account_id", None),
+        "Region": getattr(feature_toggle, "region", None),
+    }
+
+
+class TranslationCache(ABC):
+    """
+    Base class for stores of translated templates. Entries are stored as JSON, so every hit returns a fresh copy
+    of the template that the caller is free to modify.
+    """
+
+    def __init__(self, max_size_bytes: int, metrics: Metrics | None = None) -> None:
+        """
+        :param max_size_bytes: maximum total size of the cached templates. Least recently used entries are evicted
+            once the cache grows larger
+        :param metrics: optional metrics to record cache hits, misses and bypasses on
+        """
+        self.max_size_bytes = max_size_bytes
+        self.metrics = metrics
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Returns the translated template cached under the given key, if any
+
+        :param key: cache key, as returned by get_translation_cache_key
+        :return: translated template, or None on a cache miss
+        """
+        serialized = self._load(key)
+        if serialized is None:
+            self.misses += 1
+            self._record_count("TranslationCacheMiss")
+            return None
+
+        self.hits += 1
+        self._record_count("TranslationCacheHit")
+        template: dict[str, Any] = json.loads(serialized)
+        return template
+
+    def put(self, key: str, template: dict[str, Any]) -> None:
+        """
+        Caches the translated template under the given key
+
+        :param key: cache key, as returned by get_translation_cache_key
+        :param template: translated template
+        """
+        try:
+            serialized = json.dumps(template, separators=(",", ":"))
+        except (TypeError, ValueError):
+            LOG.debug("Translated template can't be serialized, not caching it.")
+            return
+        if len(serialized) > self.max_size_bytes:
+            return
+        self._store(key, serialized)
+
+    def record_bypass(self) -> None:
+        """Records a translation that couldn't use the cache"""
+        self.bypasses += 1
+        self._record_count("TranslationCacheBypass")
+
+    def _record_count(self, name: str) -> None:
+        if self.metrics:
+            self.metrics.record_count(name, 1)
+
+    @abstractmethod
+    def _load(self, key: str) -> str | None:
+        """Returns the serialized template stored under the key and marks it as recently used"""
+
+    @abstractmethod
+    def _store(self, key: str, serialized: str) -> None:
+        """Stores the serialized template under the key and evicts entries until the cache fits its size limit"""
+
+
+class InMemoryTranslationCache(TranslationCache):
+    """
+    Translation cache that keeps the templates in memory, for the lifetime of the process.
+    """
+
+    def __init__(self, max_size_bytes: int = 64 * 1024 * 1024, metrics: Metrics | None = None) -> None:
+        super().__init__(max_size_bytes, metrics)
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._size_bytes = 0
+
+    def _load(self, key: str) -> str | None:
+        serialized = self._entries.get(key)
+        if serialized is not None:
+            self._entries.move_to_end(key)
+        return serialized
+
+    def _store(self, key: str, serialized: str) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size_bytes -= len(previous)
+        self._entries[key] = serialized
+        self._size_bytes += len(serialized)
+
+        while self._size_bytes > self.max_size_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size_bytes -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FileTranslationCache(TranslationCache):
+    """
+    Translation cache that stores every template in its own file of a directory, so it can be shared between
+    processes. Recency is tracked with the files' modification time.
+    """
+
+    FILE_SUFFIX = ".json"
+
+    def __init__(self, directory: str, max_size_bytes: int = 512 * 1024 * 1024, metrics: Metrics | None = None) -> None:
+        super().__init__(max_size_bytes, metrics)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (key + self.FILE_SUFFIX)
+
+    def _load(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            serialized = path.read_text(encoding="utf-8")
+            path.touch()
+        except OSError:
+            return None
+        return serialized
+
+    def _store(self, key: str, serialized: str) -> None:
+        # Write to a temporary file first, so concurrent readers never see a partial entry
+        fd, temp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(serialized)
+            temp_path.replace(self._path(key))
+        except OSError:
+            LOG.warning("Failed to write translation cache entry %s.", key, exc_info=True)
+            temp_path.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total_size = 0
+        for path in self.directory.glob("*" + self.FILE_SUFFIX):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
@@ -1,4 +1,9 @@
 import copy
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from contextvars import copy_context
+from functools import cache, partial
 from typing import TYPE_CHECKING, Any
 
 from boto3 import Session
@@ -13,8 +18,9 @@ from samtranslator.intrinsics.resolver import IntrinsicsResolver
 from samtranslator.intrinsics.resource_refs import SupportedResourceReferences
 from samtranslator.metrics.method_decorator import MetricsMethodWrapperSingleton
 from samtranslator.metrics.metrics import DummyMetricsPublisher, Metrics
-from samtranslator.model import Resource, ResourceResolver, ResourceTypeResolver, sam_resources
+from samtranslator.model import Resource, ResourceResolver, ResourceTypeResolver, SamResourceMacro, sam_resources
 from samtranslator.model.api.api_generator import SharedApiUsagePlan
+from samtranslator.model.eventsources.pull import MQ, MSK, SQS, DocumentDB, DynamoDB, Kinesis, SelfManagedKafka
 from samtranslator.model.eventsources.push import Api
 from samtranslator.model.exceptions import (
     DuplicateLogicalIdException,
@@ -25,7 +31,10 @@ from samtranslator.model.exceptions import (
     InvalidTemplateException,
 )
 from samtranslator.model.preferences.deployment_preference_collection import DeploymentPreferenceCollection
+from samtranslator.model.role_utils.role_constructor import role_construction_cache
+from samtranslator.model.role_utils.shared_policies import share_identical_inline_policies
 from samtranslator.model.sam_resources import SamConnector
+from samtranslator.open_api.base_editor import editor_session, enable_resource_policy_statement_merging
 from samtranslator.parser.parser import Parser
 from samtranslator.plugins import BasePlugin, LifeCycleEvents
 from samtranslator.plugins.api.default_definition_body_plugin import DefaultDefinitionBodyPlugin
@@ -36,11 +45,31 @@ from samtranslator.plugins.sam_plugins import SamPlugins
 from samtranslator.policy_template_processor.processor import PolicyTemplatesProcessor
 from samtranslator.sdk.parameter import SamParameterValues
 from samtranslator.translator.arn_generator import ArnGenerator
+from samtranslator.translator.condition_folding import fold_known_conditions
+from samtranslator.translator.logical_id_generator import canonical_json_cache
 from samtranslator.translator.verify_logical_id import verify_unique_logical_id
 from samtranslator.utils.actions import ResolveDependsOn
+from samtranslator.utils.py27hash_fix import copy_keeping_py27_order
 from samtranslator.utils.traverse import traverse
 from samtranslator.validator.value_validator import sam_expect
 
+# SAM resource types whose translation only reads their own properties (and the read-only resolvers), so they
+# can be converted alongside each other without observing each other's side effects.
+_SELF_CONTAINED_RESOURCE_TYPES = frozenset(
+    [
+        "AWS::Serverless::Function",
+        "AWS::Serverless::LayerVersion",
+        "AWS::Serverless::SimpleTable",
+        "AWS::Serverless::Application",
+    ]
+)
+_PULL_EVENT_TYPES = frozenset(
+    event.resource_type for event in (Kinesis, DynamoDB, SQS, MSK, MQ, SelfManagedKafka, DocumentDB)
+)
+# Function properties that make the translation reach into state shared with other resources
+# (deployment preference collection, template conditions)
+_SHARED_STATE_FUNCTION_PROPERTIES = ("DeploymentPreference", "EventInvokeConfig")
+
 
 class Translator:
     """Translates SAM templates into CloudFormation templates"""
@@ -52,14 +81,19 @@ class Translator:
         plugins: list[BasePlugin] | None = None,
         boto_session: Session | None = None,
         metrics: Metrics | None = None,
+        max_workers: int | None = None,
     ) -> None:
         """
         :param dict managed_policy_map: Map of managed policy names to the ARNs
         :param sam_parser: Instance of a SAM Parser
         :param list of samtranslator.plugins.BasePlugin plugins: list of plugins to be installed in the translator,
             in addition to the default ones.
+        :param int max_workers: when greater than 1, resources that don't depend on any other resource are
+            converted on a pool of this many threads. Results are merged in the usual processing order, so the
+            output is identical to a sequential translation.
         """
         self.managed_policy_map = managed_policy_map
+        self.max_workers = max_workers
         self.plugins = plugins
         self.sam_parser = sam_parser
         self.feature_toggle: FeatureToggle | None = None
@@ -67,6 +101,12 @@ class Translator:
         self.metrics = metrics if metrics else Metrics("ServerlessTransform", DummyMetricsPublisher())
         MetricsMethodWrapperSingleton.set_instance(self.metrics)
         self.document_errors: list[ExceptionWithMessage] = []
+        # Logical IDs of the resources generated from each SAM resource by the last translation, which
+        # NestedStackSplitter keeps together
+        self.generated_resource_ids: dict[str, list[str]] = {}
+        # Types of the plugins whose before_transform_template hooks already ran on the template, along with its
+        # validation, when it is translated by translate_variants()
+        self._prepared_plugin_types: tuple[type[BasePlugin], ...] = ()
 
         if self.boto_session:
             ArnGenerator.BOTO_SESSION_REGION_NAME = self.boto_session.region_name
@@ -102,13 +142,19 @@ class Translator:
                     self.function_names[api_name].append(str(resolved_function_name))
         return {api: "".join(names) for api, names in self.function_names.items()}
 
-    def translate(  # noqa: PLR0912, PLR0915
+    @canonical_json_cache()
+    @role_construction_cache()
+    @editor_session()
+    def translate(  # noqa: PLR0912, PLR0913, PLR0915
         self,
         sam_template: dict[str, Any],
         parameter_values: dict[str, Any],
         feature_toggle: FeatureToggle | None = None,
         passthrough_metadata: bool | None = False,
         get_managed_policy_map: GetManagedPolicyMap | None = None,
+        deduplicate_policies: bool | None = False,
+        merge_resource_policy_statements: bool | None = False,
+        fold_conditions: bool | None = False,
     ) -> dict[str, Any]:
         """Loads the SAM resources from the given SAM manifest, replaces them with their corresponding
         CloudFormation resources, and returns the resulting CloudFormation template.
@@ -120,6 +166,14 @@ class Translator:
                 that some functionality that relies on resolving parameter references might not work as expected
                 (ex: auto-creating new Lambda Version when CodeUri contains reference to template parameter). This is
                 why this parameter is required
+        :param bool deduplicate_policies: whether inline policies that are identical across the generated IAM roles
+                are replaced with a shared AWS::IAM::ManagedPolicy, to reduce the size of the template
+        :param bool merge_resource_policy_statements: whether the statements generated for the ResourcePolicy of
+                the paths of an API are merged into one statement for all the paths they apply to, to reduce the size
+                of its resource policy
+        :param bool fold_conditions: whether the conditions whose value is known from the given parameter values are
+                evaluated before the translation, removing the resources, outputs and Fn::If branches they exclude.
+                Conditions that depend on parameters without a given value are kept
 
         :returns: a copy of the template with SAM resources replaced with the corresponding CloudFormation, which may \
                 be dumped into a valid CloudFormation JSON or YAML template
@@ -127,8 +181,13 @@ class Translator:
         self.feature_toggle = feature_toggle or FeatureToggle(
             FeatureToggleDefaultConfigProvider(), stage=None, account_id=None, region=None
         )
+        if merge_resource_policy_statements:
+            enable_resource_policy_statement_merging()
+        if fold_conditions:
+            self.metrics.record_count("FoldedConditions", fold_known_conditions(sam_template, parameter_values))
         self.function_names: dict[Any, Any] = {}
         self.redeploy_restapi_parameters = {}
+        self.generated_resource_ids = {}
         sam_parameter_values = SamParameterValues(parameter_values)
         sam_parameter_values.add_default_parameter_values(sam_template)
         sam_parameter_values.add_pseudo_parameter_values(self.boto_session)
@@ -136,7 +195,12 @@ class Translator:
         # Create & Install plugins
         sam_plugins = prepare_plugins(self.plugins, parameter_values)
 
-        self.sam_parser.parse(sam_template=sam_template, parameter_values=parameter_values, sam_plugins=sam_plugins)
+        if self._prepared_plugin_types:
+            SamPlugins([plugin for plugin in sam_plugins if not isinstance(plugin, self._prepared_plugin_types)]).act(
+                LifeCycleEvents.before_transform_template, sam_template
+            )
+        else:
+            self.sam_parser.parse(sam_template=sam_template, parameter_values=parameter_values, sam_plugins=sam_plugins)
 
         # replaces Connectors attributes with serverless Connector resources
         resources = sam_template.get("Resources", {})
@@ -145,8 +209,9 @@ class Translator:
         resources.update(connector_resources)
         self._delete_connectors_attribute(resources)
 
-        template = copy.deepcopy(sam_template)
         macro_resolver = ResourceTypeResolver(sam_resources)
+        resources_to_translate = self._get_resources_to_iterate(sam_template, macro_resolver)
+        template = self._copy_template(sam_template, resources_to_translate)
         intrinsics_resolver = IntrinsicsResolver(parameter_values)
 
         # ResourceResolver is used by connector, its "resources" will be
@@ -160,56 +225,75 @@ class Translator:
         deployment_preference_collection = DeploymentPreferenceCollection()
         supported_resource_refs = SupportedResourceReferences()
         shared_api_usage_plan = SharedApiUsagePlan()
-        changed_logical_ids = {}
+        changed_logical_ids: dict[str, str] = {}
         route53_record_set_groups: dict[Any, Any] = {}
-        for logical_id, resource_dict in self._get_resources_to_iterate(sam_template, macro_resolver):
-            try:
-                macro = macro_resolver.resolve_resource_type(resource_dict).from_dict(
-                    logical_id, resource_dict, sam_plugins=sam_plugins
-                )
+        # Conversions running on the worker pool, in processing order. They are merged back before any other
+        # resource is converted on this thread.
+        pending: list[tuple[str, dict[str, Any], SamResourceMacro, Future[list[Resource]]]] = []
+        with self._resource_executor() as executor:
+            for logical_id, resource_dict in resources_to_translate:
+                try:
+                    macro = macro_resolver.resolve_resource_type(resource_dict).from_dict(
+                        logical_id, resource_dict, sam_plugins=sam_plugins
+                    )
 
-                kwargs = macro.resources_to_link(sam_template["Resources"])
-                kwargs["managed_policy_map"] = self.managed_policy_map
-                kwargs["get_managed_policy_map"] = get_managed_policy_map
-                kwargs["intrinsics_resolver"] = intrinsics_resolver
-                kwargs["mappings_resolver"] = mappings_resolver
-                kwargs["deployment_preference_collection"] = deployment_preference_collection
-                kwargs["conditions"] = template.get("Conditions")
-                kwargs["resource_resolver"] = resource_resolver
-                kwargs["original_template"] = sam_template
-                # add the value of FunctionName property if the function is referenced with the api resource
-                self.redeploy_restapi_parameters["function_names"] = self._get_function_names(
-                    resource_dict, intrinsics_resolver
-                )
-                kwargs["redeploy_restapi_parameters"] = self.redeploy_restapi_parameters
-                kwargs["shared_api_usage_plan"] = shared_api_usage_plan
-                kwargs["feature_toggle"] = self.feature_toggle
-                kwargs["route53_record_set_groups"] = route53_record_set_groups
-                translated = macro.to_cloudformation(**kwargs)
-                supported_resource_refs = macro.get_resource_references(translated, supported_resource_refs)
-
-                # Some resources mutate their logical ids. Track those to change all references to them:
-                if logical_id != macro.logical_id:
-                    changed_logical_ids[logical_id] = macro.logical_id
-
-                del template["Resources"][logical_id]
-                for resource in translated:
-                    if verify_unique_logical_id(resource, sam_template["Resources"]):
-                        # For each generated resource, pass through existing metadata that may exist on the original SAM resource.
-                        _r = resource.to_dict()
-                        if (
-                            resource_dict.get("Metadata")
-                            and passthrough_metadata
-                            and not template["Resources"].get(resource.logical_id)
-                        ):
-                            _r[resource.logical_id]["Metadata"] = resource_dict["Metadata"]
-                        template["Resources"].update(_r)
-                    else:
-                        self.document_errors.append(
-                            DuplicateLogicalIdException(logical_id, resource.logical_id, resource.resource_type)
-                        )
-            except (InvalidResourceException, InvalidEventException, InvalidTemplateException) as e:
-                self.document_errors.append(e)
+                    kwargs = macro.resources_to_link(sam_template["Resources"])
+                    kwargs["managed_policy_map"] = self.managed_policy_map
+                    kwargs["get_managed_policy_map"] = get_managed_policy_map
+                    kwargs["intrinsics_resolver"] = intrinsics_resolver
+                    kwargs["mappings_resolver"] = mappings_resolver
+                    kwargs["deployment_preference_collection"] = deployment_preference_collection
+                    kwargs["conditions"] = template.get("Conditions")
+                    kwargs["resource_resolver"] = resource_resolver
+                    kwargs["original_template"] = sam_template
+                    # add the value of FunctionName property if the function is referenced with the api resource
+                    self.redeploy_restapi_parameters["function_names"] = self._get_function_names(
+                        resource_dict, intrinsics_resolver
+                    )
+                    kwargs["redeploy_restapi_parameters"] = self.redeploy_restapi_parameters
+                    kwargs["shared_api_usage_plan"] = shared_api_usage_plan
+                    kwargs["feature_toggle"] = self.feature_toggle
+                    kwargs["route53_record_set_groups"] = route53_record_set_groups
+
+                    if executor and self._is_self_contained(resource_dict, kwargs):
+                        future = executor.submit(copy_context().run, partial(macro.to_cloudformation, **kwargs))
+                        pending.append((logical_id, resource_dict, macro, future))
+                        continue
+
+                    self._merge_pending_resources(
+                        pending,
+                        template,
+                        sam_template,
+                        supported_resource_refs,
+                        changed_logical_ids,
+                        passthrough_metadata,
+                    )
+                    translated = macro.to_cloudformation(**kwargs)
+                    self._merge_translated_resources(
+                        logical_id,
+                        resource_dict,
+                        macro,
+                        translated,
+                        template,
+                        sam_template,
+                        supported_resource_refs,
+                        changed_logical_ids,
+                        passthrough_metadata,
+                    )
+                except (InvalidResourceException, InvalidEventException, InvalidTemplateException) as e:
+                    self._merge_pending_resources(
+                        pending,
+                        template,
+                        sam_template,
+                        supported_resource_refs,
+                        changed_logical_ids,
+                        passthrough_metadata,
+                    )
+                    self.document_errors.append(e)
+
+            self._merge_pending_resources(
+                pending, template, sam_template, supported_resource_refs, changed_logical_ids, passthrough_metadata
+            )
 
         if deployment_preference_collection.any_enabled():
             template["Resources"].update(deployment_preference_collection.get_codedeploy_application().to_dict())
@@ -229,6 +313,9 @@ class Translator:
                 except InvalidResourceException as e:
                     self.document_errors.append(e)
 
+        if deduplicate_policies:
+            self._share_identical_policies(template)
+
         # Run the after-transform plugin target
         try:
             sam_plugins.act(LifeCycleEvents.after_transform_template, template)
@@ -246,7 +333,317 @@ class Translator:
             return intrinsics_resolver.resolve_sam_resource_refs(template, supported_resource_refs)
         raise InvalidDocumentException(self.document_errors)
 
+    def translate_variants(  # noqa: PLR0913
+        self,
+        sam_template: dict[str, Any],
+        parameter_values_list: list[dict[str, Any]],
+        feature_toggle: FeatureToggle | None = None,
+        passthrough_metadata: bool | None = False,
+        get_managed_policy_map: GetManagedPolicyMap | None = None,
+        max_workers: int | None = None,
+        deduplicate_policies: bool | None = False,
+        merge_resource_policy_statements: bool | None = False,
+        fold_conditions: bool | None = False,
+    ) -> list[dict[str, Any]]:
+        """Translates the same SAM template once for each of the given parameter values, such as the values of each
+        stage or the AWS::Region and AWS::Partition pseudo parameters of each region. Each result is identical to the
+        one of translate() with these parameter values.
+
+        The work that doesn't depend on parameter values is done once: validating the template, merging Globals,
+        adding the implicit APIs and expanding policy templates. Only the resources are translated for each variant.
+        With plugins other than ServerlessAppPlugin, or a custom parser, each variant is translated from scratch, since
+        they may depend on parameter values. So is each variant when conditions are folded, since the resources left
+        to prepare depend on the parameter values.
+
+        Pseudo parameters only change the intrinsic functions they resolve. Behavior that depends on the region of
+        the boto session, such as the partition of the ARNs of managed policies, is the same for all variants.
+
+        :param dict sam_template: the SAM manifest. It isn't modified
+        :param list parameter_values_list: map of template parameter names to their values, for each variant
+        :param int max_workers: when greater than 1, variants are translated on a pool of this many threads. Plugins
+                given to the translator are then shared between threads.
+        :param bool deduplicate_policies: same as for translate()
+        :param bool merge_resource_policy_statements: same as for translate()
+        :param bool fold_conditions: same as for translate()
+        :raises InvalidDocumentException: if the template is invalid for a variant. The error of the first such
+                variant is raised
+        :returns: the translated templates, in the order of the parameter values
+        """
+        template = copy_keeping_py27_order(sam_template)
+        prepared_plugin_types: tuple[type[BasePlugin], ...] = ()
+        if (
+            type(self.sam_parser) is Parser
+            and all(isinstance(plugin, ServerlessAppPlugin) for plugin in self.plugins or [])
+            and not fold_conditions
+        ):
+            prepared_plugin_types = self._prepare_variants_template(template)
+
+        def translate_variant(parameter_values: dict[str, Any]) -> dict[str, Any]:
+            # translate() keeps the state of the translation on the translator
+            translator = copy.copy(self)
+            translator.document_errors = []
+            translator._prepared_plugin_types = prepared_plugin_types
+            return translator.translate(
+                copy_keeping_py27_order(template),
+                parameter_values,
+                feature_toggle=feature_toggle,
+                passthrough_metadata=passthrough_metadata,
+                get_managed_policy_map=get_managed_policy_map,
+                deduplicate_policies=deduplicate_policies,
+                merge_resource_policy_statements=merge_resource_policy_statements,
+                fold_conditions=fold_conditions,
+            )
+
+        if not max_workers or max_workers <= 1:
+            return [translate_variant(parameter_values) for parameter_values in parameter_values_list]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(copy_context().run, translate_variant, parameter_values)
+                for parameter_values in parameter_values_list
+            ]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def _prepare_variants_template(template: dict[str, Any]) -> tuple[type[BasePlugin], ...]:
+        """
+        Validates the template and runs the hooks of the required plugins that don't depend on parameter values.
+
+        :param dict template: SAM template, modified in place
+        :returns: the types of the plugins whose before_transform_template hooks ran
+        """
+        Parser.validate_datatypes(template)  # type: ignore[no-untyped-call]
+        template_plugins = [
+            DefaultDefinitionBodyPlugin(),
+            make_implicit_rest_api_plugin(),
+            make_implicit_http_api_plugin(),
+            GlobalsPlugin(),
+        ]
+        SamPlugins(template_plugins).act(LifeCycleEvents.before_transform_template, template)
+
+        # Expanded policy templates are regular policy statements, which the plugin leaves as they are when it runs
+        # again for each variant
+        policy_templates_plugin = make_policy_template_for_function_plugin()
+        for logical_id, resource in template["Resources"].items():
+            if isinstance(resource.get("Type"), str) and isinstance(resource.get("Properties"), dict):
+                # Invalid policy templates are reported by the translation of each variant
+                with suppress(InvalidResourceException):
+                    policy_templates_plugin.on_before_transform_resource(
+                        logical_id, resource.get("Type"), resource["Properties"]
+                    )
+        return tuple(type(plugin) for plugin in template_plugins)
+
+    def validate(
+        self,
+        sam_template: dict[str, Any],
+        parameter_values: dict[str, Any],
+        feature_toggle: FeatureToggle | None = None,
+    ) -> None:
+        """Validates the given SAM manifest the way translate() does, without generating the CloudFormation resources.
+
+        This runs the template validation, the plugins that prepare the template (ex: Globals, implicit APIs, policy
+        templates), the validation of the properties of each SAM resource and its events, and the checks of the
+        references between resources. The validations done while generating resources (ex: of OpenAPI definitions,
+        IAM policies or deployment preferences) are skipped, as are the calls to the Serverless Application
+        Repository, so a template that passes may still fail to translate. A template that translates always passes.
+
+        The given template is not modified.
+
+        :param dict sam_template: the SAM manifest, as loaded by json.load() or yaml.load(), or as provided by \
+                CloudFormation transforms.
+        :param dict parameter_values: Map of template parameter names to their values
+        :raises InvalidDocumentException: with all the errors found in the template
+        """
+        self.feature_toggle = feature_toggle or FeatureToggle(
+            FeatureToggleDefaultConfigProvider(), stage=None, account_id=None, region=None
+        )
+        self.document_errors = []
+        sam_template = copy.deepcopy(sam_template)
+        sam_parameter_values = SamParameterValues(parameter_values)
+        sam_parameter_values.add_default_parameter_values(sam_template)
+        sam_parameter_values.add_pseudo_parameter_values(self.boto_session)
+        parameter_values = sam_parameter_values.parameter_values
+        sam_plugins = prepare_plugins(self.plugins, parameter_values, include_serverless_app_plugin=False)
+
+        self.sam_parser.parse(sam_template=sam_template, parameter_values=parameter_values, sam_plugins=sam_plugins)
+
+        resources = sam_template.get("Resources", {})
+        resources.update(self._update_resources(self._get_embedded_connectors(resources)))
+        self._delete_connectors_attribute(resources)
+
+        macro_resolver = ResourceTypeResolver(sam_resources)
+        for logical_id, resource_dict in self._get_resources_to_iterate(sam_template, macro_resolver):
+            try:
+                macro = macro_resolver.resolve_resource_type(resource_dict).from_dict(
+                    logical_id, resource_dict, sam_plugins=sam_plugins
+                )
+                macro.resources_to_link(sam_template["Resources"])
+                macro.validate_only()
+            except (InvalidResourceException, InvalidEventException, InvalidTemplateException) as e:
+                self.document_errors.append(e)
+
+        document_errors, self.document_errors = self.document_errors, []
+        if document_errors:
+            raise InvalidDocumentException(document_errors)
+
     # private methods
+    @contextmanager
+    def _resource_executor(self) -> Iterator[ThreadPoolExecutor | None]:
+        """
+        Yields the worker pool used to convert self-contained resources, or None when resources are converted
+        sequentially.
+        """
+        if not self.max_workers or self.max_workers <= 1:
+            yield None
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield executor
+
+    @staticmethod
+    def _is_self_contained(resource_dict: dict[str, Any], kwargs: dict[str, Any]) -> bool:
+        """
+        Checks whether converting the given resource neither reads nor modifies any other resource of the template,
+        i.e. whether it has no edge in the dependency graph formed by linked resources, API event targets and
+        connectors. Such resources can be converted concurrently with each other.
+
+        :param dict resource_dict: SAM resource as it appears in the template
+        :param dict kwargs: keyword arguments for the resource's ``to_cloudformation``, including linked resources
+        :return: True if the resource can be converted on the worker pool
+        """
+        if resource_dict["Type"] not in _SELF_CONTAINED_RESOURCE_TYPES:
+            return False
+        if resource_dict["Type"] != "AWS::Serverless::Function":
+            return True
+
+        properties = resource_dict.get("Properties") or {}
+        if any(properties.get(name) for name in _SHARED_STATE_FUNCTION_PROPERTIES):
+            return False
+        # A Role with Fn::If adds a condition to the template
+        if isinstance(properties.get("Role"), dict):
+            return False
+        # Only pull events are confined to the function and its role; every other event modifies
+        # (or is linked to) another resource.
+        events = properties.get("Events") or {}
+        if any(not isinstance(event, dict) or event.get("Type") not in _PULL_EVENT_TYPES for event in events.values()):
+            return False
+        return not any(kwargs.get("event_resources", {}).values())
+
+    def _share_identical_policies(self, template: dict[str, Any]) -> None:
+        """
+        Moves the inline policies that are identical across the generated IAM roles to shared managed policies, and
+        records how many bytes that saved.
+        """
+        role_logical_ids = [
+            logical_id for logical_ids in self.generated_resource_ids.values() for logical_id in logical_ids
+        ]
+        saved_bytes = share_identical_inline_policies(template["Resources"], role_logical_ids)
+        self.metrics.record_size("DeduplicatedPolicyBytes", saved_bytes)
+
+    def _merge_pending_resources(
+        self,
+        pending: list[tuple[str, dict[str, Any], SamResourceMacro, Future[list[Resource]]]],
+        template: dict[str, Any],
+        sam_template: dict[str, Any],
+        supported_resource_refs: SupportedResourceReferences,
+        changed_logical_ids: dict[str, str],
+        passthrough_metadata: bool | None,
+    ) -> None:
+        """
+        Waits for the conversions running on the worker pool and merges them into the template in the order they
+        were submitted, recording their errors just like a sequential translation would.
+        """
+        for logical_id, resource_dict, macro, future in pending:
+            try:
+                translated = future.result()
+                self._merge_translated_resources(
+                    logical_id,
+                    resource_dict,
+                    macro,
+                    translated,
+                    template,
+                    sam_template,
+                    supported_resource_refs,
+                    changed_logical_ids,
+                    passthrough_metadata,
+                )
+            except (InvalidResourceException, InvalidEventException, InvalidTemplateException) as e:
+                self.document_errors.append(e)
+        pending.clear()
+
+    def _merge_translated_resources(  # noqa: PLR0913
+        self,
+        logical_id: str,
+        resource_dict: dict[str, Any],
+        macro: SamResourceMacro,
+        translated: list[Resource],
+        template: dict[str, Any],
+        sam_template: dict[str, Any],
+        supported_resource_refs: SupportedResourceReferences,
+        changed_logical_ids: dict[str, str],
+        passthrough_metadata: bool | None,
+    ) -> None:
+        """
+        Replaces the SAM resource in the template with the CloudFormation resources it was converted to.
+        """
+        macro.get_resource_references(translated, supported_resource_refs)  # type: ignore[no-untyped-call]
+
+        # Some resources mutate their logical ids. Track those to change all references to them:
+        if logical_id != macro.logical_id:
+            changed_logical_ids[logical_id] = macro.logical_id
+
+        del template["Resources"][logical_id]
+        self.generated_resource_ids[macro.logical_id] = [resource.logical_id for resource in translated]
+        for resource in translated:
+            if verify_unique_logical_id(resource, sam_template["Resources"]):
+                # For each generated resource, pass through existing metadata that may exist on the original SAM resource.
+                _r = resource.to_dict()
+                if (
+                    resource_dict.get("Metadata")
+                    and passthrough_metadata
+                    and not template["Resources"].get(resource.logical_id)
+                ):
+                    _r[resource.logical_id]["Metadata"] = resource_dict["Metadata"]
+                template["Resources"].update(_r)
+            else:
+                self.document_errors.append(
+                    DuplicateLogicalIdException(logical_id, resource.logical_id, resource.resource_type)
+                )
+
+    @staticmethod
+    def _copy_template(
+        sam_template: dict[str, Any], resources_to_translate: list[tuple[str, dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """
+        Copies the template that the translated resources are written to.
+
+        The properties of the SAM resources that get translated are shared with the SAM template instead of being
+        copied: they are only read until the resource is replaced by its translation, and they are usually the
+        bulk of the template (definition bodies, inline code, ...). Everything else is deep copied, with a single
+        memo so that objects shared within the template stay shared within the copy.
+
+        :param dict sam_template: SAM template
+        :param list resources_to_translate: (logical id, resource) of the resources that will be translated
+        :return dict: copy of the template
+        """
+        memo: dict[int, Any] = {}
+        translated_resources = {id(resource) for _, resource in resources_to_translate}
+
+        template: dict[str, Any] = {}
+        for key, value in sam_template.items():
+            if key != "Resources":
+                template[key] = copy.deepcopy(value, memo)
+                continue
+            template[key] = resources = {}
+            for logical_id, resource in value.items():
+                if id(resource) not in translated_resources:
+                    resources[logical_id] = copy.deepcopy(resource, memo)
+                    continue
+                resources[logical_id] = {
+                    attribute: attribute_value if attribute == "Properties" else copy.deepcopy(attribute_value, memo)
+                    for attribute, attribute_value in resource.items()
+                }
+        return template
+
     def _get_resources_to_iterate(
         self, sam_template: dict[str, Any], macro_resolver: ResourceTypeResolver
     ) -> list[tuple[str, dict[str, Any]]]:
@@ -378,15 +775,20 @@ class Translator:
         :param dict connector_dict: The properties of the connector including the Destination, Permissions and optionally the SourceReference
         :return: The generated SAMConnector resource
         """
-        connector = copy.deepcopy(connector_dict)
+        # Only the dictionaries that are modified below are copied. The rest is shared with the Connectors
+        # attribute, which gets removed from the template once the connectors are generated.
+        connector = dict(connector_dict)
         connector["Type"] = SamConnector.resource_type
 
-        properties = sam_expect(
-            connector.get("Properties"),
-            source_logical_id,
-            f"Connectors.{connector_logical_id}.Properties",
-            is_resource_attribute=True,
-        ).to_be_a_map()
+        properties = dict(
+            sam_expect(
+                connector.get("Properties"),
+                source_logical_id,
+                f"Connectors.{connector_logical_id}.Properties",
+                is_resource_attribute=True,
+            ).to_be_a_map()
+        )
+        connector["Properties"] = properties
 
         properties["Source"] = {"Id": source_logical_id}
         if "SourceReference" in properties:
@@ -406,13 +808,19 @@ class Translator:
         return SamConnector.from_dict(full_connector_logical_id, connector)
 
 
-def prepare_plugins(plugins: list[BasePlugin] | None, parameters: dict[str, Any] | None = None) -> SamPlugins:
+def prepare_plugins(
+    plugins: list[BasePlugin] | None,
+    parameters: dict[str, Any] | None = None,
+    include_serverless_app_plugin: bool = True,
+) -> SamPlugins:
     """
     Creates & returns a plugins object with the given list of plugins installed. In addition to the given plugins,
     we will also install a few "required" plugins that are necessary to provide complete support for SAM template spec.
 
     :param plugins: list of samtranslator.plugins.BasePlugin plugins: list of plugins to install
     :param parameters: Dictionary of parameter values
+    :param include_serverless_app_plugin: whether to install a ServerlessAppPlugin, which calls the Serverless
+        Application Repository. When False, the ones in the given plugins are left out too.
     :return samtranslator.plugins.SamPlugins: Instance of `SamPlugins`
     """
 
@@ -428,8 +836,10 @@ def prepare_plugins(plugins: list[BasePlugin] | None, parameters: dict[str, Any]
 
     plugins = plugins or []
 
+    if not include_serverless_app_plugin:
+        plugins = [plugin for plugin in plugins if not isinstance(plugin, ServerlessAppPlugin)]
     # If a ServerlessAppPlugin does not yet exist, create one and add to the beginning of the required plugins list.
-    if not any(isinstance(plugin, ServerlessAppPlugin) for plugin in plugins):
+    elif not any(isinstance(plugin, ServerlessAppPlugin) for plugin in plugins):
         required_plugins.insert(0, ServerlessAppPlugin(parameters=parameters))
 
     # Execute customer's plugins first before running SAM plugins. It is very important to retain this order because
@@ -463,6 +873,14 @@ def make_policy_template_for_function_plugin() -> PolicyTemplatesForResourcePlug
     :return plugins.policies.policy_templates_plugin.PolicyTemplatesForResourcePlugin: Instance of the plugin
     """
 
+    return PolicyTemplatesForResourcePlugin(_get_default_policy_templates_processor())
+
+
+@cache
+def _get_default_policy_templates_processor() -> PolicyTemplatesProcessor:
+    """
+    Returns the processor of the default policy templates. Validating the templates against their schema is costly
+    compared to the translation of small templates, so it is only done once. The processor is read-only.
+    """
     policy_templates = PolicyTemplatesProcessor.get_default_policy_templates_json()
-    processor = PolicyTemplatesProcessor(policy_templates)
-    return PolicyTemplatesForResourcePlugin(processor)
+    return PolicyTemplatesProcessor(policy_templates)
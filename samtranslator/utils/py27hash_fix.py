@@ -174,8 +174,18 @@ class Py27Keys:  # noqa: PLW1641
         self.size = 0  # current size of the keys, equivalent to ma_used in dictobject.c
         self.fill = 0  # increment count when a key is added, equivalent to ma_fill in dictobject.c
         self.mask = MINSIZE - 1  # Python2 default dict size
+        # True once adding the keys again in iteration order is known to give this exact key table
+        self.readd_unchanged = False
 
     def __deepcopy__(self, memo):  # type: ignore[no-untyped-def]
+        if self.readd_unchanged:
+            # Same result as adding the keys again, which is the case for most dicts
+            ret = Py27Keys()
+            ret.keyorder = dict(self.keyorder)
+            ret.size, ret.fill, ret.mask = self.size, self.fill, self.mask
+            ret.readd_unchanged = True
+            return ret
+
         # add keys in the py2 order -- we can't do a straigh-up deep copy of keyorder because
         # in py2 copy.deepcopy of a dict may result in reordering of the keys
         ret = Py27Keys()
@@ -183,6 +193,8 @@ class Py27Keys:  # noqa: PLW1641
             if k is self.DUMMY:
                 continue
             ret.add(copy.deepcopy(k, memo))  # type: ignore[no-untyped-call]
+        if ret.mask == self.mask and ret.fill == self.fill and ret.keyorder == self.keyorder:
+            self.readd_unchanged = ret.readd_unchanged = True
         return ret
 
     def _get_key_idx(self, k):  # type: ignore[no-untyped-def]
@@ -226,6 +238,7 @@ class Py27Keys:  # noqa: PLW1641
 
         self.mask = newsize - 1
 
+        self.readd_unchanged = False
         # Reset key list to simulate the dict resize and copy operation
         oldkeyorder = copy.copy(self.keyorder)
         self.keyorder = {}
@@ -237,6 +250,7 @@ class Py27Keys:  # noqa: PLW1641
 
     def remove(self, key):  # type: ignore[no-untyped-def]
         """Removes key"""
+        self.readd_unchanged = False
         i = self._get_key_idx(key)  # type: ignore[no-untyped-call]
         if i in self.keyorder and self.keyorder[i] is not self.DUMMY:
             self.keyorder[i] = self.DUMMY
@@ -244,6 +258,7 @@ class Py27Keys:  # noqa: PLW1641
 
     def add(self, key):  # type: ignore[no-untyped-def]
         """Adds key"""
+        self.readd_unchanged = False
         start_size = self.size
         i = self._get_key_idx(key)  # type: ignore[no-untyped-call]
         if i not in self.keyorder:
@@ -579,6 +594,167 @@ class Py27Dict(dict):  # type: ignore[type-arg]
         return self[key]
 
 
+def copy_keeping_py27_order(data: Any) -> Any:
+    """
+    Deep copies dict and list values, keeping the iteration order of Py27Dict. Unlike ``copy.deepcopy``, which
+    re-inserts the keys of a Py27Dict the way Python2.7 did and may reorder them, the copy iterates, and so
+    stringifies and hashes, exactly like the original.
+
+    Parameters
+    ----------
+    data: Any
+        Value to copy. Values other than dict, list and Py27Dict are copied with ``copy.deepcopy``
+
+    Returns
+    -------
+    Any
+        Copy of data
+    """
+    if isinstance(data, Py27Dict):
+        result = Py27Dict.__new__(type(data))
+        keylist = Py27Keys.__new__(Py27Keys)
+        keylist.__dict__.update(data.keylist.__dict__)
+        keylist.keyorder = dict(data.keylist.keyorder)
+        result.keylist = keylist
+        for key, value in dict.items(data):
+            dict.__setitem__(result, key, copy_keeping_py27_order(value))
+        return result
+    if type(data) is dict:
+        return {key: copy_keeping_py27_order(value) for key, value in data.items()}
+    if type(data) is list:
+        return [copy_keeping_py27_order(item) for item in data]
+    return copy.deepcopy(data)
+
+
+def copy_sharing_unchanged(data: Any, unchanged: dict[int, Any] | None = None) -> Any:
+    """
+    Returns a value that iterates, and so stringifies and hashes, like ``copy.deepcopy(data)``. Only the dicts and lists
+    leading to a Py27Dict whose keys the deep copy would reorder are copied, everything else is shared with data.
+
+    Parameters
+    ----------
+    data: Any
+        Value to copy
+    unchanged: dict
+        Dicts and lists known to be shared unchanged, by id. The ones found in data are added, and must not be
+        modified afterwards.
+
+    Returns
+    -------
+    Any
+        data, or a copy of it
+    """
+    if unchanged is None:
+        unchanged = {}
+    copies: dict[int, Any] = {}
+
+    def _copy(value: Any) -> Any:
+        if not isinstance(value, (dict, list)) or id(value) in unchanged:
+            return value
+        if id(value) in copies:
+            return copies[id(value)]
+
+        changed = {}
+        for key, item in dict.items(value) if isinstance(value, dict) else enumerate(value):
+            copied_item = _copy(item)
+            if copied_item is not item:
+                changed[key] = copied_item
+
+        result = value
+        if isinstance(value, Py27Dict):
+            keylist = value.keylist if value.keylist.readd_unchanged else copy.deepcopy(value.keylist)
+            if changed or not keylist.readd_unchanged:
+                result = Py27Dict.__new__(type(value))
+                result.keylist = keylist
+                for key, item in dict.items(value):
+                    dict.__setitem__(result, key, changed.get(key, item))
+        elif changed and isinstance(value, dict):
+            result = {key: changed.get(key, item) for key, item in value.items()}
+        elif changed:
+            result = [changed.get(index, item) for index, item in enumerate(value)]
+
+        if result is value:
+            unchanged[id(value)] = value
+        else:
+            copies[id(value)] = result
+        return result
+
+    return _copy(data)
+
+
+_STR_CHUNKS_CONTAINER_TYPES = (dict, list, Py27Dict)
+
+
+def iter_str_chunks(data: Any, chunk_size: int = 65536) -> Iterator[str]:  # noqa: PLR0912
+    """
+    Yields ``str(data)`` in chunks of roughly ``chunk_size`` characters, without building the whole string.
+    Concatenating the chunks gives exactly ``str(data)``, including the Python2.7 style output of Py27Dict,
+    so the chunks can be fed into a hash in place of the full string.
+
+    Parameters
+    ----------
+    data: Any
+        Object to stringify. dict, list and Py27Dict are walked, any other value is stringified as a whole
+    chunk_size: int
+        Number of characters to collect before yielding a chunk
+
+    Returns
+    -------
+    iterator
+        chunks of ``str(data)``
+    """
+    pieces: list[str] = []
+    size = 0
+    # Work items are (value, mode) where mode is "str" or "repr" to stringify the value, or None for a literal
+    stack: list[tuple[Any, str | None]] = [(data, "str")]
+    while stack:
+        value, mode = stack.pop()
+        value_type = type(value)
+        if mode is None:
+            piece = value
+        elif value_type in _STR_CHUNKS_CONTAINER_TYPES:
+            work: list[tuple[Any, str | None]] = []
+            separator = "[" if value_type is list else "{"
+            for item in value:
+                if value_type is list:
+                    work.append((separator, None))
+                    item_value, item_mode = item, "repr"
+                elif value_type is dict:
+                    work.append((separator + repr(item) + ": ", None))
+                    item_value, item_mode = value[item], "repr"
+                else:
+                    # Same as Py27Dict.__str__
+                    key_str = repr(item) if isinstance(item, ("".__class__, bytes)) else f"{item}"
+                    work.append((separator + key_str + ": ", None))
+                    item_value = value[item]
+                    item_mode = "repr" if isinstance(item_value, ("".__class__, bytes)) else "str"
+                separator = ", "
+                if type(item_value) in _STR_CHUNKS_CONTAINER_TYPES:
+                    work.append((item_value, item_mode))
+                else:
+                    work.append((repr(item_value) if item_mode == "repr" else str(item_value), None))
+            if separator != ", ":
+                # Empty container
+                work.append((separator, None))
+            work.append(("]" if value_type is list else "}", None))
+            stack.extend(reversed(work))
+            continue
+        elif mode == "repr":
+            piece = repr(value)
+        else:
+            piece = str(value)
+
+        pieces.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield "".join(pieces)
+            pieces = []
+            size = 0
+
+    if pieces:
+        yield "".join(pieces)
+
+
 def _convert_to_py27_type(original):  # type: ignore[no-untyped-def]
     if isinstance(original, ("".__class__, bytes)):
         # these are strings, return the Py27UniStr instance of the string
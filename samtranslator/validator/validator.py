@@ -1,5 +1,7 @@
 import json
 import re
+from collections.abc import Iterable, Iterator
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -9,13 +11,18 @@ from samtranslator.internal.deprecation_control import deprecated
 
 from . import sam_schema
 
+# Schema generated from the SAM resource models. It is only available in a source checkout, it isn't packaged.
+SAM_SCHEMA_FILE = Path(__file__).absolute().parent.parent.parent / "schema_source" / "sam.schema.json"
+
+UNICODE_TYPE_REGEX = re.compile("u('[^']+')")
+
 
 class SamTemplateValidator:
     """
     SAM function validation, on the deprecation path.
     """
 
-    UNICODE_TYPE_REGEX = re.compile("u('[^']+')")
+    UNICODE_TYPE_REGEX = UNICODE_TYPE_REGEX
 
     @deprecated()
     def __init__(self, schema=None) -> None:  # type: ignore[no-untyped-def]
@@ -121,25 +128,8 @@ class SamTemplateValidator:
         errors_set : Dict
             Set of formatted errors
         """
-        if error is None:
-            return
-
-        if not error.context:
-            # We only display the leaves
-            # Format the message with pseudo JSON Path:
-            # [Path.To.Element] Error message
-            error_path = ".".join([str(p) for p in error.absolute_path]) if error.absolute_path else "."
-
-            error_content = f"[{error_path}] {self._cleanup_error_message(error)}"  # type: ignore[no-untyped-call]
-
-            if error_content not in errors_set:
-                # We set the value to None as we don't use it
-                errors_set[error_content] = None
-            return
-
-        for context_error in error.context:
-            # Each "context" item is also a validation error
-            self._process_error(context_error, errors_set)  # type: ignore[no-untyped-call]
+        if error is not None:
+            _process_error(error, errors_set)
 
     def _cleanup_error_message(self, error):  # type: ignore[no-untyped-def]
         """
@@ -154,16 +144,7 @@ class SamTemplateValidator:
         str
             Cleaned message
         """
-        final_message = re.sub(self.UNICODE_TYPE_REGEX, r"\1", error.message)
-
-        if final_message.endswith(" under any of the given schemas"):
-            return "Is not valid"
-        if final_message.startswith(("None is not of type ", "None is not one of ")):
-            return "Must not be empty"
-        if " does not match " in final_message and "patternError" in error.schema:
-            return re.sub("does not match .+", error.schema.get("patternError"), final_message)
-
-        return final_message
+        return _cleanup_error_message(error)
 
     def _read_json(self, filepath: Path) -> Any:
         """
@@ -181,6 +162,222 @@ class SamTemplateValidator:
             return json.load(fp)
 
 
+class SamSchemaValidator:
+    """
+    Validates templates against a JSON schema of SAM, such as the one generated in schema_source/sam.schema.json.
+
+    Building the validator analyzes the whole schema, so a validator is meant to be built once and shared. Use
+    get_sam_schema_validator() to get a cached one. Validation doesn't modify the validator, so it can be shared
+    between threads.
+
+    Most of the cost of validating a template comes from "anyOf" alternatives like the resource and event types,
+    where every alternative was tried until one matched. When the alternatives are told apart by the value of their
+    "Type" property, the validator only checks the alternative matching the "Type" of the element. This gives the
+    same result, and errors of invalid elements only contain the errors of their own type.
+    """
+
+    def __init__(self, schema: dict[str, Any]) -> None:
+        """
+        :param schema: JSON schema to validate templates against. Its "$schema" selects the draft, Draft 7 by default
+        """
+        validator_class = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+
+        type_checker = validator_class.TYPE_CHECKER.redefine("intrinsic", is_intrinsic)
+        if _uses_intrinsic_type(schema):
+            # Schemas with a dedicated type for intrinsic functions don't accept them where objects are expected
+            type_checker = type_checker.redefine("object", is_object)
+
+        # Keyed by the id of the "anyOf" lists, which the schema keeps alive as long as the validator
+        self._type_discriminators = _get_type_discriminators(schema)
+        self._any_of = validator_class.VALIDATORS["anyOf"]
+
+        self.validator = jsonschema.validators.extend(  # type: ignore[no-untyped-call]
+            validator_class, validators={"anyOf": self._discriminated_any_of}, type_checker=type_checker
+        )(schema)
+
+    def is_valid(self, template_dict: dict[str, Any]) -> bool:
+        """
+        Returns whether the template is valid. Stops at the first error found, so it is the fastest way to
+        pre-flight check a template.
+
+        :param template_dict: template to validate
+        """
+        return bool(self.validator.is_valid(template_dict))
+
+    def get_errors(self, template_dict: dict[str, Any], fail_fast: bool = False) -> list[str]:
+        """
+        Validates a template
+
+        :param template_dict: template to validate
+        :param fail_fast: stop at the first invalid element of the template instead of finding all of them
+        :return: sorted "[Path.To.Element] Error message" of the validation errors, empty if the template is valid
+        """
+        validation_errors: Iterable[jsonschema.ValidationError] = self.validator.iter_errors(template_dict)
+        if fail_fast:
+            first_error = next(iter(validation_errors), None)
+            validation_errors = [first_error] if first_error else []
+
+        errors_set: dict[str, None] = {}
+        for e in validation_errors:
+            _process_error(e, errors_set)
+        return sorted(errors_set.keys())
+
+    def _discriminated_any_of(
+        self, validator: Any, any_of: list[Any], instance: Any, schema: dict[str, Any]
+    ) -> Iterator[jsonschema.ValidationError]:
+        discriminator = self._type_discriminators.get(id(any_of))
+        if discriminator is None or not isinstance(instance, dict) or not isinstance(instance.get("Type"), str):
+            yield from self._any_of(validator, any_of, instance, schema)
+            return
+
+        indexes, fallback_index = discriminator
+        index = indexes.get(instance["Type"], fallback_index)
+        if index is None:
+            yield from self._any_of(validator, any_of, instance, schema)
+            return
+
+        errors = list(validator.descend(instance, any_of[index], schema_path=index))
+        if errors:
+            yield jsonschema.ValidationError(
+                f"{instance!r} is not valid under any of the given schemas", context=errors
+            )
+
+
+@cache
+def get_sam_schema_validator(schema_path: Path) -> SamSchemaValidator:
+    """
+    Returns the validator of the given schema file, built on first use and shared by all later calls
+
+    :param schema_path: path of the JSON schema, such as SAM_SCHEMA_FILE in a source checkout
+    """
+    with schema_path.open(encoding="utf-8") as f:
+        return SamSchemaValidator(json.load(f))
+
+
+def _uses_intrinsic_type(schema: Any) -> bool:
+    """
+    Returns whether the schema declares the "intrinsic" type anywhere
+    """
+    if isinstance(schema, dict):
+        schema_type = schema.get("type")
+        if schema_type == "intrinsic" or (isinstance(schema_type, list) and "intrinsic" in schema_type):
+            return True
+        return any(_uses_intrinsic_type(value) for value in schema.values())
+    if isinstance(schema, list):
+        return any(_uses_intrinsic_type(value) for value in schema)
+    return False
+
+
+def _get_type_discriminators(schema: dict[str, Any]) -> dict[int, tuple[dict[str, int], int | None]]:
+    """
+    Finds the "anyOf" of the schema whose alternatives are told apart by their "Type" property.
+
+    :return: for each of them, keyed by the id of the "anyOf" list, the index of the alternative of every "Type"
+        value, and the index of the alternative of the other "Type" values, if any
+    """
+    discriminators: dict[int, tuple[dict[str, int], int | None]] = {}
+
+    def visit(node: Any) -> None:
+        if isinstance(node, dict):
+            any_of = node.get("anyOf")
+            if isinstance(any_of, list):
+                discriminator = _get_type_discriminator(schema, any_of)
+                if discriminator:
+                    discriminators[id(any_of)] = discriminator
+            for value in node.values():
+                visit(value)
+        elif isinstance(node, list):
+            for value in node:
+                visit(value)
+
+    visit(schema)
+    return discriminators
+
+
+def _get_type_discriminator(schema: dict[str, Any], any_of: list[Any]) -> tuple[dict[str, int], int | None] | None:
+    indexes: dict[str, int] = {}
+    fallback_index = None
+    fallback_pattern = None
+    for index, alternative in enumerate(any_of):
+        type_schema = _resolve_local_ref(schema, alternative).get("properties", {}).get("Type")
+        if not isinstance(type_schema, dict):
+            return None
+        values = type_schema.get("enum")
+        if isinstance(values, list) and all(isinstance(value, str) for value in values):
+            for value in values:
+                if value in indexes:
+                    return None
+                indexes[value] = index
+        elif fallback_index is None and isinstance(type_schema.get("pattern"), str):
+            fallback_index = index
+            fallback_pattern = re.compile(type_schema["pattern"])
+        else:
+            return None
+
+    # The other alternatives must never be valid for the "Type" values of an alternative
+    if fallback_pattern and any(fallback_pattern.search(value) for value in indexes):
+        return None
+    return indexes, fallback_index
+
+
+def _resolve_local_ref(schema: dict[str, Any], subschema: Any) -> dict[str, Any]:
+    if not isinstance(subschema, dict):
+        return {}
+    ref = subschema.get("$ref")
+    if not isinstance(ref, str):
+        return subschema
+    if not ref.startswith("#/"):
+        return {}
+    resolved: Any = schema
+    for part in ref[2:].split("/"):
+        if not isinstance(resolved, dict):
+            return {}
+        resolved = resolved.get(part.replace("~1", "/").replace("~0", "~"))
+    return resolved if isinstance(resolved, dict) else {}
+
+
+def _process_error(error: jsonschema.ValidationError, errors_set: dict[str, None]) -> None:
+    """
+    Processes the validation errors recursively
+    error is actually a tree of errors
+    Each error can have a list of child errors in its 'context' attribute
+    """
+    if not error.context:
+        # We only display the leaves
+        # Format the message with pseudo JSON Path:
+        # [Path.To.Element] Error message
+        error_path = ".".join([str(p) for p in error.absolute_path]) if error.absolute_path else "."
+
+        error_content = f"[{error_path}] {_cleanup_error_message(error)}"
+
+        if error_content not in errors_set:
+            # We set the value to None as we don't use it
+            errors_set[error_content] = None
+        return
+
+    for context_error in error.context:
+        # Each "context" item is also a validation error
+        _process_error(context_error, errors_set)
+
+
+def _cleanup_error_message(error: jsonschema.ValidationError) -> str:
+    """
+    Cleans an error message up to remove unecessary clutter or replace
+    it with a more meaningful one
+    """
+    final_message = re.sub(UNICODE_TYPE_REGEX, r"\1", error.message)
+
+    if final_message.endswith(" under any of the given schemas"):
+        return "Is not valid"
+    if final_message.startswith(("None is not of type ", "None is not one of ")):
+        return "Must not be empty"
+    pattern_error = error.schema.get("patternError") if isinstance(error.schema, dict) else None
+    if " does not match " in final_message and pattern_error:
+        return re.sub("does not match .+", pattern_error, final_message)
+
+    return final_message
+
+
 # Type definition redefinitions
 INTRINSIC_ATTR = {
     "Fn::And",
@@ -0,0 +1,121 @@
+import tempfile
+import threading
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from tests.translator.test_translator import get_policy_mock
+
+from bin import translation_daemon
+
+TEMPLATE = {
+    "Transform": "AWS::Serverless-2016-10-31",
+    "Resources": {
+        "MyTable": {"Type": "AWS::Serverless::SimpleTable"},
+    },
+}
+
+INVALID_TEMPLATE = {
+    "Transform": "AWS::Serverless-2016-10-31",
+    "Resources": {
+        "MyTable": {"Type": "AWS::Serverless::SimpleTable", "Properties": {"PrimaryKey": {"Name": "id"}}},
+    },
+}
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+class TranslationDaemonTestMixin:
+    address: translation_daemon.Address
+
+    def start_server(self, address):
+        self.policy_loader = get_policy_mock()
+        server = translation_daemon.make_server(address, self.policy_loader)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_must_translate_template(self):
+        translated = translation_daemon.translate(self.address, TEMPLATE)
+
+        self.assertEqual("AWS::DynamoDB::Table", translated["Resources"]["MyTable"]["Type"])
+        self.assertNotIn("Transform", translated)
+
+    def test_must_return_causes_of_invalid_document(self):
+        with self.assertRaises(translation_daemon.TranslationError) as e:
+            translation_daemon.translate(self.address, INVALID_TEMPLATE)
+
+        self.assertEqual(
+            "Invalid Serverless Application Specification document. Number of errors found: 1.", e.exception.message
+        )
+        self.assertEqual(
+            [
+                {
+                    "ErrorMessage": "Resource with id [MyTable] is invalid. Property 'PrimaryKey.Type' is required.",
+                    "Metadata": None,
+                }
+            ],
+            e.exception.errors,
+        )
+
+    def test_must_raise_server_errors(self):
+        self.policy_loader.load.side_effect = RuntimeError("IAM is down")
+        template = {
+            "Resources": {
+                "MyFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "CodeUri": "s3://bucket/key",
+                        "Handler": "index.handler",
+                        "Runtime": "python3.12",
+                        "Policies": "MyCustomerManagedPolicy",
+                    },
+                }
+            },
+        }
+
+        with self.assertRaises(translation_daemon.TranslationServerError) as e:
+            translation_daemon.translate(self.address, template)
+
+        self.assertEqual(500, e.exception.status)
+        self.assertEqual("RuntimeError: IAM is down", e.exception.message)
+
+    def test_must_translate_concurrent_requests(self):
+        results = []
+
+        def translate():
+            results.append(translation_daemon.translate(self.address, TEMPLATE))
+
+        threads = [threading.Thread(target=translate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(4, len(results))
+        self.assertTrue(all(result == results[0] for result in results))
+
+
+class TestTranslationDaemonOverUnixSocket(TranslationDaemonTestMixin, TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.address = str(Path(directory.name) / "sam-translate.sock")
+        self.start_server(self.address)
+
+
+class TestTranslationDaemonOverHttp(TranslationDaemonTestMixin, TestCase):
+    def setUp(self):
+        server = self.start_server(("127.0.0.1", 0))
+        self.address = server.server_address[:2]
+
+    def test_must_reject_invalid_requests(self):
+        connection = translation_daemon.http.client.HTTPConnection(*self.address)
+        self.addCleanup(connection.close)
+        connection.request("POST", translation_daemon.TRANSLATE_PATH, "[]")
+
+        response = connection.getresponse()
+
+        self.assertEqual(400, response.status)
@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
@@ -8,6 +9,7 @@ from samtranslator.feature_toggle.dialup import DisabledDialup, SimpleAccountPer
 from samtranslator.feature_toggle.feature_toggle import (
     FeatureToggle,
     FeatureToggleAppConfigConfigProvider,
+    FeatureToggleAppConfigDataConfigProvider,
     FeatureToggleLocalConfigProvider,
 )
 
@@ -59,6 +61,20 @@ class TestFeatureToggle(TestCase):
         dialup = feature_toggle._get_dialup(region_config, "some-feature")
         self.assertIsInstance(dialup, expected_class)
 
+    def test_feature_toggle_must_evaluate_features_once(self):
+        with patch.object(FeatureToggle, "_get_dialup", autospec=True, side_effect=FeatureToggle._get_dialup) as m:
+            feature_toggle = FeatureToggle(
+                FeatureToggleLocalConfigProvider(os.path.join(my_path, "input", "feature_toggle_config.json")),
+                stage="beta",
+                region="us-west-2",
+                account_id="123456789123",
+            )
+            for _ in range(3):
+                self.assertTrue(feature_toggle.is_enabled("feature-1"))
+                self.assertFalse(feature_toggle.is_enabled("__note__"))
+
+        m.assert_called_once()
+
 
 class TestFeatureToggleAppConfig(TestCase):
     def setUp(self):
@@ -160,3 +176,141 @@ class TestFeatureToggleAppConfigConfigProvider(TestCase):
             "test_app_id", "test_env_id", "test_conf_id"
         )
         self.assertEqual(feature_toggle_config_provider.config, {})
+
+
+class TestFeatureToggleAppConfigDataConfigProvider(TestCase):
+    def setUp(self):
+        self.addCleanup(FeatureToggleAppConfigDataConfigProvider.clear_sessions)
+        self.client_mock = Mock()
+        self.client_mock.start_configuration_session.return_value = {"InitialConfigurationToken": "token-0"}
+        self.client_mock.get_latest_configuration.side_effect = [
+            self._latest_configuration(b'{"feature-1": {}}', "token-1"),
+            self._latest_configuration(b"", "token-2"),
+            self._latest_configuration(b'{"feature-2": {}}', "token-3"),
+        ]
+        monotonic_patcher = patch("samtranslator.feature_toggle.feature_toggle.time.monotonic", return_value=0)
+        self.monotonic_mock = monotonic_patcher.start()
+        self.addCleanup(monotonic_patcher.stop)
+
+    @staticmethod
+    def _latest_configuration(content, next_token):
+        configuration = Mock()
+        configuration.read.return_value = content
+        return {
+            "Configuration": configuration,
+            "NextPollConfigurationToken": next_token,
+            "NextPollIntervalInSeconds": 15,
+        }
+
+    def _make_provider(self, **kwargs):
+        return FeatureToggleAppConfigDataConfigProvider(
+            "test_app_id", "test_env_id", "test_conf_id", app_config_data_client=self.client_mock, **kwargs
+        )
+
+    def _refresh(self, provider):
+        config = provider.config
+        provider._session.refresh_thread.join()
+        return config
+
+    def test_providers_must_share_config(self):
+        self.assertEqual({"feature-1": {}}, self._make_provider().config)
+        self.assertEqual({"feature-1": {}}, self._make_provider().config)
+
+        self.client_mock.start_configuration_session.assert_called_once_with(
+            ApplicationIdentifier="test_app_id",
+            EnvironmentIdentifier="test_env_id",
+            ConfigurationProfileIdentifier="test_conf_id",
+            RequiredMinimumPollIntervalInSeconds=60,
+        )
+        self.client_mock.get_latest_configuration.assert_called_once_with(ConfigurationToken="token-0")
+
+    def test_providers_with_different_settings_must_not_share_config(self):
+        provider = self._make_provider()
+        other_provider = self._make_provider(poll_interval_seconds=120)
+        provider.config
+        other_provider.config
+
+        self.assertIsNot(provider._session, other_provider._session)
+        self.assertEqual(
+            [60, 120],
+            [
+                c.kwargs["RequiredMinimumPollIntervalInSeconds"]
+                for c in self.client_mock.start_configuration_session.call_args_list
+            ],
+        )
+
+    def test_must_load_config_again_once_sessions_are_cleared(self):
+        self.assertEqual({"feature-1": {}}, self._make_provider().config)
+
+        FeatureToggleAppConfigDataConfigProvider.clear_sessions()
+
+        self._make_provider().config
+        self.assertEqual(2, self.client_mock.start_configuration_session.call_count)
+
+    def test_config_must_be_polled_in_background_after_poll_interval(self):
+        provider = self._make_provider()
+        provider.config
+
+        self.monotonic_mock.return_value = 60
+        # The previous config is kept when the config didn't change
+        self.assertEqual({"feature-1": {}}, self._refresh(provider))
+        self.assertEqual({"feature-1": {}}, provider.config)
+
+        self.monotonic_mock.return_value = 120
+        self.assertEqual({"feature-1": {}}, self._refresh(provider))
+        self.assertEqual({"feature-2": {}}, provider.config)
+
+        self.assertEqual(
+            ["token-0", "token-1", "token-2"],
+            [c.kwargs["ConfigurationToken"] for c in self.client_mock.get_latest_configuration.call_args_list],
+        )
+
+    def test_config_must_be_read_while_polled(self):
+        polling = threading.Event()
+        released = threading.Event()
+        released_in_poll = []
+
+        def slow_latest_configuration(ConfigurationToken):
+            polling.set()
+            released_in_poll.append(released.wait(5))
+            return self._latest_configuration(b'{"feature-2": {}}', "token-2")
+
+        provider = self._make_provider()
+        provider.config
+        self.client_mock.get_latest_configuration.side_effect = slow_latest_configuration
+
+        self.monotonic_mock.return_value = 60
+        self.assertEqual({"feature-1": {}}, provider.config)
+        polling.wait(5)
+        # Reads during the poll neither wait for it nor start another poll
+        self.assertEqual({"feature-1": {}}, provider.config)
+        released.set()
+        provider._session.refresh_thread.join()
+
+        self.assertEqual([True], released_in_poll)
+        self.assertEqual({"feature-2": {}}, provider.config)
+
+    def test_must_use_fallback_config_until_config_is_loaded(self):
+        self.client_mock.start_configuration_session.side_effect = [Exception(), {"InitialConfigurationToken": "a"}]
+        fallback_config_path = os.path.join(my_path, "input", "feature_toggle_config.json")
+        provider = self._make_provider(fallback_config_path=fallback_config_path)
+
+        self.assertEqual(FeatureToggleLocalConfigProvider(fallback_config_path).config, provider.config)
+
+        self.monotonic_mock.return_value = 60
+        self._refresh(provider)
+        self.assertEqual({"feature-1": {}}, provider.config)
+
+    def test_must_use_empty_config_without_fallback(self):
+        self.client_mock.start_configuration_session.side_effect = Exception()
+
+        self.assertEqual({}, self._make_provider().config)
+
+    @patch("samtranslator.feature_toggle.feature_toggle.boto3")
+    def test_must_create_appconfigdata_client(self, boto3_mock):
+        boto3_mock.client.return_value = self.client_mock
+
+        provider = FeatureToggleAppConfigDataConfigProvider("test_app_id", "test_env_id", "test_conf_id")
+
+        self.assertEqual({"feature-1": {}}, provider.config)
+        self.assertEqual("appconfigdata", boto3_mock.client.call_args.args[0])
@@ -115,6 +115,16 @@ class TestMetrics(TestCase):
         if timestamp is not None:
             self.assertEqual(published_metric["Timestamp"], timestamp)
 
+    def test_publishing_size_metric(self):
+        mock_metrics_publisher = MetricPublisherTestHelper()
+        metrics = Metrics("DummyNamespace", mock_metrics_publisher)
+        metrics.record_size("SizeMetric", 2048)
+        metrics.publish()
+        published_metric = mock_metrics_publisher.metrics_cache[0].get_metric_data()
+        self.assertEqual(published_metric["MetricName"], "SizeMetric")
+        self.assertEqual(published_metric["Value"], 2048)
+        self.assertEqual(published_metric["Unit"], "Bytes")
+
     @parameterized.expand(
         [
             param(
@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 from parameterized import parameterized
 from samtranslator.model import InvalidResourceException
 from samtranslator.model.api.api_generator import ApiGenerator
+from samtranslator.translator.transform import transform
 
 
 class TestApiGenerator(TestCase):
@@ -115,13 +116,12 @@ class TestApiGenerator(TestCase):
 
         # Call _add_cors which should normalize paths and avoid duplicates
         api_generator._add_cors()
+        definition_body = api_generator._get_definition_editor().swagger
 
         # Check that OPTIONS method is not added to both /datasets and /datasets/
         # It should only be added once to avoid the duplicate OPTIONS error
         paths_with_options = [
-            path
-            for path, methods in api_generator.definition_body["paths"].items()
-            if "options" in methods or "OPTIONS" in methods
+            path for path, methods in definition_body["paths"].items() if "options" in methods or "OPTIONS" in methods
         ]
 
         # We should have only ONE path with OPTIONS method (the normalized one)
@@ -129,3 +129,36 @@ class TestApiGenerator(TestCase):
         self.assertEqual(
             len(paths_with_options), 1, "CORS should only add OPTIONS to one of the paths that differ by trailing slash"
         )
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_must_convert_openapi3_definition_once_auth_and_models_are_added(self):
+        template = {
+            "Transform": "AWS::Serverless-2016-10-31",
+            "Resources": {
+                "MyApi": {
+                    "Type": "AWS::Serverless::Api",
+                    "Properties": {
+                        "StageName": "Prod",
+                        "OpenApiVersion": "3.0.1",
+                        "Cors": "'*'",
+                        "Auth": {"ApiKeyRequired": True},
+                        "Models": {"Item": {"type": "object"}},
+                        "DefinitionBody": {
+                            "openapi": "3.0.1",
+                            "info": {"title": "MyApi", "version": "1.0"},
+                            "definitions": {"User": {"type": "object"}},
+                            "paths": {"/items": {"get": {"x-amazon-apigateway-integration": {"type": "mock"}}}},
+                        },
+                    },
+                }
+            },
+        }
+
+        body = transform(template, {}, None)["Resources"]["MyApi"]["Properties"]["Body"]
+
+        # Models replace the definitions of the DefinitionBody, which were converted when Auth was added
+        self.assertEqual({"item": {"type": "object"}}, body["components"]["schemas"])
+        self.assertNotIn("definitions", body)
+        # The CORS headers are converted once Auth is added, once Models are added, and once more at the end
+        headers = body["paths"]["/items"]["options"]["responses"]["200"]["headers"]
+        self.assertEqual({"schema": {"schema": {"schema": {"type": "string"}}}}, headers["Access-Control-Allow-Origin"])
@@ -57,6 +57,26 @@ class TestWebSocketApiGenerator(TestCase):
         self.assertIn("${__StageName__}", fn_sub[0])
         self.assertEqual(fn_sub[1]["__StageName__"], {"Ref": "StageName"})
 
+    def test_consolidated_perms(self):
+        kwargs = self.kwargs.copy()
+        kwargs["consolidate_permissions"] = True
+        kwargs["routes"] = {
+            "$connect": {"FunctionArn": {"Fn::GetAtt": ["ConnectFunction", "Arn"]}},
+            "$disconnect": {"FunctionArn": {"Fn::GetAtt": ["ConnectFunction", "Arn"]}},
+            "sendmessage": {"FunctionArn": {"Fn::GetAtt": ["MessageFunction", "Arn"]}},
+        }
+        resources = WebSocketApiGenerator(**kwargs)._to_cloudformation({})
+        perms = [resource for resource in resources if resource.resource_type == "AWS::Lambda::Permission"]
+        self.assertEqual(
+            [{"Fn::GetAtt": ["ConnectFunction", "Arn"]}, {"Fn::GetAtt": ["MessageFunction", "Arn"]}],
+            [perm.FunctionName for perm in perms],
+        )
+        for perm in perms:
+            self.assertEqual(
+                perm.SourceArn["Fn::Sub"],
+                "arn:${AWS::Partition}:execute-api:${AWS::Region}:${AWS::AccountId}:${WebSocketApiId.ApiId}/default/*",
+            )
+
     def test_none_auth_no_id(self):
         kwargs = self.kwargs.copy()
         kwargs["auth_config"] = {"AuthType": "NONE"}
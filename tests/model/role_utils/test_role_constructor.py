@@ -0,0 +1,128 @@
+import threading
+import time
+from contextvars import copy_context
+from unittest import TestCase
+from unittest.mock import patch
+
+from samtranslator.metrics.method_decorator import MetricsMethodWrapperSingleton
+from samtranslator.metrics.metrics import DummyMetricsPublisher, Metrics
+from samtranslator.model.exceptions import InvalidResourceException
+from samtranslator.model.resource_policies import ResourcePolicies
+from samtranslator.model.role_utils import role_constructor
+from samtranslator.model.role_utils.role_constructor import construct_role_for_resource, role_construction_cache
+
+POLICIES = [
+    "AmazonS3ReadOnlyAccess",
+    {"Statement": [{"Action": "sqs:*", "Effect": "Allow", "Resource": "*"}]},
+    {
+        "Fn::If": [
+            "Condition",
+            {"Statement": [{"Action": "s3:*", "Effect": "Allow", "Resource": "*"}]},
+            {"Ref": "AWS::NoValue"},
+        ]
+    },
+]
+
+MANAGED_POLICY_MAP = {"AmazonS3ReadOnlyAccess": "arn:aws:iam::aws:policy/AmazonS3ReadOnlyAccess"}
+
+
+def construct_role(logical_id, policies, **kwargs):
+    return construct_role_for_resource(
+        resource_logical_id=logical_id,
+        attributes=None,
+        managed_policy_map=MANAGED_POLICY_MAP,
+        assume_role_policy_document={},
+        resource_policies=ResourcePolicies({"Policies": policies}),
+        managed_policy_arns=["arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole"],
+        **kwargs,
+    ).to_dict()
+
+
+class SlowCount(int):
+    """Count whose increments let other threads run while they read and write it."""
+
+    def __add__(self, other):
+        time.sleep(0.001)
+        return SlowCount(int(self) + other)
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+class TestRoleConstructionCache(TestCase):
+    def setUp(self):
+        self.metrics = Metrics("ServerlessTransform", DummyMetricsPublisher())
+        MetricsMethodWrapperSingleton.set_instance(self.metrics)
+
+    def tearDown(self):
+        MetricsMethodWrapperSingleton.set_instance(MetricsMethodWrapperSingleton._DUMMY_INSTANCE)
+
+    def test_must_construct_same_roles_as_without_cache(self):
+        expected = [construct_role(f"Function{index}", POLICIES, role_path="/path/") for index in range(3)]
+
+        with role_construction_cache():
+            roles = [construct_role(f"Function{index}", POLICIES, role_path="/path/") for index in range(3)]
+
+        self.assertEqual(expected, roles)
+        self.assertEqual(
+            {
+                "Fn::If": [
+                    "Condition",
+                    {"PolicyName": "Function2RolePolicy2", "PolicyDocument": POLICIES[2]["Fn::If"][1]},
+                    {"Ref": "AWS::NoValue"},
+                ]
+            },
+            roles[2]["Function2Role"]["Properties"]["Policies"][1],
+        )
+
+    def test_must_expand_identical_policies_once(self):
+        with (
+            role_construction_cache(),
+            patch.object(
+                role_constructor, "_expand_policies", wraps=role_constructor._expand_policies
+            ) as expand_policies_mock,
+        ):
+            construct_role("Function1", POLICIES)
+            construct_role("Function2", POLICIES)
+            construct_role("Function3", ["AmazonS3ReadOnlyAccess"])
+
+        self.assertEqual(2, expand_policies_mock.call_count)
+        self.assertEqual([3], [datum.value for datum in self.metrics.get_metric("RoleConstructions")])
+        self.assertEqual([1], [datum.value for datum in self.metrics.get_metric("RoleConstructionCacheHits")])
+        self.assertEqual(3, len(self.metrics.get_metric("ConstructRole")))
+
+    def test_must_count_roles_constructed_on_several_threads(self):
+        with role_construction_cache():
+            cache = role_constructor._role_construction_cache.get()
+            cache.constructions = cache.hits = SlowCount(0)
+            threads = [
+                threading.Thread(
+                    target=copy_context().run,
+                    args=(lambda: [construct_role(f"Function{index}", POLICIES) for index in range(25)],),
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual([100], [datum.value for datum in self.metrics.get_metric("RoleConstructions")])
+        hits = [datum.value for datum in self.metrics.get_metric("RoleConstructionCacheHits")]
+        # Threads may expand the same policies at the same time before any of them is cached
+        self.assertLessEqual(100 - 4, hits[0])
+
+    def test_must_not_cache_outside_of_context(self):
+        with patch.object(
+            role_constructor, "_expand_policies", wraps=role_constructor._expand_policies
+        ) as expand_policies_mock:
+            construct_role("Function1", POLICIES)
+            construct_role("Function2", POLICIES)
+
+        self.assertEqual(2, expand_policies_mock.call_count)
+        self.assertEqual([], self.metrics.get_metric("RoleConstructions"))
+
+    def test_must_raise_error_of_each_resource(self):
+        with role_construction_cache():
+            for logical_id in ["Function1", "Function2"]:
+                with self.assertRaises(InvalidResourceException) as error:
+                    construct_role(logical_id, [{"SQSPollerPolicy": {"QueueName": "queue"}}])
+                self.assertIn(f"[{logical_id}]", error.exception.message)
@@ -0,0 +1,113 @@
+from unittest import TestCase
+
+from samtranslator.model.role_utils.shared_policies import share_identical_inline_policies
+
+
+def role(*documents, **attributes):
+    return {
+        "Type": "AWS::IAM::Role",
+        "Properties": {
+            "ManagedPolicyArns": ["arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole"],
+            "Policies": [
+                {"PolicyName": f"Policy{index}", "PolicyDocument": document} for index, document in enumerate(documents)
+            ],
+        },
+        **attributes,
+    }
+
+
+def document(action):
+    return {"Statement": [{"Action": action, "Effect": "Allow", "Resource": {"Fn::Sub": "arn:${AWS::Partition}:*"}}]}
+
+
+class TestShareIdenticalInlinePolicies(TestCase):
+    def test_must_share_identical_policies(self):
+        resources = {
+            "ARole": role(document("s3:GetObject"), document("sqs:*")),
+            "BRole": role(document("s3:GetObject")),
+            "CRole": role(document("sqs:*")),
+        }
+
+        saved_bytes = share_identical_inline_policies(resources, ["ARole", "BRole", "CRole"])
+
+        shared_policies = {
+            logical_id: resource
+            for logical_id, resource in resources.items()
+            if resource["Type"] == "AWS::IAM::ManagedPolicy"
+        }
+        self.assertEqual(2, len(shared_policies))
+        for logical_id, shared_policy in shared_policies.items():
+            self.assertTrue(logical_id.startswith("SharedPolicy"))
+        s3_policy = next(
+            logical_id
+            for logical_id, shared_policy in shared_policies.items()
+            if shared_policy["Properties"]["PolicyDocument"] == document("s3:GetObject")
+        )
+        self.assertNotIn("Policies", resources["ARole"]["Properties"])
+        self.assertEqual(
+            ["arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole", {"Ref": s3_policy}],
+            resources["BRole"]["Properties"]["ManagedPolicyArns"],
+        )
+        self.assertEqual(3, len(resources["ARole"]["Properties"]["ManagedPolicyArns"]))
+        self.assertGreater(saved_bytes, 0)
+
+    def test_must_report_saved_bytes(self):
+        large_document = document([f"s3:Action{index}" for index in range(50)])
+        resources = {f"Role{index}": role(large_document) for index in range(10)}
+
+        saved_bytes = share_identical_inline_policies(resources, list(resources))
+
+        self.assertGreater(saved_bytes, 9 * len(str(large_document)) // 2)
+        self.assertEqual(11, len(resources))
+
+    def test_must_only_share_policies_of_given_roles_with_same_condition(self):
+        resources = {
+            "ARole": role(document("s3:GetObject")),
+            "BRole": role(document("s3:GetObject")),
+            "CRole": role(document("sqs:*"), Condition="IsProd"),
+            "DRole": role(document("sqs:*")),
+        }
+
+        share_identical_inline_policies(resources, ["ARole", "CRole", "DRole"])
+
+        self.assertEqual(4, len(resources))
+
+    def test_must_keep_shared_policies_conditional(self):
+        resources = {
+            "ARole": role(document("sqs:*"), Condition="IsProd"),
+            "BRole": role(document("sqs:*"), Condition="IsProd"),
+        }
+
+        share_identical_inline_policies(resources, ["ARole", "BRole"])
+
+        shared_policy = next(resource for resource in resources.values() if resource["Type"] != "AWS::IAM::Role")
+        self.assertEqual("IsProd", shared_policy["Condition"])
+
+    def test_must_respect_managed_policy_quota(self):
+        full_role = role(document("sqs:*"))
+        full_role["Properties"]["ManagedPolicyArns"] = [f"arn:{index}" for index in range(10)]
+        resources = {"ARole": full_role, "BRole": role(document("sqs:*")), "CRole": role(document("sqs:*"))}
+
+        share_identical_inline_policies(resources, ["ARole", "BRole", "CRole"])
+
+        self.assertEqual(
+            [{"PolicyName": "Policy0", "PolicyDocument": document("sqs:*")}], full_role["Properties"]["Policies"]
+        )
+        self.assertNotIn("Policies", resources["BRole"]["Properties"])
+
+    def test_must_leave_small_policies_inline(self):
+        resources = {"ARole": role({"Statement": []}), "BRole": role({"Statement": []})}
+
+        self.assertEqual(0, share_identical_inline_policies(resources, ["ARole", "BRole"]))
+        self.assertEqual(2, len(resources))
+
+    def test_must_leave_conditional_policies_inline(self):
+        conditional_policy = {
+            "Fn::If": ["IsProd", {"PolicyName": "P", "PolicyDocument": document("sqs:*")}, {"Ref": "AWS::NoValue"}]
+        }
+        resources = {"ARole": role(), "BRole": role()}
+        for resource in resources.values():
+            resource["Properties"]["Policies"] = [conditional_policy]
+
+        self.assertEqual(0, share_identical_inline_policies(resources, ["ARole", "BRole"]))
+        self.assertEqual(2, len(resources))
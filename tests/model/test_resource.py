@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from samtranslator.model import Property, SamResourceMacro
+from samtranslator.model import GeneratedProperty, Property, Resource, SamResourceMacro
 from samtranslator.model.exceptions import InvalidResourceException
 from samtranslator.model.types import IS_STR
 
@@ -24,6 +24,15 @@ class DummyResourceNoValidation(SamResourceMacro):
         return []
 
 
+class DummyGeneratedResource(Resource):
+    resource_type = "AWS::Dummy::Resource"
+    property_types = {"SomeProperty": GeneratedProperty(), "AnotherProperty": GeneratedProperty()}
+
+
+class DummyGeneratedResourceNoValidation(DummyGeneratedResource):
+    validate_setattr = False
+
+
 class TestResource(TestCase):
     def test_create_instance_variable_when_validate_setattr_is_true(self):
         resource = DummyResourceWithValidation("foo")
@@ -36,3 +45,40 @@ class TestResource(TestCase):
         resource.SomeExtraValue = "foo"
         resource.AnotherValue = "bar"
         resource.RandomValue = "baz"
+
+    def test_generated_resources_must_not_have_instance_dict(self):
+        resource = DummyGeneratedResource("foo")
+
+        self.assertFalse(hasattr(resource, "__dict__"))
+        with self.assertRaises(AttributeError):
+            resource.SomeExtraValue = "foo"
+
+    def test_generated_resource_properties_must_default_to_none(self):
+        resource = DummyGeneratedResource("foo")
+        resource.SomeProperty = "bar"
+
+        self.assertIsNone(resource.AnotherProperty)
+        self.assertEqual(
+            {"foo": {"Type": "AWS::Dummy::Resource", "Properties": {"SomeProperty": "bar"}}}, resource.to_dict()
+        )
+
+    def test_setting_property_must_invalidate_validation(self):
+        resource = DummyGeneratedResource("foo")
+        resource.validate_properties()
+
+        resource.SomeProperty = "bar"
+
+        self.assertFalse(resource._properties_validated)
+
+    def test_from_dict_must_reject_undefined_properties_of_generated_resources(self):
+        with self.assertRaises(InvalidResourceException):
+            DummyGeneratedResource.from_dict("foo", {"Type": "AWS::Dummy::Resource", "Properties": {"Unknown": 1}})
+
+    def test_generated_resources_without_validation_must_accept_any_attribute(self):
+        resource = DummyGeneratedResourceNoValidation("foo")
+
+        resource.SomeExtraValue = "foo"
+        resource.SomeProperty = "bar"
+
+        self.assertEqual("foo", resource.SomeExtraValue)
+        self.assertEqual({"SomeProperty": "bar"}, resource.to_dict()["foo"]["Properties"])
@@ -23,8 +23,14 @@ class TestResourcePolicies(TestCase):
         get_policies_mock.return_value = dummy_policy_results
         function_policies = ResourcePolicies(resource_properties, self.policy_template_processor_mock)
 
-        get_policies_mock.assert_called_once_with(resource_properties)
+        get_policies_mock.assert_not_called()
+        self.assertEqual(expected_length, len(function_policies))
         self.assertEqual(expected_length, len(function_policies))
+        get_policies_mock.assert_called_once_with(resource_properties)
+
+    def test_initialization_must_keep_property_value(self):
+        self.assertEqual(["policy"], ResourcePolicies({"Policies": ["policy"]}).property_value)
+        self.assertIsNone(ResourcePolicies({}).property_value)
 
     @patch.object(ResourcePolicies, "_get_policies")
     def test_get_must_yield_results_on_every_call(self, get_policies_mock):
@@ -45,6 +45,18 @@ class TestResourceValidator(TestCase):
         self.assertEqual(connector_model.Destination.Id, "MyTable")
         self.assertEqual(connector_model.Permissions, ["Read"])
 
+    def test_connector_model_is_cached(self):
+        connector_model = self.connector.validate_properties_and_return_model(ConnectorProperties)
+        self.assertIs(connector_model, self.connector.validate_properties_and_return_model(ConnectorProperties))
+
+    def test_connector_model_is_parsed_again_after_property_is_set(self):
+        connector_model = self.connector.validate_properties_and_return_model(ConnectorProperties)
+        self.connector.Permissions = ["Write"]
+
+        new_connector_model = self.connector.validate_properties_and_return_model(ConnectorProperties)
+        self.assertIsNot(connector_model, new_connector_model)
+        self.assertEqual(new_connector_model.Permissions, ["Write"])
+
     def test_lambda_model(self):
         model = self.function.validate_properties_and_return_model(FunctionProperties)
         self.assertEqual(model.CodeUri, "s3://foobar/foo.zip")
@@ -3,6 +3,7 @@ from unittest import TestCase
 
 from parameterized import param, parameterized
 from samtranslator.model.exceptions import InvalidDocumentException
+from samtranslator.open_api.base_editor import editor_session
 from samtranslator.open_api.open_api import OpenApiEditor
 from samtranslator.utils.py27hash_fix import Py27Dict
 
@@ -337,6 +338,24 @@ class TestOpenApiEditor_openapi_property(TestCase):
         self.assertEqual({}, input["paths"])  # Editor works on a diff copy of input
 
 
+class TestOpenApiEditor_release_document(TestCase):
+    def test_must_only_copy_edited_path_of_released_document(self):
+        original_openapi = {"openapi": "3.0.1", "paths": {"/foo": {"get": {}}}}
+
+        with editor_session():
+            editor = OpenApiEditor(original_openapi, edited_path="/bar")
+            editor.add_lambda_integration("/bar", "get", "uri")
+            released = editor.release_document()
+            editor = OpenApiEditor(released, edited_path="/baz")
+            editor.add_lambda_integration("/baz", "get", "uri")
+            openapi = editor.release_document()
+
+        self.assertEqual({"/foo": {"get": {}}}, original_openapi["paths"])
+        self.assertEqual(["/foo", "/bar"], list(released["paths"]))
+        self.assertIs(released["paths"]["/bar"], openapi["paths"]["/bar"])
+        self.assertEqual(["/foo", "/bar", "/baz"], list(openapi["paths"]))
+
+
 class TestOpenApiEditor_is_valid(TestCase):
     @parameterized.expand(
         [
@@ -28,7 +28,11 @@ class TestDefaultDefinitionBodyPlugin_on_before_transform_template(TestCase):
     @patch("samtranslator.plugins.api.default_definition_body_plugin.SamTemplate")
     def test_must_process_functions(self, SamTemplateMock):
         template_dict = {"a": "b"}
-        api_resources = [("id1", ApiResource()), ("id2", ApiResource()), ("id3", ApiResource())]
+        api_resources = [
+            ("id1", ApiResource("AWS::Serverless::Api")),
+            ("id2", ApiResource("AWS::Serverless::HttpApi")),
+            ("id3", ApiResource("AWS::Serverless::Api")),
+        ]
 
         sam_template = Mock()
         SamTemplateMock.return_value = sam_template
@@ -39,11 +43,14 @@ class TestDefaultDefinitionBodyPlugin_on_before_transform_template(TestCase):
 
         SamTemplateMock.assert_called_with(template_dict)
 
-        # Make sure this is called only for Apis
-        sam_template.iterate.assert_any_call({"AWS::Serverless::Api"})
-        sam_template.iterate.assert_any_call({"AWS::Serverless::HttpApi"})
+        # Make sure this is called only for Apis, in a single pass
+        sam_template.iterate.assert_called_once_with({"AWS::Serverless::Api", "AWS::Serverless::HttpApi"})
+        self.assertIn("swagger", api_resources[0][1].properties["DefinitionBody"])
+        self.assertIn("openapi", api_resources[1][1].properties["DefinitionBody"])
+        self.assertIn("swagger", api_resources[2][1].properties["DefinitionBody"])
 
 
 class ApiResource:
-    def __init__(self):
+    def __init__(self, type):
+        self.type = type
         self.properties = {}
@@ -565,7 +565,7 @@ class TestImplicitRestApiPlugin_add_api_to_swagger(TestCase):
         SwaggerEditorMock.is_valid.return_value = True
         editor_mock = Mock()
         SwaggerEditorMock.return_value = editor_mock
-        editor_mock.swagger = updated_swagger
+        editor_mock.release_document.return_value = updated_swagger
         self.plugin.EDITOR_CLASS = SwaggerEditorMock
 
         template_mock = Mock()
@@ -603,7 +603,7 @@ class TestImplicitRestApiPlugin_add_api_to_swagger(TestCase):
         SwaggerEditorMock.is_valid.return_value = True
         editor_mock = Mock()
         SwaggerEditorMock.return_value = editor_mock
-        editor_mock.swagger = updated_swagger
+        editor_mock.release_document.return_value = updated_swagger
         self.plugin.EDITOR_CLASS = SwaggerEditorMock
 
         template_mock = Mock()
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
@@ -491,3 +492,49 @@ class TestServerlessAppPlugin_on_before_and_on_after_transform_template(TestCase
         self.assertEqual(client.get_cloud_formation_template.call_count, 1)
         self.assertEqual(client.create_cloud_formation_template.call_count, 2)
         self.assertGreaterEqual(plugin._get_sleep_time_sec.call_count, 2)
+
+
+class TestServerlessAppPlugin_executor(TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor()
+        self.addCleanup(self.executor.shutdown)
+        self.client = Mock()
+        self.plugin = ServerlessAppPlugin(sar_client=self.client, executor=self.executor)
+        self.properties = ApplicationResource(app_id="id1", semver="1.0.0", location=True).properties
+
+    @patch("samtranslator.plugins.application.serverless_app_plugin.SamTemplate")
+    def transform(self, SamTemplateMock):
+        SamTemplateMock.return_value.iterate.return_value = [
+            ("id1", ApplicationResource(app_id="id1", semver="1.0.0", location=True)),
+            ("id2", ApplicationResource(app_id="id1", semver="1.0.0", location=True)),
+        ]
+        self.plugin.on_before_transform_template({})
+        self.plugin.on_before_transform_resource("id1", "AWS::Serverless::Application", self.properties)
+
+    def test_must_make_sar_calls_on_executor(self):
+        self.client.create_cloud_formation_template.return_value = {"TemplateUrl": "/URL", "Status": STATUS_ACTIVE}
+
+        self.transform()
+        self.plugin.on_after_transform_template({})
+
+        self.assertEqual("/URL", self.properties["TemplateUrl"])
+        self.client.create_cloud_formation_template.assert_called_once_with(
+            ApplicationId="id1", SemanticVersion="1.0.0"
+        )
+
+    def test_must_raise_sar_errors_when_application_is_transformed(self):
+        self.client.create_cloud_formation_template.side_effect = ClientError(
+            {"Error": {"Code": "BadBadError"}}, "CreateCloudFormationTemplate"
+        )
+
+        with self.assertRaises(ClientError):
+            self.transform()
+
+    def test_must_raise_invalid_resource_errors_when_application_is_transformed(self):
+        self.client.create_cloud_formation_template.side_effect = ClientError(
+            {"Error": {"Code": "TooManyRequestsException"}}, "CreateCloudFormationTemplate"
+        )
+        self.plugin.TEMPLATE_WAIT_TIMEOUT_SECONDS = 0
+
+        with self.assertRaises(InvalidResourceException):
+            self.transform()
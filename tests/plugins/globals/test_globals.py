@@ -360,6 +360,35 @@ class TestGlobalsObject(TestCase):
         with self.assertRaises(InvalidResourceAttributeTypeException):
             globals.get_template_globals("MyFunction", type, ["prop3"])
 
+    def test_get_template_globals_error_on_duplicate_ignore_globals(self):
+        type = "prefix_type1"
+        globals = Globals(self.template)
+
+        with self.assertRaises(InvalidResourceAttributeTypeException):
+            globals.get_template_globals("MyFunction", type, ["prop1", "prop1"])
+
+    def test_get_template_globals_list_ignore_globals_is_shared(self):
+        type = "prefix_type1"
+        globals = Globals(self.template)
+
+        result1 = globals.get_template_globals("MyFunction1", type, ["prop1"])
+        result2 = globals.get_template_globals("MyFunction2", type, ["prop1"])
+        result3 = globals.get_template_globals("MyFunction3", type, ["prop2"])
+
+        self.assertIs(result1, result2)
+        self.assertEqual(result3.global_properties, {"prop1": "value1"})
+        # Filtering must never modify the unfiltered globals
+        self.assertEqual(
+            globals.get_template_globals("MyFunction4", type, None).global_properties,
+            {"prop1": "value1", "prop2": "value2"},
+        )
+
+    def test_has_globals(self):
+        globals = Globals(self.template)
+
+        self.assertTrue(globals.has_globals("prefix_type1"))
+        self.assertFalse(globals.has_globals("some random type"))
+
     def test_merge_end_to_end_on_known_type1(self):
         type = "prefix_type1"
         properties = {"prop1": "overridden value", "a": "b", "key": [1, 2, 3]}
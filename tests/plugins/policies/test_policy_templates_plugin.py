@@ -221,3 +221,14 @@ class TestPolicyTemplatesForResourcePlugin(TestCase):
 
         # Since length was zero, get() should never be called
         function_policies_obj_mock.get.assert_not_called()
+
+    def test_must_convert_identical_policy_templates_once(self):
+        self._policy_template_processor_mock.convert.return_value = {"Statement": [{"Action": "sqs:*"}]}
+
+        first = self.plugin._process_policy_template("logicalId1", {"SQSPollerPolicy": {"QueueName": "q"}})
+        second = self.plugin._process_policy_template("logicalId2", {"SQSPollerPolicy": {"QueueName": "q"}})
+        self.plugin._process_policy_template("logicalId3", {"SQSPollerPolicy": {"QueueName": "other"}})
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(2, self._policy_template_processor_mock.convert.call_count)
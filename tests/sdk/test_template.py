@@ -70,6 +70,13 @@ class TestSamTemplate(TestCase):
         actual = [(id, resource.to_dict()) for id, resource in template.iterate({type})]
         self.assertEqual(expected, actual)
 
+    def test_iterate_with_filter_must_skip_resources_with_non_string_type(self):
+        self.template_dict["Resources"]["Intrinsic"] = {"Type": {"Ref": "SomeType"}}
+        template = SamTemplate(self.template_dict)
+
+        actual = [id for id, _ in template.iterate({"AWS::Serverless::Api"})]
+        self.assertEqual(["Api"], actual)
+
     def test_set_must_add_to_template(self):
         template = SamTemplate(self.template_dict)
         template.set("NewResource", {"Type": "something"})
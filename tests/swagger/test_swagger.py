@@ -4,6 +4,7 @@ from unittest.mock import Mock
 
 from parameterized import param, parameterized
 from samtranslator.model.exceptions import InvalidDocumentException, InvalidTemplateException
+from samtranslator.open_api.base_editor import editor_session, enable_resource_policy_statement_merging
 from samtranslator.swagger.swagger import SwaggerEditor
 from samtranslator.utils.py27hash_fix import Py27Dict
 
@@ -633,6 +634,73 @@ class TestSwaggerEditor_swagger_property(TestCase):
         self.assertEqual({}, input["paths"])  # Editor works on a diff copy of input
 
 
+class TestSwaggerEditor_release_document(TestCase):
+    def setUp(self):
+        self.original_swagger = Py27Dict({"swagger": "2.0", "paths": Py27Dict()})
+        # These paths collide, so copies of the paths reorder them
+        for path in ["/two", "/one", "/any"]:
+            self.original_swagger["paths"][path] = Py27Dict({"get": Py27Dict()})
+
+    def add_paths(self, swagger, paths):
+        for path in paths:
+            editor = SwaggerEditor(swagger, edited_path=path)
+            editor.add_lambda_integration(path, "post", "uri", {}, {})
+            swagger = editor.release_document()
+        return swagger
+
+    def test_must_give_same_document_as_copies(self):
+        expected = self.original_swagger
+        for path in ["/three", "/one", "/four"]:
+            editor = SwaggerEditor(expected)
+            editor.add_lambda_integration(path, "post", "uri", {}, {})
+            expected = editor.swagger
+
+        with editor_session():
+            swagger = self.add_paths(self.original_swagger, ["/three", "/one", "/four"])
+
+        self.assertEqual(str(SwaggerEditor(expected).swagger), str(SwaggerEditor(swagger).swagger))
+
+    def test_must_only_copy_edited_path_of_released_document(self):
+        with editor_session():
+            released = self.add_paths(self.original_swagger, ["/three"])
+            swagger = self.add_paths(released, ["/one"])
+
+        self.assertIs(released["paths"]["/three"], swagger["paths"]["/three"])
+        self.assertIsNot(released["paths"]["/one"], swagger["paths"]["/one"])
+        self.assertEqual({"get": {}}, released["paths"]["/one"])
+        self.assertIn("post", swagger["paths"]["/one"])
+
+    def test_must_leave_released_document_unchanged_when_editor_is_discarded(self):
+        with editor_session():
+            released = self.add_paths(self.original_swagger, ["/three"])
+            SwaggerEditor(released, edited_path="/four").add_path("/four", "get")
+            editor = SwaggerEditor(released, edited_path="/four")
+
+        self.assertNotIn("/four", released["paths"])
+        self.assertFalse(editor.has_path("/four"))
+
+    def test_must_share_resource_policy_statements_with_released_document(self):
+        with editor_session():
+            editor = SwaggerEditor(self.original_swagger)
+            editor.add_resource_policy({"IpRangeWhitelist": ["1.2.3.4"]}, "/one", "prod")
+            released = editor.release_document()
+            editor = SwaggerEditor(released, edited_path="/two")
+            editor.add_resource_policy({"IpRangeWhitelist": ["1.2.3.4"]}, "/two", "prod")
+            swagger = editor.release_document()
+
+        released_statements = released[_X_POLICY]["Statement"]
+        self.assertEqual(2, len(released_statements))
+        self.assertEqual(4, len(swagger[_X_POLICY]["Statement"]))
+        self.assertIs(released_statements[0], swagger[_X_POLICY]["Statement"][0])
+
+    def test_must_copy_whole_document_outside_of_session(self):
+        released = self.add_paths(self.original_swagger, ["/three"])
+
+        editor = SwaggerEditor(released, edited_path="/one")
+
+        self.assertIsNot(released["paths"]["/three"], editor.paths["/three"])
+
+
 class TestSwaggerEditor_is_valid(TestCase):
     @parameterized.expand(
         [
@@ -1472,6 +1540,96 @@ class TestSwaggerEditor_add_resource_policy(TestCase):
         self.assertEqual(deep_sort_lists(expected), deep_sort_lists(self.editor.swagger[_X_POLICY]))
 
 
+class TestSwaggerEditor_merge_resource_policy_statements(TestCase):
+    def setUp(self):
+        self.original_swagger = {
+            "swagger": "2.0",
+            "paths": {"/foo": {"get": {}}, "/bar": {"post": {}}, "/baz": {"get": {}}},
+        }
+
+    def add_resource_policy(self, swagger, resource_policy, paths):
+        for path in paths:
+            editor = SwaggerEditor(swagger, edited_path=path)
+            editor.add_resource_policy(resource_policy, path, "prod")
+            swagger = editor.release_document()
+        return swagger
+
+    def test_must_merge_resources_of_statements_that_only_differ_by_resources(self):
+        resource_policy = {"AwsAccountWhitelist": ["123456"], "IpRangeBlacklist": ["1.2.3.4"]}
+
+        with editor_session():
+            enable_resource_policy_statement_merging()
+            policy = self.add_resource_policy(self.original_swagger, resource_policy, ["/foo", "/bar", "/foo"])[
+                _X_POLICY
+            ]
+
+        resources = [
+            {"Fn::Sub": ["execute-api:/${__Stage__}/GET/foo", {"__Stage__": "prod"}]},
+            {"Fn::Sub": ["execute-api:/${__Stage__}/POST/bar", {"__Stage__": "prod"}]},
+        ]
+        expected = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Action": "execute-api:Invoke",
+                    "Resource": resources,
+                    "Effect": "Allow",
+                    "Principal": {"AWS": ["123456"]},
+                },
+                {"Action": "execute-api:Invoke", "Resource": resources, "Effect": "Allow", "Principal": "*"},
+                {
+                    "Action": "execute-api:Invoke",
+                    "Resource": resources,
+                    "Effect": "Deny",
+                    "Principal": "*",
+                    "Condition": {"IpAddress": {"aws:SourceIp": ["1.2.3.4"]}},
+                },
+            ],
+        }
+        self.assertEqual(expected, policy)
+
+    def test_must_keep_statements_with_different_conditions(self):
+        with editor_session():
+            enable_resource_policy_statement_merging()
+            editor = SwaggerEditor(self.original_swagger)
+            editor.add_resource_policy({"IpRangeBlacklist": ["1.2.3.4"]}, "/foo", "prod")
+            editor.add_resource_policy({"IpRangeBlacklist": ["5.6.7.8"]}, "/bar", "prod")
+            editor.add_resource_policy({"SourceVpcWhitelist": ["vpc-1"]}, "/baz", "prod")
+
+        statements = editor.swagger[_X_POLICY]["Statement"]
+        self.assertEqual(
+            [("Allow", None, 3), ("Deny", "IpAddress", 1), ("Deny", "IpAddress", 1), ("Deny", "StringNotEquals", 1)],
+            [
+                (statement["Effect"], next(iter(statement.get("Condition", {None: None}))), len(statement["Resource"]))
+                for statement in statements
+            ],
+        )
+
+    def test_must_not_change_statements_of_released_document(self):
+        resource_policy = {"IpRangeWhitelist": ["1.2.3.4"]}
+
+        with editor_session():
+            enable_resource_policy_statement_merging()
+            released = self.add_resource_policy(self.original_swagger, resource_policy, ["/foo"])
+            released_policy = copy.deepcopy(released[_X_POLICY])
+            swagger = self.add_resource_policy(released, resource_policy, ["/bar"])
+
+        self.assertEqual(released_policy, released[_X_POLICY])
+        self.assertEqual(2, len(swagger[_X_POLICY]["Statement"][0]["Resource"]))
+
+    def test_must_add_statement_per_path_without_merging(self):
+        with editor_session():
+            policy = self.add_resource_policy(
+                self.original_swagger, {"IpRangeWhitelist": ["1.2.3.4"]}, ["/foo", "/bar"]
+            )[_X_POLICY]
+
+        self.assertEqual(4, len(policy["Statement"]))
+
+    def test_must_require_editor_session(self):
+        with self.assertRaises(RuntimeError):
+            enable_resource_policy_statement_merging()
+
+
 class TestSwaggerEditor_add_authorization_scopes(TestCase):
     def setUp(self):
         self.api = {
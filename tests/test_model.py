@@ -1,6 +1,6 @@
 from typing import Any
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from samtranslator.internal.schema_source.common import BaseModel
@@ -94,6 +94,38 @@ def test_resource_type_validation(logical_id, resource_dict, expected_exception)
             resource = DummyResource.from_dict(logical_id, resource_dict)
 
 
+class TestResourcePropertiesValidation(TestCase):
+    def test_to_dict_must_not_revalidate_validated_properties(self):
+        resource = DummyResource.from_dict(
+            "id", {"Type": "AWS::Dummy::Resource", "Properties": {"RequiredProperty": True}}
+        )
+
+        with patch.object(DummyResource, "validate_properties") as validate_properties_mock:
+            resource.to_dict()
+
+        validate_properties_mock.assert_not_called()
+
+    def test_to_dict_must_revalidate_after_property_is_set(self):
+        resource = DummyResource.from_dict(
+            "id", {"Type": "AWS::Dummy::Resource", "Properties": {"RequiredProperty": True}}
+        )
+        resource.OptionalProperty = False
+
+        with pytest.raises(InvalidResourceException):
+            resource.to_dict()
+
+    def test_to_dict_must_validate_new_resource(self):
+        resource = DummyResource("id")
+
+        with pytest.raises(InvalidResourceException):
+            resource.to_dict()
+
+        resource.RequiredProperty = True
+        self.assertEqual(
+            resource.to_dict(), {"id": {"Type": "AWS::Dummy::Resource", "Properties": {"RequiredProperty": True}}}
+        )
+
+
 class TestResourceAttributes(TestCase):
     class MyResource(Resource):
         resource_type = "foo"
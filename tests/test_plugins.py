@@ -268,6 +268,35 @@ class TestSamPluginsAct(TestCase):
         # Since Plugin2 raised the exception, plugin3's hook must NEVER be called
         parent_mock.assert_has_calls([call.plugin1_hook(), call.plugin2_hook()])
 
+    def test_act_must_skip_plugins_without_hook_implementation(self):
+        plugin1 = _make_mock_plugin("plugin1")
+        plugin1.on_before_transform_template = Mock()
+        plugin2 = Yoyoyo()
+
+        self.sam_plugins.register(plugin1)
+        self.sam_plugins.register(plugin2)
+        self.sam_plugins.act(LifeCycleEvents.before_transform_template, "template")
+
+        plugin1.on_before_transform_template.assert_called_once_with("template")
+        self.assertEqual(
+            [(plugin1, plugin1.on_before_transform_template)],
+            self.sam_plugins._get_hooks(LifeCycleEvents.before_transform_template),
+        )
+
+    def test_act_must_invoke_plugins_registered_after_previous_act(self):
+        plugin1 = _make_mock_plugin("plugin1")
+        setattr(plugin1, "on_" + self.my_event.name, Mock())
+        plugin2 = _make_mock_plugin("plugin2")
+        setattr(plugin2, "on_" + self.my_event.name, Mock())
+
+        self.sam_plugins.register(plugin1)
+        self.sam_plugins.act(self.my_event)
+        self.sam_plugins.register(plugin2)
+        self.sam_plugins.act(self.my_event)
+
+        self.assertEqual(2, plugin1.on_my_event.call_count)
+        plugin2.on_my_event.assert_called_once_with()
+
 
 class Yoyoyo(BasePlugin):
     pass
@@ -1,5 +1,5 @@
 import pytest
-from samtranslator.model.types import IS_INT, dict_of, is_type, list_of, one_of
+from samtranslator.model.types import IS_DICT, IS_INT, IS_STR, dict_of, is_type, list_of, one_of
 
 
 class DummyType:
@@ -86,6 +86,12 @@ def test_dict_of_validator(value, key_type, value_type, should_pass):
         ([1, 2, 3], [IS_INT, list_of(IS_INT)], True),
         # Value of neither expected type
         ("Hello, World!", [IS_INT, list_of(IS_INT)], False),
+        # Only plain type validators
+        ("Hello, World!", [IS_STR, IS_DICT], True),
+        ({"1": 1}, [IS_STR, IS_DICT], True),
+        (1, [IS_STR, IS_DICT], False),
+        # No validators
+        (1, [], False),
     ],
 )
 def test_one_of_validator(value, validators, should_pass):
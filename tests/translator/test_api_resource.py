@@ -1,3 +1,4 @@
+import hashlib
 import json
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
@@ -124,7 +125,10 @@ class TestApiGatewayDeploymentResource(TestCase):
         self.assertEqual(deployment.logical_id, id_val)
         self.assertEqual(deployment.Description, f"RestApi deployment id: {full_hash}")
 
-        LogicalIdGeneratorMock.assert_called_once_with(prefix, str(swagger))
+        # Hash must be the same as the SHA1 of str(swagger) for backwards compatibility
+        LogicalIdGeneratorMock.assert_called_once_with(
+            prefix, data_hash=hashlib.sha1(str(swagger).encode("utf-8")).hexdigest()
+        )
         generator_mock.gen.assert_called_once_with()
         generator_mock.get_hash.assert_called_once_with(length=40)  # getting full SHA
         stage.update_deployment_ref.assert_called_once_with(id_val)
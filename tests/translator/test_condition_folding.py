@@ -0,0 +1,208 @@
+from unittest import TestCase
+
+from parameterized import parameterized
+from samtranslator.translator.condition_folding import fold_known_conditions
+
+NO_VALUE = {"Ref": "AWS::NoValue"}
+
+
+def make_template(conditions, resources=None, **sections):
+    return {
+        "Parameters": {"Env": {"Type": "String", "Default": "dev"}, "Other": {"Type": "String"}},
+        "Conditions": conditions,
+        "Resources": resources or {"Topic": {"Type": "AWS::SNS::Topic"}},
+        **sections,
+    }
+
+
+IS_PROD = {"Fn::Equals": [{"Ref": "Env"}, "prod"]}
+IS_DEV = {"Fn::Equals": [{"Ref": "Env"}, "dev"]}
+IS_OTHER = {"Fn::Equals": [{"Ref": "Other"}, "value"]}
+
+
+class TestFoldKnownConditions(TestCase):
+    def test_must_remove_resources_and_outputs_excluded_by_conditions(self):
+        template = make_template(
+            {"IsProd": IS_PROD, "IsDev": IS_DEV},
+            {
+                "ProdTopic": {"Type": "AWS::SNS::Topic", "Condition": "IsProd"},
+                "DevTopic": {"Type": "AWS::SNS::Topic", "Condition": "IsDev"},
+                "Queue": {"Type": "AWS::SQS::Queue", "DependsOn": ["DevTopic", "ProdTopic"]},
+                "OtherQueue": {"Type": "AWS::SQS::Queue", "DependsOn": "DevTopic"},
+            },
+            Outputs={
+                "DevTopic": {"Condition": "IsDev", "Value": {"Ref": "DevTopic"}},
+                "ProdTopic": {"Condition": "IsProd", "Value": {"Ref": "ProdTopic"}},
+            },
+        )
+
+        self.assertEqual(2, fold_known_conditions(template, {"Env": "prod"}))
+
+        self.assertEqual(
+            {
+                "ProdTopic": {"Type": "AWS::SNS::Topic"},
+                "Queue": {"Type": "AWS::SQS::Queue", "DependsOn": ["ProdTopic"]},
+                "OtherQueue": {"Type": "AWS::SQS::Queue"},
+            },
+            template["Resources"],
+        )
+        self.assertEqual({"ProdTopic": {"Value": {"Ref": "ProdTopic"}}}, template["Outputs"])
+        self.assertNotIn("Conditions", template)
+
+    def test_must_fold_embedded_connectors(self):
+        def make_connector(condition):
+            return {"Condition": condition, "Properties": {"Destination": {"Id": "Topic"}, "Permissions": ["Write"]}}
+
+        template = make_template(
+            {"IsProd": IS_PROD, "IsDev": IS_DEV},
+            {
+                "Topic": {"Type": "AWS::SNS::Topic"},
+                "Function": {
+                    "Type": "AWS::Serverless::Function",
+                    "Connectors": {"ProdConnector": make_connector("IsProd"), "DevConnector": make_connector("IsDev")},
+                },
+                "OtherFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Connectors": {"DevConnector": make_connector("IsDev")},
+                },
+            },
+        )
+
+        fold_known_conditions(template, {"Env": "prod"})
+
+        prod_connector = make_connector("IsProd")
+        del prod_connector["Condition"]
+        self.assertEqual({"ProdConnector": prod_connector}, template["Resources"]["Function"]["Connectors"])
+        self.assertNotIn("Connectors", template["Resources"]["OtherFunction"])
+        self.assertNotIn("Conditions", template)
+
+    def test_must_remove_outputs_emptied_by_folding(self):
+        template = make_template({"IsProd": IS_PROD}, Outputs={"Topic": {"Condition": "IsProd", "Value": "topic"}})
+
+        fold_known_conditions(template, {"Env": "dev"})
+
+        self.assertNotIn("Outputs", template)
+
+    def test_must_replace_if_with_branch_taken(self):
+        template = make_template(
+            {"IsProd": IS_PROD, "IsOther": IS_OTHER},
+            {
+                "Topic": {
+                    "Type": "AWS::SNS::Topic",
+                    "Properties": {
+                        "TopicName": {"Fn::If": ["IsProd", "prod", {"Fn::If": ["IsOther", "other", "dev"]}]},
+                        "DisplayName": {"Fn::If": ["IsProd", NO_VALUE, "Topic"]},
+                        "Tags": [
+                            {"Fn::If": ["IsProd", {"Key": "Env", "Value": "prod"}, NO_VALUE]},
+                            {"Fn::If": ["IsProd", NO_VALUE, {"Key": "Env", "Value": "dev"}]},
+                        ],
+                        "KmsMasterKeyId": NO_VALUE,
+                    },
+                }
+            },
+        )
+
+        fold_known_conditions(template, {"Env": "dev"})
+
+        self.assertEqual(
+            {
+                "TopicName": {"Fn::If": ["IsOther", "other", "dev"]},
+                "DisplayName": "Topic",
+                "Tags": [{"Key": "Env", "Value": "dev"}],
+                "KmsMasterKeyId": NO_VALUE,
+            },
+            template["Resources"]["Topic"]["Properties"],
+        )
+        self.assertEqual({"IsOther": IS_OTHER}, template["Conditions"])
+
+    def test_must_fold_globals(self):
+        template = make_template(
+            {"IsProd": IS_PROD}, Globals={"Function": {"MemorySize": {"Fn::If": ["IsProd", 1024, 128]}}}
+        )
+
+        fold_known_conditions(template, {"Env": "prod"})
+
+        self.assertEqual({"Function": {"MemorySize": 1024}}, template["Globals"])
+
+    @parameterized.expand(
+        [
+            ({"Fn::And": [IS_PROD, IS_OTHER]}, {"Env": "prod"}, None),
+            ({"Fn::And": [IS_PROD, IS_OTHER]}, {"Env": "dev"}, False),
+            ({"Fn::Or": [IS_PROD, IS_OTHER]}, {"Env": "prod"}, True),
+            ({"Fn::Or": [IS_PROD, IS_OTHER]}, {"Env": "dev"}, None),
+            ({"Fn::Or": [IS_PROD, IS_OTHER]}, {"Env": "dev", "Other": "value"}, True),
+            ({"Fn::Not": [IS_PROD]}, {"Env": "prod"}, False),
+            ({"Fn::Not": [{"Condition": "IsProd"}]}, {"Env": "dev"}, True),
+            ({"Fn::Equals": [{"Ref": "AWS::Region"}, "us-east-1"]}, {"AWS::Region": "us-east-1"}, True),
+            ({"Fn::Equals": [True, "true"]}, {}, True),
+            ({"Fn::Equals": [1, "2"]}, {}, False),
+            # Parameters without a given value may get another value than their default at deployment
+            (IS_DEV, {}, None),
+            # Values that aren't parameters of the template aren't known
+            ({"Fn::Equals": [{"Ref": "Topic"}, "value"]}, {"Topic": "value"}, None),
+            ({"Fn::Equals": [{"Fn::Select": [0, ["prod"]]}, "prod"]}, {"Env": "prod"}, None),
+            ({"Fn::Equals": [{"Ref": "Env"}]}, {"Env": "prod"}, None),
+        ]
+    )
+    def test_must_evaluate_conditions(self, condition, parameter_values, expected):
+        template = make_template(
+            {"IsProd": IS_PROD, "Condition": condition},
+            {
+                "Topic": {"Type": "AWS::SNS::Topic"},
+                "ConditionTopic": {"Type": "AWS::SNS::Topic", "Condition": "Condition"},
+            },
+        )
+
+        fold_known_conditions(template, parameter_values)
+
+        if expected is None:
+            self.assertEqual("Condition", template["Resources"]["ConditionTopic"]["Condition"])
+            self.assertEqual(condition, template["Conditions"]["Condition"])
+        elif expected:
+            self.assertEqual({"Type": "AWS::SNS::Topic"}, template["Resources"]["ConditionTopic"])
+        else:
+            self.assertNotIn("ConditionTopic", template["Resources"])
+
+    @parameterized.expand(
+        [
+            ("AWS::SSM::Parameter::Value<String>", "/config/env"),
+            ("AWS::SSM::Parameter::Name", "/config/env"),
+            ("String", "{{resolve:ssm:/config/env}}"),
+        ]
+    )
+    def test_must_leave_values_resolved_at_deployment_unknown(self, parameter_type, value):
+        template = make_template(
+            {"IsProd": IS_PROD},
+            {"Topic": {"Type": "AWS::SNS::Topic", "Condition": "IsProd"}, "Queue": {"Type": "AWS::SQS::Queue"}},
+        )
+        template["Parameters"]["Env"]["Type"] = parameter_type
+
+        self.assertEqual(0, fold_known_conditions(template, {"Env": value}))
+
+        self.assertEqual({"IsProd": IS_PROD}, template["Conditions"])
+        self.assertEqual("IsProd", template["Resources"]["Topic"]["Condition"])
+
+    def test_must_keep_known_conditions_used_by_kept_conditions(self):
+        template = make_template(
+            {"IsProd": IS_PROD, "IsProdOther": {"Fn::And": [{"Condition": "IsProd"}, IS_OTHER]}},
+            {"Topic": {"Type": "AWS::SNS::Topic", "Condition": "IsProdOther"}},
+        )
+
+        fold_known_conditions(template, {"Env": "prod"})
+
+        self.assertEqual(["IsProd", "IsProdOther"], list(template["Conditions"]))
+
+    def test_must_leave_template_unchanged_when_no_resource_would_be_left(self):
+        template = make_template({"IsProd": IS_PROD}, {"Topic": {"Type": "AWS::SNS::Topic", "Condition": "IsProd"}})
+
+        self.assertEqual(0, fold_known_conditions(template, {"Env": "dev"}))
+
+        self.assertEqual({"Topic": {"Type": "AWS::SNS::Topic", "Condition": "IsProd"}}, template["Resources"])
+        self.assertEqual({"IsProd": IS_PROD}, template["Conditions"])
+
+    def test_must_leave_conditions_referring_to_themselves_unknown(self):
+        conditions = {"A": {"Fn::Not": [{"Condition": "B"}]}, "B": {"Fn::Not": [{"Condition": "A"}]}}
+        template = make_template(conditions)
+
+        self.assertEqual(0, fold_known_conditions(template, {"Env": "prod"}))
+        self.assertEqual(conditions, template["Conditions"])
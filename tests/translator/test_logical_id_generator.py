@@ -3,7 +3,8 @@ import json
 from unittest import TestCase
 from unittest.mock import patch
 
-from samtranslator.translator.logical_id_generator import LogicalIdGenerator
+from samtranslator.translator import logical_id_generator
+from samtranslator.translator.logical_id_generator import LogicalIdGenerator, canonical_json_cache
 
 
 class TestLogicalIdGenerator(TestCase):
@@ -173,16 +174,38 @@ class TestLogicalIdGenerator(TestCase):
         # Strings should be returned unmodified ie. json dump is short circuited
         self.assertEqual(data, generator._stringify(data))
 
-    @patch.object(json, "dumps")
-    def test_stringify_expectations(self, json_dumps_mock):
-        data = ["foo"]
-        expected = "bar"
-        json_dumps_mock.return_value = expected
+    def test_stringify_expectations(self):
+        data = {"foo": ["bar", {"b": 1, "a": None}], "baz": "\u00e9", "qux": 1.5}
 
         generator = LogicalIdGenerator(self.prefix, data_obj=data)
-        self.assertEqual(expected, generator._stringify(data))
+        self.assertEqual(json.dumps(data, separators=(",", ":"), sort_keys=True), generator._stringify(data))
+
+    def test_stringify_with_cache_must_match_without_cache(self):
+        shared = {"SubnetIds": ["b", "a"], "SecurityGroupIds": [{"Ref": "Sg"}]}
+        data1 = {"VpcConfig": shared, "Handler": "index.handler", "MemorySize": 128}
+        data2 = {"VpcConfig": shared, "Handler": "other.handler", "Layers": []}
+
+        expected1 = LogicalIdGenerator(self.prefix, data_obj=data1).gen()
+        expected2 = LogicalIdGenerator(self.prefix, data_obj=data2).gen()
+        expected_list = LogicalIdGenerator(self.prefix, data_obj=["a", shared]).gen()
+
+        with canonical_json_cache():
+            self.assertEqual(expected1, LogicalIdGenerator(self.prefix, data_obj=data1).gen())
+            self.assertEqual(expected2, LogicalIdGenerator(self.prefix, data_obj=data2).gen())
+            self.assertEqual(expected_list, LogicalIdGenerator(self.prefix, data_obj=["a", shared]).gen())
+
+    def test_stringify_with_cache_must_reuse_shared_values(self):
+        shared = {"Variables": {"TABLE": "table"}}
+        generator = LogicalIdGenerator(self.prefix)
+
+        with canonical_json_cache():
+            generator._stringify({"Environment": shared, "Runtime": "python3.14"})
+            generator._stringify({"Environment": shared, "Runtime": "python3.13"})
+            cache = logical_id_generator._canonical_json_cache.get()
+            self.assertEqual(cache[id(shared)], (shared, '{"Variables":{"TABLE":"table"}}'))
 
-        json_dumps_mock.assert_called_with(data, separators=(",", ":"), sort_keys=True)
+        # Cache only lives within the context
+        self.assertIsNone(logical_id_generator._canonical_json_cache.get())
 
     @patch.object(json, "dumps")
     def test_stringify_expectations_for_string(self, json_dumps_mock):
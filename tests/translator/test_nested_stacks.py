@@ -0,0 +1,340 @@
+import json
+import re
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from samtranslator.parser.parser import Parser
+from samtranslator.translator.nested_stacks import NestedStackSplitter
+from samtranslator.translator.translator import Translator
+
+
+def topic(**properties):
+    return {"Type": "AWS::SNS::Topic", "Properties": properties}
+
+
+def find_values(value, key):
+    if isinstance(value, list):
+        for item in value:
+            yield from find_values(item, key)
+    elif isinstance(value, dict):
+        for k, v in value.items():
+            if k == key:
+                yield v
+            yield from find_values(v, key)
+
+
+def assert_valid_references(test, template):
+    """Checks that the references of a template resolve within it."""
+    resources = template.get("Resources", {})
+    names = set(resources) | set(template.get("Parameters", {}))
+    for ref in find_values(resources, "Ref"):
+        test.assertTrue(ref in names or ref.startswith("AWS::"), ref)
+    for get_att in find_values([resources, template.get("Outputs")], "Fn::GetAtt"):
+        logical_id = get_att[0] if isinstance(get_att, list) else get_att.split(".")[0]
+        test.assertIn(logical_id, resources)
+    for sub in find_values(resources, "Fn::Sub"):
+        text = sub[0] if isinstance(sub, list) else sub
+        variables = sub[1] if isinstance(sub, list) else {}
+        for reference in re.findall(r"\$\{([A-Za-z0-9\.]+)\}", text):
+            test.assertTrue(reference in variables or reference.split(".")[0] in names, reference)
+    conditions = set(template.get("Conditions", {}))
+    for resource in resources.values():
+        if "Condition" in resource:
+            test.assertIn(resource["Condition"], conditions)
+        depends_on = resource.get("DependsOn", [])
+        for dependency in [depends_on] if isinstance(depends_on, str) else depends_on:
+            test.assertIn(dependency, resources)
+
+
+class TestNestedStackSplitter(TestCase):
+    def assert_valid_split(self, split, max_resources, max_parameters=200, max_outputs=200):
+        assert_valid_references(self, split.template)
+        for stack_logical_id, nested_template in split.nested_templates.items():
+            self.assertLessEqual(len(nested_template["Resources"]), max_resources)
+            self.assertLessEqual(len(nested_template.get("Parameters", {})), max_parameters)
+            self.assertLessEqual(len(nested_template.get("Outputs", {})), max_outputs)
+            assert_valid_references(self, nested_template)
+            self.assertNotIn("AWS::StackName", list(find_values(nested_template, "Ref")))
+            stack = split.template["Resources"][stack_logical_id]
+            self.assertEqual(set(nested_template.get("Parameters", {})), set(stack["Properties"].get("Parameters", {})))
+        for get_att in find_values(split.template, "Fn::GetAtt"):
+            output = get_att[1].split(".", 1)[1]
+            self.assertIn(output, split.nested_templates[get_att[0]]["Outputs"])
+
+    def test_template_within_budgets_must_not_be_split(self):
+        template = {"Resources": {"A": topic(), "B": topic()}}
+
+        split = NestedStackSplitter(max_resources=2).split(template)
+
+        self.assertIs(template, split.template)
+        self.assertEqual({}, split.nested_templates)
+
+    def test_must_reject_invalid_budgets(self):
+        with self.assertRaises(ValueError):
+            NestedStackSplitter(max_resources=0)
+        with self.assertRaises(ValueError):
+            NestedStackSplitter(max_outputs=0)
+
+    def test_must_pass_references_between_nested_stacks(self):
+        template = {
+            "Resources": {
+                "A": topic(),
+                "B": topic(DisplayName={"Fn::GetAtt": ["A", "TopicName"]}),
+                "C": topic(DisplayName={"Fn::Sub": "${A}-${B.TopicName}"}),
+                "D": topic(DisplayName={"Ref": "A"}),
+            }
+        }
+
+        split = NestedStackSplitter(max_resources=2).split(template)
+
+        self.assertEqual(["NestedStack1", "NestedStack2"], list(split.template["Resources"]))
+        first, second = split.nested_templates.values()
+        self.assertEqual(["A", "B"], list(first["Resources"]))
+        self.assertEqual(
+            {"A": {"Value": {"Ref": "A"}}, "BTopicName": {"Value": {"Fn::GetAtt": ["B", "TopicName"]}}},
+            first["Outputs"],
+        )
+        self.assertEqual({"Fn::Sub": "${A}-${BTopicName}"}, second["Resources"]["C"]["Properties"]["DisplayName"])
+        self.assertEqual({"Ref": "A"}, second["Resources"]["D"]["Properties"]["DisplayName"])
+        self.assertEqual(
+            {
+                "A": {"Fn::GetAtt": ["NestedStack1", "Outputs.A"]},
+                "BTopicName": {"Fn::GetAtt": ["NestedStack1", "Outputs.BTopicName"]},
+            },
+            split.template["Resources"]["NestedStack2"]["Properties"]["Parameters"],
+        )
+        self.assertEqual("NestedStack1.json", split.template["Resources"]["NestedStack1"]["Properties"]["TemplateURL"])
+        self.assert_valid_split(split, 2)
+
+    def test_must_place_resources_after_their_dependencies(self):
+        template = {
+            "Resources": {
+                "C": topic(DisplayName={"Ref": "B"}),
+                "B": topic(DisplayName={"Fn::GetAtt": "A.TopicName"}),
+                "A": topic(),
+            }
+        }
+
+        split = NestedStackSplitter(max_resources=1).split(template)
+
+        self.assertEqual(
+            [["A"], ["B"], ["C"]], [list(nested["Resources"]) for nested in split.nested_templates.values()]
+        )
+        self.assert_valid_split(split, 1)
+
+    def test_must_keep_resource_groups_together(self):
+        template = {"Resources": {"A": topic(), "B": topic(), "C": topic(), "D": topic()}}
+
+        split = NestedStackSplitter(max_resources=2).split(template, [["A", "C"], ["B", "D"]])
+
+        self.assertEqual(
+            [["A", "C"], ["B", "D"]], [list(nested["Resources"]) for nested in split.nested_templates.values()]
+        )
+
+    def test_must_split_groups_that_do_not_fit(self):
+        template = {"Resources": {"A": topic(), "B": topic(DisplayName={"Ref": "A"}), "C": topic()}}
+
+        split = NestedStackSplitter(max_resources=2).split(template, [["B", "A", "C"]])
+
+        self.assertEqual([["A", "B"], ["C"]], [list(nested["Resources"]) for nested in split.nested_templates.values()])
+        self.assert_valid_split(split, 2)
+
+    def test_must_respect_size_budget(self):
+        template = {"Resources": {name: topic(DisplayName="x" * 100) for name in "ABCD"}}
+
+        split = NestedStackSplitter(max_template_size=300).split(template)
+
+        self.assertEqual(4, len(split.nested_templates))
+
+    def test_must_respect_parameter_and_output_budgets(self):
+        topics = {f"Topic{index}": topic() for index in range(700)}
+        subscriptions = {
+            f"Subscription{index}": {
+                "Type": "AWS::SNS::Subscription",
+                "Properties": {"TopicArn": {"Ref": f"Topic{index}"}, "Protocol": "email", "Endpoint": "a@example.com"},
+            }
+            for index in range(700)
+        }
+        template = {"Resources": {**topics, **subscriptions}}
+
+        split = NestedStackSplitter().split(template)
+
+        self.assertEqual(
+            sorted(template["Resources"]),
+            sorted(logical_id for nested in split.nested_templates.values() for logical_id in nested["Resources"]),
+        )
+        self.assert_valid_split(split, 500)
+
+    def test_must_reject_resources_that_need_more_parameters_than_the_budget(self):
+        template = {
+            "Parameters": {name: {"Type": "String"} for name in ["P1", "P2", "P3"]},
+            "Resources": {"A": topic(), "B": topic(DisplayName={"Fn::Sub": "${P1}${P2}${P3}"})},
+        }
+
+        with self.assertRaisesRegex(ValueError, "Resources B must be in the same nested stack"):
+            NestedStackSplitter(max_resources=1, max_parameters=2).split(template)
+
+    def test_must_forward_parameters_conditions_and_mappings(self):
+        template = {
+            "Parameters": {
+                "Name": {"Type": "String", "NoEcho": True},
+                "Subnets": {"Type": "List<AWS::EC2::Subnet::Id>"},
+            },
+            "Conditions": {"IsProd": {"Fn::Equals": [{"Ref": "Name"}, "prod"]}},
+            "Mappings": {"Map": {"Key": {"Value": "v"}}},
+            "Resources": {
+                "A": {**topic(), "Condition": "IsProd"},
+                "B": topic(
+                    DisplayName={"Fn::If": ["IsProd", {"Ref": "A"}, {"Ref": "Name"}]},
+                    Subnets={"Ref": "Subnets"},
+                    Stack={"Fn::Sub": "${AWS::StackName}-${AWS::Region}"},
+                    Mapped={"Fn::FindInMap": ["Map", "Key", "Value"]},
+                ),
+            },
+        }
+
+        split = NestedStackSplitter(max_resources=1).split(template)
+
+        first, second = split.nested_templates.values()
+        self.assertEqual({"IsProd": {"Fn::Equals": [{"Ref": "IsProdCondition"}, "true"]}}, first["Conditions"])
+        self.assertEqual("IsProd", first["Outputs"]["A"]["Condition"])
+        self.assertNotIn("Mappings", first)
+        self.assertEqual(template["Mappings"], second["Mappings"])
+        self.assertEqual(
+            {"Fn::Sub": "${ParentStackName}-${AWS::Region}"}, second["Resources"]["B"]["Properties"]["Stack"]
+        )
+        self.assertEqual(
+            {
+                "A": {"Type": "String", "Default": ""},
+                "IsProdCondition": {"Type": "String", "AllowedValues": ["true", "false"]},
+                "Name": {"Type": "String", "NoEcho": True},
+                "Subnets": {"Type": "CommaDelimitedList"},
+                "ParentStackName": {"Type": "String"},
+            },
+            second["Parameters"],
+        )
+        self.assertEqual(
+            {
+                "A": {"Fn::If": ["IsProd", {"Fn::GetAtt": ["NestedStack1", "Outputs.A"]}, {"Ref": "AWS::NoValue"}]},
+                "IsProdCondition": {"Fn::If": ["IsProd", "true", "false"]},
+                "Name": {"Ref": "Name"},
+                "Subnets": {"Fn::Join": [",", {"Ref": "Subnets"}]},
+                "ParentStackName": {"Ref": "AWS::StackName"},
+            },
+            split.template["Resources"]["NestedStack2"]["Properties"]["Parameters"],
+        )
+        self.assertEqual(template["Parameters"], split.template["Parameters"])
+        self.assertEqual(template["Conditions"], split.template["Conditions"])
+        self.assert_valid_split(split, 1)
+
+    def test_must_move_cross_stack_depends_on_to_nested_stacks(self):
+        template = {
+            "Resources": {
+                "A": topic(),
+                "B": {**topic(), "DependsOn": "A"},
+                "C": {**topic(), "DependsOn": ["A", "B"]},
+            }
+        }
+
+        split = NestedStackSplitter(max_resources=2).split(template)
+
+        self.assertEqual("A", split.nested_templates["NestedStack1"]["Resources"]["B"]["DependsOn"])
+        self.assertNotIn("DependsOn", split.nested_templates["NestedStack2"]["Resources"]["C"])
+        self.assertEqual(["NestedStack1"], split.template["Resources"]["NestedStack2"]["DependsOn"])
+
+    def test_must_rewrite_parent_outputs(self):
+        template = {
+            "Resources": {"NestedStack1": topic(), "B": topic()},
+            "Outputs": {
+                "Arn": {"Value": {"Ref": "NestedStack1"}},
+                "Name": {"Value": {"Fn::Sub": "${B.TopicName}"}},
+            },
+        }
+
+        split = NestedStackSplitter(max_resources=1, template_url=lambda logical_id: f"s3://bucket/{logical_id}").split(
+            template
+        )
+
+        self.assertEqual(["NestedStack2", "NestedStack3"], list(split.template["Resources"]))
+        self.assertEqual(
+            "s3://bucket/NestedStack2", split.template["Resources"]["NestedStack2"]["Properties"]["TemplateURL"]
+        )
+        self.assertEqual(
+            {
+                "Arn": {"Value": {"Fn::GetAtt": ["NestedStack2", "Outputs.NestedStack1"]}},
+                "Name": {"Value": {"Fn::Sub": "${NestedStack3.Outputs.BTopicName}"}},
+            },
+            split.template["Outputs"],
+        )
+        self.assert_valid_split(split, 1)
+
+    def test_must_keep_resources_referenced_with_computed_attributes_in_referencing_stack(self):
+        attribute = {"Ref": "AttributeName"}
+        template = {
+            "Parameters": {"AttributeName": {"Type": "String"}},
+            "Resources": {
+                "A": topic(),
+                "B": topic(),
+                "C": topic(DisplayName={"Fn::GetAtt": ["A", attribute]}),
+            },
+            "Outputs": {"Attribute": {"Value": {"Fn::GetAtt": ["B", attribute]}}},
+        }
+
+        split = NestedStackSplitter(max_resources=1).split(template)
+
+        self.assertEqual([["A", "C"], ["B"]], [list(nested["Resources"]) for nested in split.nested_templates.values()])
+        first, second = split.nested_templates.values()
+        self.assertEqual({"Fn::GetAtt": ["A", attribute]}, first["Resources"]["C"]["Properties"]["DisplayName"])
+        self.assertEqual(["AttributeName"], list(first["Parameters"]))
+        self.assertEqual({"BAttribute": {"Value": {"Fn::GetAtt": ["B", attribute]}}}, second["Outputs"])
+        self.assertEqual(["AttributeName"], list(second["Parameters"]))
+        self.assertEqual(
+            {"Attribute": {"Value": {"Fn::GetAtt": ["NestedStack2", "Outputs.BAttribute"]}}}, split.template["Outputs"]
+        )
+        self.assert_valid_split(split, 2)
+
+    def test_must_split_template_with_computed_attributes(self):
+        output_path = Path(__file__).parent / "output" / "intrinsic_functions.json"
+        template = json.loads(output_path.read_text())
+
+        split = NestedStackSplitter(max_resources=4).split(template)
+
+        self.assertGreater(len(split.nested_templates), 1)
+        for nested_template in split.nested_templates.values():
+            if "FunctionWithValidGetAttAndRef" in nested_template["Resources"]:
+                self.assertIn("MyOtherFunction", nested_template["Resources"])
+            assert_valid_references(self, nested_template)
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_must_split_translated_template(self):
+        functions = {
+            f"Function{index}": {
+                "Type": "AWS::Serverless::Function",
+                "Properties": {
+                    "Runtime": "python3.12",
+                    "Handler": "index.handler",
+                    "CodeUri": "s3://bucket/key",
+                    "Events": {"Api": {"Type": "Api", "Properties": {"Path": f"/{index}", "Method": "get"}}},
+                },
+            }
+            for index in range(5)
+        }
+        template = {"Transform": "AWS::Serverless-2016-10-31", "Resources": functions}
+        translator = Translator({}, Parser())
+
+        translated = translator.translate(sam_template=template, parameter_values={})
+        split = NestedStackSplitter(max_resources=5).split(translated, translator.generated_resource_ids.values())
+
+        self.assertEqual(
+            ["Function0", "Function0Role", "Function0ApiPermissionProd"], translator.generated_resource_ids["Function0"]
+        )
+        self.assertEqual(
+            sorted(translated["Resources"]),
+            sorted(logical_id for nested in split.nested_templates.values() for logical_id in nested["Resources"]),
+        )
+        for nested_template in split.nested_templates.values():
+            resources = nested_template["Resources"]
+            if "Function0" in resources:
+                self.assertIn("Function0Role", resources)
+        self.assert_valid_split(split, 5)
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+from copy import deepcopy
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from samtranslator.model.exceptions import InvalidDocumentException
+from samtranslator.translator.managed_policy_translator import ManagedPolicyLoader
+from samtranslator.translator.transform import transform, transform_async
+from samtranslator.translator.translation_cache import InMemoryTranslationCache
+
+from tests.plugins.application.test_serverless_app_plugin import mock_get_region
+
+TEMPLATE_URL = "https://bucket.s3.amazonaws.com/template.yaml"
+# Long enough for calls made on other threads to start, short enough for calls made one after the other to fail quickly
+TIMEOUT_SECONDS = 5
+
+TEMPLATE = {
+    "Transform": "AWS::Serverless-2016-10-31",
+    "Resources": {
+        "MyFunction": {
+            "Type": "AWS::Serverless::Function",
+            "Properties": {
+                "Runtime": "python3.12",
+                "Handler": "index.handler",
+                "CodeUri": "s3://bucket/key",
+                "Policies": ["AmazonDynamoDBFullAccess", "MyCustomerManagedPolicy"],
+            },
+        },
+        "MyApplication": {
+            "Type": "AWS::Serverless::Application",
+            "Properties": {
+                "Location": {"ApplicationId": {"Ref": "ApplicationId"}, "SemanticVersion": "1.0.0"},
+            },
+        },
+    },
+    "Parameters": {"ApplicationId": {"Type": "String", "Default": "arn:aws:serverlessrepo:app"}},
+}
+
+
+class StubIamClient:
+    """
+    IAM client that waits for the SAR client to be called, so that the transform only succeeds if both are called
+    concurrently.
+    """
+
+    def __init__(self, sar_called):
+        self.started = threading.Event()
+        self._sar_called = sar_called
+        self.calls = 0
+
+    def get_paginator(self, operation_name):
+        paginator = Mock()
+        paginator.paginate.side_effect = self._paginate
+        return paginator
+
+    def _paginate(self, **kwargs):
+        self.calls += 1
+        self.started.set()
+        if not self._sar_called.wait(TIMEOUT_SECONDS):
+            raise TimeoutError("SAR wasn't called while loading managed policies")
+        yield {"Policies": [{"PolicyName": "MyCustomerManagedPolicy", "Arn": "arn:aws:iam::aws:policy/MyPolicy"}]}
+
+
+class StubSarClient:
+    def __init__(self, iam_started):
+        self.called = threading.Event()
+        self._iam_started = iam_started
+        self.calls = []
+
+    def create_cloud_formation_template(self, ApplicationId, SemanticVersion):
+        self.calls.append((ApplicationId, SemanticVersion))
+        self.called.set()
+        if not self._iam_started.wait(TIMEOUT_SECONDS):
+            raise TimeoutError("Managed policies weren't loading while calling SAR")
+        return {"ApplicationId": ApplicationId, "Status": "ACTIVE", "TemplateId": "id", "TemplateUrl": TEMPLATE_URL}
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+@patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+class TestTransformAsync(TestCase):
+    def setUp(self):
+        sar_called = threading.Event()
+        self.iam_client = StubIamClient(sar_called)
+        self.sar_client = StubSarClient(self.iam_client.started)
+        self.sar_client.called = sar_called
+
+    def transform_async(self, template=TEMPLATE, **kwargs):
+        return asyncio.run(
+            transform_async(
+                deepcopy(template),
+                {},
+                ManagedPolicyLoader(self.iam_client),
+                sar_client=self.sar_client,
+                **kwargs,
+            )
+        )
+
+    def test_must_call_iam_and_sar_concurrently(self):
+        transformed = self.transform_async()
+
+        self.assertEqual(1, self.iam_client.calls)
+        self.assertEqual([("arn:aws:serverlessrepo:app", "1.0.0")], self.sar_client.calls)
+        self.assertTrue(self.sar_client.called.is_set())
+        self.assertEqual(TEMPLATE_URL, transformed["Resources"]["MyApplication"]["Properties"]["TemplateURL"])
+        role = transformed["Resources"]["MyFunctionRole"]["Properties"]
+        self.assertIn("arn:aws:iam::aws:policy/MyPolicy", role["ManagedPolicyArns"])
+
+    def test_must_transform_like_transform(self):
+        loader = Mock()
+        loader.load.return_value = {"MyCustomerManagedPolicy": "arn:aws:iam::aws:policy/MyPolicy"}
+        sar_client = Mock()
+        sar_client.create_cloud_formation_template.return_value = {"Status": "ACTIVE", "TemplateUrl": TEMPLATE_URL}
+        with patch("boto3.client", return_value=sar_client):
+            expected = transform(deepcopy(TEMPLATE), {}, loader)
+
+        self.assertEqual(expected, self.transform_async())
+
+    def test_must_not_load_managed_policies_bundled_with_the_transform(self):
+        template = deepcopy(TEMPLATE)
+        del template["Resources"]["MyApplication"]
+        template["Resources"]["MyFunction"]["Properties"]["Policies"] = [
+            "AmazonDynamoDBFullAccess",
+            "arn:aws:iam::aws:policy/MyPolicy",
+            {"Fn::If": ["Condition", "AWSLambdaRole", {"Ref": "AWS::NoValue"}]},
+        ]
+
+        self.transform_async(template)
+
+        self.assertEqual(0, self.iam_client.calls)
+
+    def test_must_return_cached_translation(self):
+        # Translations of templates with applications aren't cached
+        template = deepcopy(TEMPLATE)
+        del template["Resources"]["MyApplication"]
+        self.sar_client.called.set()
+        translation_cache = InMemoryTranslationCache()
+        transformed = self.transform_async(template, translation_cache=translation_cache)
+
+        self.assertEqual(transformed, self.transform_async(template, translation_cache=translation_cache))
+        self.assertEqual(1, self.iam_client.calls)
+
+    def test_must_raise_errors_of_the_translation(self):
+        template = deepcopy(TEMPLATE)
+        del template["Resources"]["MyFunction"]["Properties"]["CodeUri"]
+
+        with self.assertRaises(InvalidDocumentException):
+            self.transform_async(template)
@@ -0,0 +1,161 @@
+import os
+import tempfile
+from copy import deepcopy
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from samtranslator.metrics.metrics import Metrics
+from samtranslator.translator.transform import transform
+from samtranslator.translator.translation_cache import (
+    FileTranslationCache,
+    InMemoryTranslationCache,
+    get_translation_cache_key,
+)
+
+from tests.translator.test_translator import get_policy_mock
+
+TEMPLATE = {
+    "Transform": "AWS::Serverless-2016-10-31",
+    "Resources": {
+        "MyFunction": {
+            "Type": "AWS::Serverless::Function",
+            "Properties": {
+                "Runtime": "python3.12",
+                "Handler": "index.handler",
+                "CodeUri": "s3://bucket/key",
+                "Policies": "AmazonDynamoDBFullAccess",
+            },
+        }
+    },
+}
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+class TestGetTranslationCacheKey(TestCase):
+    def test_same_inputs_must_give_same_key(self):
+        self.assertEqual(
+            get_translation_cache_key(dict(TEMPLATE), {"a": "b"}),
+            get_translation_cache_key(dict(TEMPLATE), {"a": "b"}),
+        )
+
+    def test_key_must_depend_on_inputs(self):
+        key = get_translation_cache_key(TEMPLATE, {})
+
+        self.assertNotEqual(key, get_translation_cache_key(TEMPLATE, {"a": "b"}))
+        self.assertNotEqual(key, get_translation_cache_key(TEMPLATE, {}, passthrough_metadata=True))
+        self.assertNotEqual(key, get_translation_cache_key(TEMPLATE, {}, deduplicate_policies=True))
+        self.assertNotEqual(key, get_translation_cache_key(TEMPLATE, {}, merge_resource_policy_statements=True))
+        self.assertNotEqual(key, get_translation_cache_key(TEMPLATE, {}, fold_conditions=True))
+        self.assertNotEqual(key, get_translation_cache_key({"Resources": {}}, {}))
+        with patch("boto3.session.Session.region_name", "us-west-2"):
+            self.assertNotEqual(key, get_translation_cache_key(TEMPLATE, {}))
+
+    def test_key_must_depend_on_feature_toggle_config(self):
+        feature_toggle = Mock(feature_config={"feature": {"us-east-1": {"type": "toggle", "enabled": True}}})
+        feature_toggle.stage = feature_toggle.account_id = feature_toggle.region = None
+        other_feature_toggle = Mock(feature_config={})
+        other_feature_toggle.stage = other_feature_toggle.account_id = other_feature_toggle.region = None
+
+        self.assertNotEqual(
+            get_translation_cache_key(TEMPLATE, {}, feature_toggle),
+            get_translation_cache_key(TEMPLATE, {}, other_feature_toggle),
+        )
+
+    def test_serverless_application_repository_apps_must_not_be_cached(self):
+        template = {
+            "Resources": {
+                "App": {
+                    "Type": "AWS::Serverless::Application",
+                    "Properties": {"Location": {"ApplicationId": "id", "SemanticVersion": "1.0.0"}},
+                }
+            }
+        }
+
+        self.assertIsNone(get_translation_cache_key(template, {}))
+
+    def test_unsortable_keys_must_not_be_cached(self):
+        self.assertIsNone(get_translation_cache_key({"Resources": {1: {}, "a": {}}}, {}))
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+class TestTransformWithTranslationCache(TestCase):
+    def test_repeated_translation_must_be_served_from_cache(self):
+        metrics = Metrics()
+        cache = InMemoryTranslationCache(metrics=metrics)
+        policy_loader = get_policy_mock()
+
+        first = transform(deepcopy(TEMPLATE), {}, policy_loader, translation_cache=cache)
+        policy_loader.load.reset_mock()
+        second = transform(deepcopy(TEMPLATE), {}, policy_loader, translation_cache=cache)
+
+        self.assertEqual(first, second)
+        policy_loader.load.assert_not_called()
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        self.assertEqual(1, len(metrics.get_metric("TranslationCacheHit")))
+        self.assertEqual(1, len(metrics.get_metric("TranslationCacheMiss")))
+        metrics.publish()
+
+    def test_cached_templates_must_not_be_shared(self):
+        cache = InMemoryTranslationCache()
+        transform(deepcopy(TEMPLATE), {}, get_policy_mock(), translation_cache=cache)
+
+        second = transform(deepcopy(TEMPLATE), {}, get_policy_mock(), translation_cache=cache)
+        second["Resources"].clear()
+        third = transform(deepcopy(TEMPLATE), {}, get_policy_mock(), translation_cache=cache)
+
+        self.assertIn("MyFunction", third["Resources"])
+
+    def test_uncacheable_templates_must_bypass_cache(self):
+        cache = InMemoryTranslationCache()
+
+        transform(deepcopy(TEMPLATE), {1: "a", "b": "c"}, get_policy_mock(), translation_cache=cache)
+
+        self.assertEqual((0, 0, 1), (cache.hits, cache.misses, cache.bypasses))
+        self.assertEqual(0, len(cache))
+
+
+class TestInMemoryTranslationCache(TestCase):
+    def test_must_evict_least_recently_used_entries(self):
+        cache = InMemoryTranslationCache(max_size_bytes=20)
+        cache.put("a", {"a": "1"})
+        cache.put("b", {"b": "2"})
+        cache.get("a")
+        cache.put("c", {"c": "3"})
+
+        self.assertEqual({"a": "1"}, cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual({"c": "3"}, cache.get("c"))
+
+    def test_must_not_store_entries_larger_than_cache(self):
+        cache = InMemoryTranslationCache(max_size_bytes=5)
+        cache.put("a", {"a": "1"})
+
+        self.assertEqual(0, len(cache))
+
+
+class TestFileTranslationCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_must_share_entries_between_instances(self):
+        FileTranslationCache(self.directory.name).put("key", {"Resources": {}})
+
+        cache = FileTranslationCache(self.directory.name)
+
+        self.assertEqual({"Resources": {}}, cache.get("key"))
+        self.assertIsNone(cache.get("other"))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_must_evict_least_recently_used_entries(self):
+        cache = FileTranslationCache(self.directory.name, max_size_bytes=20)
+        cache.put("a", {"a": "1"})
+        os.utime(os.path.join(self.directory.name, "a.json"), (1, 1))
+        cache.put("b", {"b": "2"})
+        os.utime(os.path.join(self.directory.name, "b.json"), (2, 2))
+        cache.get("a")
+        cache.put("c", {"c": "3"})
+
+        self.assertEqual({"a": "1"}, cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual({"c": "3"}, cache.get("c"))
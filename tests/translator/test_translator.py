@@ -1,3 +1,4 @@
+import copy
 import hashlib
 import itertools
 import json
@@ -15,9 +16,16 @@ from samtranslator.model import Resource
 from samtranslator.model.exceptions import InvalidDocumentException, InvalidResourceException
 from samtranslator.model.sam_resources import SamSimpleTable
 from samtranslator.parser.parser import Parser
+from samtranslator.plugins.globals.globals_plugin import GlobalsPlugin
 from samtranslator.public.plugins import BasePlugin
 from samtranslator.translator.transform import transform
-from samtranslator.translator.translator import Translator, make_policy_template_for_function_plugin, prepare_plugins
+from samtranslator.translator.translator import (
+    Translator,
+    _get_default_policy_templates_processor,
+    make_policy_template_for_function_plugin,
+    prepare_plugins,
+)
+from samtranslator.utils.py27hash_fix import copy_keeping_py27_order, to_py27_compatible_template
 from samtranslator.yaml_helper import yaml_parse
 
 from tests.plugins.application.test_serverless_app_plugin import mock_get_region
@@ -692,6 +700,465 @@ class TestFunctionVersionWithParameterReferences(TestCase):
         return output_fragment
 
 
+class TestParallelTranslation(TestCase):
+    """
+    Translating with a worker pool must produce exactly the same template (including resource order) and the same
+    errors as translating sequentially.
+    """
+
+    @parameterized.expand(
+        [
+            ("basic_function",),
+            ("basic_layer",),
+            ("function_with_many_layers",),
+            ("layers_with_intrinsics",),
+            ("simple_table_with_extra_tags",),
+            ("sqs",),
+            ("kinesis_intrinsics",),
+            ("connector_function_to_table",),
+            ("globals_for_function",),
+            ("all_policy_templates",),
+            ("function_with_deployment_preference",),
+            ("api_with_auth_all_minimum",),
+        ]
+    )
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_same_output_as_sequential_translation(self, testcase):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, testcase + ".yaml")))
+
+        sequential = self._translate(manifest, max_workers=None)
+        parallel = self._translate(manifest, max_workers=4)
+
+        self.assertEqual(json.dumps(parallel), json.dumps(sequential))
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_same_errors_as_sequential_translation(self):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, "error_multiple_resource_errors.yaml")))
+
+        with self.assertRaises(InvalidDocumentException) as sequential:
+            self._translate(manifest, max_workers=None)
+        with self.assertRaises(InvalidDocumentException) as parallel:
+            self._translate(manifest, max_workers=4)
+
+        self.assertEqual(parallel.exception.message, sequential.exception.message)
+
+    @parameterized.expand(
+        [
+            ({"Type": "AWS::Serverless::SimpleTable"}, True),
+            ({"Type": "AWS::Serverless::LayerVersion", "Properties": {}}, True),
+            ({"Type": "AWS::Serverless::Function", "Properties": {}}, True),
+            ({"Type": "AWS::Serverless::Function", "Properties": {"Events": {"Queue": {"Type": "SQS"}}}}, True),
+            ({"Type": "AWS::Serverless::Function", "Properties": {"Events": {"Get": {"Type": "Api"}}}}, False),
+            ({"Type": "AWS::Serverless::Function", "Properties": {"DeploymentPreference": {"Type": "Linear"}}}, False),
+            ({"Type": "AWS::Serverless::Function", "Properties": {"Role": {"Fn::If": ["C", "a", "b"]}}}, False),
+            ({"Type": "AWS::Serverless::Api", "Properties": {}}, False),
+            ({"Type": "AWS::Serverless::Connector", "Properties": {}}, False),
+        ]
+    )
+    def test_is_self_contained(self, resource_dict, expected):
+        self.assertEqual(Translator._is_self_contained(resource_dict, {}), expected)
+
+    def test_is_self_contained_with_linked_resources(self):
+        resource_dict = {"Type": "AWS::Serverless::Function", "Properties": {"Events": {"Queue": {"Type": "SQS"}}}}
+
+        self.assertFalse(Translator._is_self_contained(resource_dict, {"event_resources": {"Queue": {"queue": {}}}}))
+
+    @staticmethod
+    def _translate(manifest, max_workers):
+        translator = Translator({}, Parser(), max_workers=max_workers)
+        return translator.translate(
+            json.loads(json.dumps(manifest)),
+            parameter_values=get_template_parameter_values(),
+            get_managed_policy_map=get_policy_mock().load,
+        )
+
+
+class TestCopyTemplate(TestCase):
+    def test_must_share_only_properties_of_translated_resources(self):
+        shared = {"a": "b"}
+        sam_template = {
+            "Transform": "AWS::Serverless-2016-10-31",
+            "Resources": {
+                "Function": {"Type": "AWS::Serverless::Function", "Properties": {"x": 1}, "DependsOn": ["Queue"]},
+                "Queue": {"Type": "AWS::SQS::Queue", "Properties": {"Tags": shared}},
+            },
+            "Outputs": {"Out": {"Value": shared}},
+        }
+        function = sam_template["Resources"]["Function"]
+
+        template = Translator._copy_template(sam_template, [("Function", function)])
+
+        self.assertEqual(sam_template, template)
+        self.assertEqual(list(sam_template), list(template))
+        self.assertIsNot(function, template["Resources"]["Function"])
+        self.assertIs(function["Properties"], template["Resources"]["Function"]["Properties"])
+        self.assertIsNot(function["DependsOn"], template["Resources"]["Function"]["DependsOn"])
+        self.assertIsNot(sam_template["Resources"]["Queue"], template["Resources"]["Queue"])
+        # Objects shared within the template are still shared within the copy
+        copied_shared = template["Outputs"]["Out"]["Value"]
+        self.assertIsNot(shared, copied_shared)
+        self.assertIs(copied_shared, template["Resources"]["Queue"]["Properties"]["Tags"])
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+class TestDeduplicatePolicies(TestCase):
+    def test_must_share_identical_policies_of_generated_roles(self):
+        function_properties = {
+            "CodeUri": "s3://bucket/key",
+            "Handler": "index.handler",
+            "Runtime": "python3.12",
+            "Policies": [{"SQSPollerPolicy": {"QueueName": "queue"}}, {"S3ReadPolicy": {"BucketName": "bucket"}}],
+        }
+        manifest = {
+            "Transform": "AWS::Serverless-2016-10-31",
+            "Resources": {
+                f"Function{index}": {"Type": "AWS::Serverless::Function", "Properties": function_properties}
+                for index in range(3)
+            },
+        }
+        translator = Translator({}, Parser())
+
+        translated = translator.translate(copy.deepcopy(manifest), {}, deduplicate_policies=True)
+
+        shared_policies = [
+            logical_id
+            for logical_id, resource in translated["Resources"].items()
+            if resource["Type"] == "AWS::IAM::ManagedPolicy"
+        ]
+        self.assertEqual(2, len(shared_policies))
+        for index in range(3):
+            role_properties = translated["Resources"][f"Function{index}Role"]["Properties"]
+            self.assertNotIn("Policies", role_properties)
+            for logical_id in shared_policies:
+                self.assertIn({"Ref": logical_id}, role_properties["ManagedPolicyArns"])
+        [saved_bytes] = translator.metrics.get_metric("DeduplicatedPolicyBytes")
+        self.assertEqual(
+            len(json.dumps(Translator({}, Parser()).translate(copy.deepcopy(manifest), {}), separators=(",", ":")))
+            - len(json.dumps(translated, separators=(",", ":"))),
+            saved_bytes.value,
+        )
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+class TestMergeResourcePolicyStatements(TestCase):
+    def test_must_merge_resource_policy_statements_of_api_events(self):
+        manifest = {
+            "Transform": "AWS::Serverless-2016-10-31",
+            "Resources": {
+                f"Function{index}": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "CodeUri": "s3://bucket/key",
+                        "Handler": "index.handler",
+                        "Runtime": "python3.12",
+                        "Events": {
+                            "Get": {
+                                "Type": "Api",
+                                "Properties": {
+                                    "Path": f"/path{index}",
+                                    "Method": "get",
+                                    "Auth": {"ResourcePolicy": {"IpRangeWhitelist": ["1.2.3.4"]}},
+                                },
+                            }
+                        },
+                    },
+                }
+                for index in range(3)
+            },
+        }
+
+        def get_policy(translated):
+            return translated["Resources"]["ServerlessRestApi"]["Properties"]["Body"]["x-amazon-apigateway-policy"]
+
+        policy = get_policy(Translator({}, Parser()).translate(copy.deepcopy(manifest), {}))
+        merged_policy = get_policy(
+            Translator({}, Parser()).translate(copy.deepcopy(manifest), {}, merge_resource_policy_statements=True)
+        )
+
+        self.assertEqual(6, len(policy["Statement"]))
+        self.assertEqual(["Allow", "Deny"], [statement["Effect"] for statement in merged_policy["Statement"]])
+        for effect, merged_statement in zip(["Allow", "Deny"], merged_policy["Statement"]):
+            self.assertEqual(
+                [
+                    resource
+                    for statement in policy["Statement"]
+                    if statement["Effect"] == effect
+                    for resource in statement["Resource"]
+                ],
+                merged_statement["Resource"],
+            )
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+class TestFoldConditions(TestCase):
+    def test_must_translate_template_without_excluded_resources(self):
+        manifest = {
+            "Transform": "AWS::Serverless-2016-10-31",
+            "Parameters": {"Env": {"Type": "String"}},
+            "Conditions": {
+                "IsProd": {"Fn::Equals": [{"Ref": "Env"}, "prod"]},
+                "IsDev": {"Fn::Equals": [{"Ref": "Env"}, "dev"]},
+            },
+            "Resources": {
+                f"{condition}Function": {
+                    "Type": "AWS::Serverless::Function",
+                    "Condition": condition,
+                    "Properties": {
+                        "CodeUri": "s3://bucket/key",
+                        "Handler": "index.handler",
+                        "Runtime": "python3.12",
+                        "MemorySize": {"Fn::If": ["IsProd", 1024, 128]},
+                        "Events": {"Get": {"Type": "Api", "Properties": {"Path": f"/{condition}", "Method": "get"}}},
+                    },
+                }
+                for condition in ["IsProd", "IsDev"]
+            },
+        }
+        translator = Translator({}, Parser())
+
+        translated = translator.translate(copy.deepcopy(manifest), {"Env": "prod"}, fold_conditions=True)
+
+        self.assertNotIn("Conditions", translated)
+        self.assertNotIn("IsDevFunction", translated["Resources"])
+        self.assertEqual(1024, translated["Resources"]["IsProdFunction"]["Properties"]["MemorySize"])
+        body = translated["Resources"]["ServerlessRestApi"]["Properties"]["Body"]
+        self.assertEqual({"/IsProd": ["get"]}, {path: list(item) for path, item in body["paths"].items()})
+        self.assertEqual([2], [datum.value for datum in translator.metrics.get_metric("FoldedConditions")])
+
+        unfolded = Translator({}, Parser()).translate(copy.deepcopy(manifest), {"Env": "prod"})
+        self.assertIn("ServerlessRestApiCondition", unfolded["Conditions"])
+
+    @parameterized.expand([("test1", True), ("test2", False)])
+    def test_must_fold_conditions_of_embedded_connectors(self, param, condition_value):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, "embedded_connectors_resource_attributes.yaml")))
+
+        translated = Translator({}, Parser()).translate(manifest, {"Param": param}, fold_conditions=True)
+
+        self.assertNotIn("Conditions", translated)
+        connector_resources = [
+            resource for logical_id, resource in translated["Resources"].items() if "MyConnector" in logical_id
+        ]
+        self.assertEqual(condition_value, bool(connector_resources))
+        for resource in connector_resources:
+            self.assertNotIn("Condition", resource)
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+@patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+class TestTranslateVariants(TestCase):
+    """
+    Each variant must be translated exactly like an independent translation with the same parameter values.
+    """
+
+    VARIANTS = [
+        get_template_parameter_values(),
+        {"param1": "other", "AWS::Region": "eu-west-1"},
+        {"AWS::Region": "cn-north-1", "AWS::Partition": "aws-cn"},
+    ]
+
+    @parameterized.expand(
+        [
+            ("globals_for_function",),
+            ("all_policy_templates",),
+            ("function_with_deployment_preference",),
+            ("api_with_resource_policy",),
+            ("api_with_auth_all_maximum",),
+            ("implicit_http_api_with_many_conditions",),
+            ("function_with_resource_refs",),
+            ("layers_with_intrinsics",),
+        ]
+    )
+    def test_same_output_as_independent_translations(self, testcase):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, testcase + ".yaml")))
+        original = copy.deepcopy(manifest)
+
+        translated = self._translator().translate_variants(manifest, self.VARIANTS)
+
+        self.assertEqual(original, manifest)
+        for variant, variant_translated in zip(self.VARIANTS, translated, strict=True):
+            self.assertEqual(
+                json.dumps(self._translator().translate(copy.deepcopy(manifest), variant)),
+                json.dumps(variant_translated),
+            )
+
+    @parameterized.expand(
+        [
+            ("all_policy_templates", {"deduplicate_policies": True}),
+            ("api_with_resource_policy", {"merge_resource_policy_statements": True}),
+            ("embedded_connectors_resource_attributes", {"fold_conditions": True}),
+        ]
+    )
+    def test_same_output_as_independent_translations_with_options(self, testcase, options):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, testcase + ".yaml")))
+        variants = [{**variant, "Param": param} for variant, param in zip(self.VARIANTS, ["test1", "test2", "x"])]
+
+        translated = self._translator().translate_variants(manifest, variants, **options)
+
+        for variant, variant_translated in zip(variants, translated, strict=True):
+            self.assertEqual(
+                json.dumps(self._translator().translate(copy.deepcopy(manifest), variant, **options)),
+                json.dumps(variant_translated),
+            )
+        if "fold_conditions" in options:
+            # The connector is only translated for the variant where its condition is True
+            self.assertNotEqual(json.dumps(translated[0]), json.dumps(translated[1]))
+
+    @parameterized.expand(SUCCESS_FILES_NAMES_FOR_TESTING)
+    @patch(
+        "samtranslator.plugins.application.serverless_app_plugin.ServerlessAppPlugin._sar_service_call",
+        mock_sar_service_call,
+    )
+    def test_same_output_as_translate_for_input_templates(self, testcase):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, testcase + ".yaml")))
+        parameter_values = get_template_parameter_values()
+        to_py27_compatible_template(manifest, parameter_values)
+
+        try:
+            expected = self._translator().translate(copy_keeping_py27_order(manifest), parameter_values)
+        except InvalidDocumentException as e:
+            with self.assertRaises(InvalidDocumentException) as error:
+                self._translator().translate_variants(manifest, [parameter_values])
+            self.assertEqual(e.message, error.exception.message)
+            return
+
+        [translated] = self._translator().translate_variants(manifest, [parameter_values])
+        self.assertEqual(json.dumps(expected), json.dumps(translated))
+
+    def test_same_output_in_parallel(self):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, "api_with_auth_all_maximum.yaml")))
+
+        self.assertEqual(
+            json.dumps(self._translator().translate_variants(manifest, self.VARIANTS)),
+            json.dumps(self._translator().translate_variants(manifest, self.VARIANTS, max_workers=3)),
+        )
+
+    def test_must_raise_error_of_first_invalid_variant(self):
+        manifest = {
+            "Parameters": {"Name": {"Type": "String"}},
+            "Resources": {
+                "Function": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "CodeUri": "s3://bucket/key",
+                        "Handler": "index.handler",
+                        "Runtime": "python3.12",
+                        "AutoPublishAlias": {"Ref": "Name"},
+                    },
+                },
+            },
+        }
+        variants = [{"Name": "live"}, {"Name": "not valid"}, {"Name": ""}]
+
+        with self.assertRaises(InvalidDocumentException) as error:
+            self._translator().translate_variants(manifest, variants, max_workers=3)
+        with self.assertRaises(InvalidDocumentException) as expected_error:
+            self._translator().translate(copy.deepcopy(manifest), variants[1])
+
+        self.assertEqual(expected_error.exception.message, error.exception.message)
+
+    def test_must_prepare_template_once(self):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, "globals_for_function.yaml")))
+
+        with patch.object(
+            GlobalsPlugin,
+            "on_before_transform_template",
+            autospec=True,
+            side_effect=GlobalsPlugin.on_before_transform_template,
+        ) as globals_hook_mock:
+            self._translator().translate_variants(manifest, self.VARIANTS)
+
+        globals_hook_mock.assert_called_once()
+
+    def test_must_prepare_each_variant_with_custom_plugins(self):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, "globals_for_function.yaml")))
+        translator = Translator({}, Parser(), plugins=[_CustomPlugin()])
+
+        with patch.object(
+            GlobalsPlugin,
+            "on_before_transform_template",
+            autospec=True,
+            side_effect=GlobalsPlugin.on_before_transform_template,
+        ) as globals_hook_mock:
+            translator.translate_variants(manifest, self.VARIANTS)
+
+        self.assertEqual(len(self.VARIANTS), globals_hook_mock.call_count)
+
+    @staticmethod
+    def _translator():
+        return Translator(get_policy_mock().load(), Parser())
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+@patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+class TestTranslatorValidate(TestCase):
+    """
+    validate() runs a subset of the checks of translate(), so templates that translate must always be valid.
+    """
+
+    @parameterized.expand([(testcase,) for testcase in sorted(SUCCESS_FILES_NAMES_FOR_TESTING)])
+    def test_templates_that_translate_must_be_valid(self, testcase):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, testcase + ".yaml")))
+
+        Translator({}, Parser()).validate(manifest, get_template_parameter_values())
+
+    def test_must_collect_errors_of_all_resources(self):
+        function_properties = {"CodeUri": "s3://bucket/key", "Handler": "index.handler", "Runtime": "python3.12"}
+        manifest = {
+            "Resources": {
+                "ExternalS3Function": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        **function_properties,
+                        "Events": {"S3Event": {"Type": "S3", "Properties": {"Bucket": "b", "Events": "e"}}},
+                    },
+                },
+                "BadDlqFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {**function_properties, "DeadLetterQueue": {"Type": "SNS"}},
+                },
+                "Table": {"Type": "AWS::Serverless::SimpleTable", "Properties": {"Unknown": 1}},
+            }
+        }
+
+        with self.assertRaises(InvalidDocumentException) as translate_error:
+            Translator({}, Parser()).translate(
+                json.loads(json.dumps(manifest)), {}, get_managed_policy_map=get_policy_mock().load
+            )
+        with self.assertRaises(InvalidDocumentException) as validate_error:
+            Translator({}, Parser()).validate(manifest, {})
+
+        self.assertEqual(translate_error.exception.message, validate_error.exception.message)
+        self.assertEqual(
+            sorted(cause.message for cause in translate_error.exception.causes),
+            sorted(cause.message for cause in validate_error.exception.causes),
+        )
+
+    def test_must_not_modify_template(self):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, "globals_for_function.yaml")))
+        original = copy.deepcopy(manifest)
+
+        Translator({}, Parser()).validate(manifest, {})
+
+        self.assertEqual(original, manifest)
+
+    @patch("boto3.client")
+    def test_must_not_call_serverless_application_repository(self, boto3_client_mock):
+        manifest = {
+            "Resources": {
+                "App": {
+                    "Type": "AWS::Serverless::Application",
+                    "Properties": {"Location": {"ApplicationId": "id", "SemanticVersion": "1.0.0"}},
+                }
+            }
+        }
+
+        Translator({}, Parser()).validate(manifest, {})
+
+        boto3_client_mock.assert_not_called()
+
+
 class TestApiAlwaysDeploy(TestCase):
     """
     AlwaysDeploy is used to force API Gateway to redeploy at every deployment.
@@ -1122,6 +1589,8 @@ class TestPluginsUsage(TestCase):
         plugin_instance = Mock()
         policy_templates_for_function_plugin_mock.return_value = plugin_instance
 
+        _get_default_policy_templates_processor.cache_clear()
+        self.addCleanup(_get_default_policy_templates_processor.cache_clear)
         result = make_policy_template_for_function_plugin()
 
         self.assertEqual(plugin_instance, result)
@@ -1130,6 +1599,20 @@ class TestPluginsUsage(TestCase):
         policy_templates_processor_mock.assert_called_once_with(default_templates)
         policy_templates_for_function_plugin_mock.assert_called_once_with(processor_instance)
 
+    @patch("samtranslator.translator.translator.PolicyTemplatesProcessor")
+    def test_make_policy_template_for_function_plugin_must_load_default_templates_once(
+        self, policy_templates_processor_mock
+    ):
+        _get_default_policy_templates_processor.cache_clear()
+        self.addCleanup(_get_default_policy_templates_processor.cache_clear)
+
+        first = make_policy_template_for_function_plugin()
+        second = make_policy_template_for_function_plugin()
+
+        self.assertIsNot(first, second)
+        self.assertIs(first._policy_template_processor, second._policy_template_processor)
+        policy_templates_processor_mock.get_default_policy_templates_json.assert_called_once_with()
+
     @patch.object(Resource, "from_dict")
     @patch("samtranslator.translator.translator.SamPlugins")
     @patch("samtranslator.translator.translator.prepare_plugins")
@@ -9,6 +9,9 @@ from samtranslator.utils.py27hash_fix import (
     Py27LongInt,
     Py27UniStr,
     _convert_to_py27_type,
+    copy_keeping_py27_order,
+    copy_sharing_unchanged,
+    iter_str_chunks,
     to_py27_compatible_template,
 )
 
@@ -463,6 +466,120 @@ class TestPy27Dict(TestCase):
         self.assertEqual(py27_dict, {"a": "b", "d": "c"})
 
 
+class TestIterStrChunks(TestCase):
+    def _make_data(self):
+        inner = Py27Dict()
+        inner[Py27UniStr("uri")] = Py27UniStr("arn:aws:lambda:\u00e9")
+        inner[1] = Py27LongInt(9223372036854775808)
+        inner["list"] = [Py27UniStr("a"), {"b": None}, 1.5, True]
+        data = Py27Dict()
+        data["swagger"] = "2.0"
+        data["paths"] = {"/": {"get": inner}, "/empty": {}}
+        data["tags"] = []
+        return data
+
+    def test_chunks_must_match_str(self):
+        data = self._make_data()
+        self.assertEqual("".join(iter_str_chunks(data)), str(data))
+
+    def test_small_chunks_must_match_str(self):
+        data = self._make_data()
+        chunks = list(iter_str_chunks(data, chunk_size=8))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), str(data))
+
+    def test_chunks_of_plain_types_must_match_str(self):
+        for data in [{"a": [1, "b", {"c": "d"}]}, [], {}, "string", 1, None]:
+            self.assertEqual("".join(iter_str_chunks(data)), str(data))
+
+
+class TestCopyKeepingPy27Order(TestCase):
+    def test_copy_must_keep_order_of_py27dict(self):
+        paths = Py27Dict()
+        # "/three" collides with "/two", so the order depends on the order of insertion
+        for path in ["/two", "/one", "/any", "/three"]:
+            paths[path] = {"get": Py27Dict()}
+        data = {"Properties": {"DefinitionBody": {"paths": paths}, "Tags": [Py27UniStr("tag")]}}
+
+        copied = copy_keeping_py27_order(data)
+
+        self.assertEqual(str(data), str(copied))
+        self.assertNotEqual(list(paths), list(copy.deepcopy(paths)))
+        copied_paths = copied["Properties"]["DefinitionBody"]["paths"]
+        self.assertIsInstance(copied_paths, Py27Dict)
+        copied_paths["/five"] = {}
+        copied_paths["/one"]["get"]["x"] = 1
+        self.assertEqual(["/one", "/any", "/three", "/two"], list(paths))
+        self.assertEqual(Py27Dict(), paths["/one"]["get"])
+
+
+class TestCopySharingUnchanged(TestCase):
+    def test_copy_must_iterate_like_deepcopy(self):
+        paths = Py27Dict()
+        # "/three" collides with "/two", so a deep copy reorders the keys
+        for path in ["/two", "/one", "/any", "/three"]:
+            paths[path] = Py27Dict({"get": Py27Dict({"responses": {}})})
+        data = Py27Dict({"swagger": "2.0", "paths": paths, "tags": [Py27Dict({"name": "tag"})]})
+        unchanged = {}
+
+        copied = copy_sharing_unchanged(data, unchanged)
+
+        self.assertEqual(str(copy.deepcopy(data)), str(copied))
+        self.assertIsNot(data, copied)
+        self.assertIsNot(paths, copied["paths"])
+        self.assertEqual(["/one", "/any", "/three", "/two"], list(paths))
+        self.assertIs(paths["/one"], copied["paths"]["/one"])
+        self.assertIs(data["tags"], copied["tags"])
+        self.assertIn(id(paths["/one"]), unchanged)
+        self.assertNotIn(id(paths), unchanged)
+
+    def test_must_share_value_a_copy_would_not_change(self):
+        data = {"paths": Py27Dict({"/one": Py27Dict({"get": {}})}), "list": [1, Py27UniStr("a")]}
+
+        self.assertIs(data, copy_sharing_unchanged(data))
+
+    def test_must_copy_shared_value_once(self):
+        paths = Py27Dict()
+        for path in ["/two", "/one", "/any", "/three"]:
+            paths[path] = {}
+
+        copied = copy_sharing_unchanged([paths, {"paths": paths}])
+
+        self.assertIs(copied[0], copied[1]["paths"])
+        self.assertEqual(list(copy.deepcopy(paths)), list(copied[0]))
+
+
+class TestPy27KeysDeepcopy(TestCase):
+    def test_deepcopy_must_skip_readding_keys_that_keep_their_order(self):
+        keys = Py27Keys()
+        for key in ["swagger", "info", "paths"]:
+            keys.add(key)
+
+        copied = copy.deepcopy(keys)
+
+        self.assertTrue(keys.readd_unchanged)
+        self.assertTrue(copied.readd_unchanged)
+        with patch.object(Py27Keys, "add") as add_mock:
+            copied_again = copy.deepcopy(copied)
+        add_mock.assert_not_called()
+        self.assertEqual(keys.keyorder, copied_again.keyorder)
+        copied_again.add("definitions")
+        self.assertFalse(copied_again.readd_unchanged)
+
+    def test_deepcopy_must_readd_keys_that_change_order(self):
+        keys = Py27Keys()
+        for key in ["/two", "/one", "/any", "/three"]:
+            keys.add(key)
+
+        copied = copy.deepcopy(keys)
+        copied_again = copy.deepcopy(copied)
+
+        # Every copy swaps the colliding keys
+        self.assertEqual(["/two", "/one", "/any", "/three"], list(copied))
+        self.assertEqual(["/one", "/any", "/three", "/two"], list(copied_again))
+        self.assertFalse(copied.readd_unchanged)
+
+
 class TestConvertToPy27Dict(TestCase):
     def test_with_string_input(self):
         original = "aaa"
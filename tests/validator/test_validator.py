@@ -0,0 +1,91 @@
+import json
+from pathlib import Path
+from unittest import TestCase
+
+from jsonschema import Draft4Validator
+from samtranslator.validator.validator import SAM_SCHEMA_FILE, SamSchemaValidator, get_sam_schema_validator
+from samtranslator.yaml_helper import yaml_parse
+
+TRANSLATOR_INPUTS = Path(__file__).parent.parent / "translator" / "input"
+
+
+def get_function(properties):
+    return {"Type": "AWS::Serverless::Function", "Properties": properties}
+
+
+class TestSamSchemaValidator(TestCase):
+    def setUp(self):
+        self.validator = get_sam_schema_validator(SAM_SCHEMA_FILE)
+
+    def test_validator_must_be_cached(self):
+        self.assertIs(self.validator, get_sam_schema_validator(SAM_SCHEMA_FILE))
+
+    def test_valid_template_must_have_no_errors(self):
+        template = {
+            "Resources": {
+                "Function": get_function({"Runtime": "python3.12", "Handler": "index.handler", "CodeUri": "."}),
+                "Bucket": {"Type": "AWS::S3::Bucket"},
+            }
+        }
+
+        self.assertTrue(self.validator.is_valid(template))
+        self.assertEqual([], self.validator.get_errors(template))
+
+    def test_errors_must_only_be_checked_against_the_matching_type(self):
+        template = {
+            "Resources": {
+                "Function": get_function({"Events": {"Queue": {"Type": "SQS", "Properties": {"BatchSize": 5}}}}),
+            }
+        }
+
+        self.assertFalse(self.validator.is_valid(template))
+        self.assertEqual(
+            ["[Resources.Function.Properties.Events.Queue.Properties] 'Queue' is a required property"],
+            self.validator.get_errors(template),
+        )
+
+    def test_unknown_serverless_types_must_be_invalid(self):
+        template = {"Resources": {"Function": {"Type": "AWS::Serverless::Unknown"}}}
+
+        self.assertFalse(self.validator.is_valid(template))
+
+    def test_fail_fast_must_stop_at_first_invalid_element(self):
+        template = {
+            "Resources": {
+                "Function1": get_function({"Timeout": 3, "Unknown": 1}),
+                "Function2": get_function({"Timeout": 3, "Unknown": 2}),
+            }
+        }
+
+        self.assertEqual(2, len(self.validator.get_errors(template)))
+        self.assertEqual(1, len(self.validator.get_errors(template, fail_fast=True)))
+
+    def test_must_give_same_result_as_schema(self):
+        schema_validator = Draft4Validator(json.loads(SAM_SCHEMA_FILE.read_bytes()))
+
+        for path in sorted(TRANSLATOR_INPUTS.glob("*.yaml")):
+            template = yaml_parse(path.read_text(encoding="utf-8"))
+            with self.subTest(path.name):
+                self.assertEqual(schema_validator.is_valid(template), self.validator.is_valid(template))
+
+
+class TestSamSchemaValidatorWithIntrinsicType(TestCase):
+    def setUp(self):
+        self.validator = SamSchemaValidator(
+            {
+                "properties": {
+                    "Name": {"type": ["string", "intrinsic"]},
+                    "Tags": {"type": "object"},
+                }
+            }
+        )
+
+    def test_intrinsic_functions_must_match_intrinsic_type(self):
+        self.assertTrue(self.validator.is_valid({"Name": {"Ref": "Name"}}))
+        self.assertFalse(self.validator.is_valid({"Name": {"Key": "Value"}}))
+
+    def test_intrinsic_functions_must_not_match_object_type(self):
+        self.assertTrue(self.validator.is_valid({"Tags": {"Key": "Value"}}))
+        self.assertEqual(
+            ["[Tags] {'Ref': 'Tags'} is not of type 'object'"], self.validator.get_errors({"Tags": {"Ref": "Tags"}})
+        )